@@ -1,25 +1,27 @@
 """Прикладной слой транспортной компании."""
-from application.services.transport_company import TransportCompany
-from application.patterns import (
-    Handler,
-    Mechanic,
-    DepartmentHead,
-    Director,
-    MaintenanceRequest,
-    CostCalculator,
-    BusCostCalculator,
-    TruckCostCalculator,
-)
+from utils.lazy import lazy_exports
 
-__all__ = [
-    "TransportCompany",
-    "Handler",
-    "Mechanic",
-    "DepartmentHead",
-    "Director",
-    "MaintenanceRequest",
-    "CostCalculator",
-    "BusCostCalculator",
-    "TruckCostCalculator",
-]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "TransportCompany": "application.services.transport_company",
+    "ColumnarVehicleStore": "application.services.vehicle_store",
+    "MaintenancePipeline": "application.services.maintenance_pipeline",
+    "FakeApprover": "application.services.maintenance_pipeline",
+    "PipelineMetrics": "application.services.maintenance_pipeline",
+    "FleetSimulation": "application.services.simulation",
+    "SimulationReport": "application.services.simulation",
+    "Handler": "application.patterns.chain_of_responsibility",
+    "ThresholdHandler": "application.patterns.chain_of_responsibility",
+    "Mechanic": "application.patterns.chain_of_responsibility",
+    "DepartmentHead": "application.patterns.chain_of_responsibility",
+    "Director": "application.patterns.chain_of_responsibility",
+    "MaintenanceRequest": "application.patterns.chain_of_responsibility",
+    "CompiledChain": "application.patterns.chain_of_responsibility",
+    "CostCalculator": "application.patterns.template_method",
+    "BusCostCalculator": "application.patterns.template_method",
+    "TruckCostCalculator": "application.patterns.template_method",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
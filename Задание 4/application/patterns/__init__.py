@@ -1,15 +1,20 @@
 """Паттерны проектирования для транспортной компании."""
-from application.patterns.chain_of_responsibility import Handler, Mechanic, DepartmentHead, Director, MaintenanceRequest
-from application.patterns.template_method import CostCalculator, BusCostCalculator, TruckCostCalculator
+from utils.lazy import lazy_exports
 
-__all__ = [
-    "Handler",
-    "Mechanic",
-    "DepartmentHead",
-    "Director",
-    "MaintenanceRequest",
-    "CostCalculator",
-    "BusCostCalculator",
-    "TruckCostCalculator",
-]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "Handler": "application.patterns.chain_of_responsibility",
+    "ThresholdHandler": "application.patterns.chain_of_responsibility",
+    "Mechanic": "application.patterns.chain_of_responsibility",
+    "DepartmentHead": "application.patterns.chain_of_responsibility",
+    "Director": "application.patterns.chain_of_responsibility",
+    "MaintenanceRequest": "application.patterns.chain_of_responsibility",
+    "CompiledChain": "application.patterns.chain_of_responsibility",
+    "CostCalculator": "application.patterns.template_method",
+    "BusCostCalculator": "application.patterns.template_method",
+    "TruckCostCalculator": "application.patterns.template_method",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Tuple
 
 from domain.vehicle import Vehicle
 
+NOT_HANDLED = "Запрос не обработан."
+
 
 class MaintenanceRequest:
     """Класс для представления запроса на техническое обслуживание."""
@@ -36,7 +39,15 @@ class Handler(ABC):
         if self._next:
             return self._next.handle(request)
 
-        return "Запрос не обработан."
+        return NOT_HANDLED
+
+    def compile(self) -> "CompiledChain":
+        """Компиляция цепочки, начинающейся с этого обработчика, в таблицу порогов."""
+        return CompiledChain(self)
+
+    def handle_many(self, requests: Iterable[MaintenanceRequest]) -> List[str]:
+        """Пакетная обработка запросов через скомпилированную цепочку."""
+        return self.compile().handle_many(requests)
 
     @abstractmethod
     def _handle(self, request: MaintenanceRequest) -> Optional[str]:
@@ -44,34 +55,145 @@ class Handler(ABC):
         pass
 
 
-class Mechanic(Handler):
-    """Обработчик запросов на обслуживание: механик (до 500 у.е.)."""
+class ThresholdHandler(Handler):
+    """Обработчик, одобряющий запросы со стоимостью в полуинтервале (lower, upper].
+
+    None в качестве границы означает отсутствие ограничения с этой стороны. Такие
+    обработчики CompiledChain сводит в таблицу порогов без вызова _handle.
+    """
+
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+    approver = ""
+
+    def __init__(self, next_handler: Optional[Handler] = None) -> None:
+        """Инициализация обработчика с заготовкой начала сообщения."""
+        super().__init__(next_handler)
+        self._prefix = f"{self.approver} одобрил обслуживание: "
 
     def _handle(self, request: MaintenanceRequest) -> Optional[str]:
-        """Обработка запроса на обслуживание стоимостью до 500 у.е."""
-        if request.cost <= 500:
-            return f"Механик одобрил обслуживание: {request.description} ({request.cost} у.е.)"
+        """Одобрение запроса, если стоимость попадает в полуинтервал обработчика."""
+        cost = request.cost
+        if (self.lower is None or cost > self.lower) and (self.upper is None or cost <= self.upper):
+            return self._approve(request)
 
         return None
 
+    def _approve(self, request: MaintenanceRequest) -> str:
+        """Формирование сообщения об одобрении."""
+        return f"{self._prefix}{request.description} ({request.cost} у.е.)"
+
+
+class Mechanic(ThresholdHandler):
+    """Обработчик запросов на обслуживание: механик (до 500 у.е.)."""
 
-class DepartmentHead(Handler):
+    upper = 500
+    approver = "Механик"
+
+
+class DepartmentHead(ThresholdHandler):
     """Обработчик запросов на обслуживание: руководитель отдела (500-5000 у.е.)."""
 
-    def _handle(self, request: MaintenanceRequest) -> Optional[str]:
-        """Обработка запроса на обслуживание стоимостью от 500 до 5000 у.е."""
-        if 500 < request.cost <= 5000:
-            return f"Руководитель отдела одобрил обслуживание: {request.description} ({request.cost} у.е.)"
-        
-        return None
+    lower = 500
+    upper = 5000
+    approver = "Руководитель отдела"
 
 
-class Director(Handler):
+class Director(ThresholdHandler):
     """Обработчик запросов на обслуживание: директор (любая стоимость)."""
 
-    def _handle(self, request: MaintenanceRequest) -> Optional[str]:
-        """Обработка запроса на обслуживание любой стоимости."""
-        if request.cost > 0:
-            return f"Директор одобрил обслуживание: {request.description} ({request.cost} у.е.)"
-
+    lower = 0
+    approver = "Директор"
+
+
+def _is_threshold(handler: Handler) -> bool:
+    """Проверка, что решение обработчика полностью определяется его порогами."""
+    klass = type(handler)
+    return (isinstance(handler, ThresholdHandler) and klass._handle is ThresholdHandler._handle
+            and klass.handle is Handler.handle)
+
+
+class CompiledChain:
+    """Цепочка обязанностей, сведённая к отсортированной таблице порогов с бинарным поиском.
+
+    Начальный участок цепочки из пороговых обработчиков компилируется; запросы, которые он не
+    одобрил, передаются рекурсивно первому обработчику с собственной логикой (если он есть).
+    После изменения цепочки её нужно скомпилировать заново.
+    """
+
+    def __init__(self, head: Handler) -> None:
+        """Построение таблицы порогов по цепочке."""
+        self._head = head
+        prefix: List[ThresholdHandler] = []
+        node: Optional[Handler] = head
+        while node is not None and _is_threshold(node):
+            prefix.append(node)
+            node = node._next
+        self._tail = node
+
+        # Границы делят ось стоимости на отрезки (b[i-1], b[i]]; у каждого отрезка один победитель —
+        # первый по цепочке обработчик, чей полуинтервал его содержит.
+        bounds = sorted({b for h in prefix for b in (h.lower, h.upper) if b is not None})
+        winners = [self._winner(prefix, bounds, i) for i in range(len(bounds) + 1)]
+
+        # Соседние отрезки с одинаковым победителем объединяются.
+        self._bounds: List[float] = []
+        self._winners: List[Optional[ThresholdHandler]] = [winners[0]]
+        for b, w in zip(bounds, winners[1:]):
+            if w is self._winners[-1]:
+                continue
+            self._bounds.append(b)
+            self._winners.append(w)
+
+    @staticmethod
+    def _winner(prefix: List[ThresholdHandler], bounds: List[float], i: int) -> Optional[ThresholdHandler]:
+        """Первый обработчик, чей полуинтервал содержит i-й отрезок оси стоимости."""
+        lo = bounds[i - 1] if i > 0 else None
+        hi = bounds[i] if i < len(bounds) else None
+        for h in prefix:
+            if h.lower is not None and (lo is None or lo < h.lower):
+                continue
+            if h.upper is not None and (hi is None or hi > h.upper):
+                continue
+            return h
         return None
+
+    @property
+    def table(self) -> List[Tuple[Optional[float], Optional[Handler]]]:
+        """Таблица (верхняя граница отрезка, обработчик); последняя граница None — бесконечность."""
+        return list(zip(self._bounds + [None], self._winners))
+
+    def handle(self, request: MaintenanceRequest) -> str:
+        """Обработка одного запроса."""
+        cost = request.cost
+        if cost != cost:
+            # NaN не сравнивается с порогами, как и в рекурсивной цепочке.
+            return self._head.handle(request)
+
+        winner = self._winners[bisect_left(self._bounds, cost)]
+        if winner is not None:
+            return winner._approve(request)
+        if self._tail is not None:
+            return self._tail.handle(request)
+
+        return NOT_HANDLED
+
+    def handle_many(self, requests: Iterable[MaintenanceRequest]) -> List[str]:
+        """Пакетная обработка запросов; результаты в порядке запросов."""
+        bounds, winners, tail, head = self._bounds, self._winners, self._tail, self._head
+        res: List[str] = []
+        append = res.append
+        for r in requests:
+            cost = r.cost
+            if cost != cost:
+                append(head.handle(r))
+                continue
+
+            winner = winners[bisect_left(bounds, cost)]
+            if winner is not None:
+                append(winner._approve(r))
+            elif tail is not None:
+                append(tail.handle(r))
+            else:
+                append(NOT_HANDLED)
+        return res
@@ -1,11 +1,22 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
 
 from domain.vehicle import Vehicle, Truck
+from utils.vectorized import linear_costs
+
+# Методы, расчёт которых заменяет пакетный путь по rate_per_km.
+_COST_METHODS = ("calculate_cost", "get_base_cost", "get_extra_cost")
 
 
 class CostCalculator(ABC):
     """Шаблон расчёта стоимости эксплуатации."""
 
+    # Ставка за км, если базовая стоимость равна rate_per_km * distance_km, а доп. расходы
+    # не зависят от расстояния. Тогда доступен пакетный расчёт calculate_costs. Ставка
+    # объявляется вместе с get_base_cost и get_extra_cost: подкласс, переопределивший
+    # их или calculate_cost без новой ставки, считается поштучно (см. _linear_rate).
+    rate_per_km: Optional[float] = None
+
     def calculate_cost(self, vehicle: Vehicle, distance_km: float) -> float:
         """Расчет стоимости эксплуатации транспортного средства."""
         base = self.get_base_cost(vehicle, distance_km)
@@ -13,6 +24,29 @@ class CostCalculator(ABC):
         total = base + extra
         return round(total, 2)
 
+    def calculate_costs(self, vehicles: Sequence[Vehicle], distances: Sequence[float]) -> List[List[float]]:
+        """Пакетный расчёт стоимости: строка на каждое ТС, столбец на каждое расстояние."""
+        rate = self._linear_rate()
+        if rate is None:
+            return [[self.calculate_cost(v, d) for d in distances] for v in vehicles]
+
+        terms = [(rate, self.get_extra_cost(v, 0.0)) for v in vehicles]
+        return linear_costs(terms, distances)
+
+    def _linear_rate(self) -> Optional[float]:
+        """Ставка rate_per_km, если расчёт по ней совпадает с calculate_cost, иначе None.
+
+        Ставка действует, только если calculate_cost, get_base_cost и get_extra_cost
+        не переопределены ниже класса, объявившего rate_per_km.
+        """
+        for klass in type(self).__mro__:
+            namespace = vars(klass)
+            if "rate_per_km" in namespace:
+                return self.rate_per_km
+            if any(name in namespace for name in _COST_METHODS):
+                return None
+        return None
+
     @abstractmethod
     def get_base_cost(self, vehicle: Vehicle, distance_km: float) -> float:
         """Получение базовой стоимости эксплуатации."""
@@ -26,9 +60,11 @@ class CostCalculator(ABC):
 class BusCostCalculator(CostCalculator):
     """Калькулятор стоимости эксплуатации автобуса."""
 
+    rate_per_km = 1.0
+
     def get_base_cost(self, vehicle: Vehicle, distance_km: float) -> float:
         """Получение базовой стоимости эксплуатации автобуса."""
-        return 1.0 * distance_km
+        return self.rate_per_km * distance_km
 
     def get_extra_cost(self, vehicle: Vehicle, distance_km: float) -> float:
         """Получение дополнительных расходов на эксплуатацию автобуса."""
@@ -38,9 +74,11 @@ class BusCostCalculator(CostCalculator):
 class TruckCostCalculator(CostCalculator):
     """Калькулятор стоимости эксплуатации грузовика."""
 
+    rate_per_km = 1.6
+
     def get_base_cost(self, vehicle: Vehicle, distance_km: float) -> float:
         """Получение стоимости эксплуатации грузовика."""
-        return 1.6 * distance_km
+        return self.rate_per_km * distance_km
 
     def get_extra_cost(self, vehicle: Vehicle, distance_km: float) -> float:
         """Получение дополнительных расходов на эксплуатацию грузовика."""
@@ -1,5 +1,22 @@
 """Сервисы для транспортной компании."""
-from application.services.transport_company import TransportCompany
+from utils.lazy import lazy_exports
 
-__all__ = ["TransportCompany"]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "TransportCompany": "application.services.transport_company",
+    "ConcurrentTransportCompany": "application.services.concurrent_company",
+    "ColumnarVehicleStore": "application.services.vehicle_store",
+    "MaintenancePipeline": "application.services.maintenance_pipeline",
+    "FakeApprover": "application.services.maintenance_pipeline",
+    "PipelineMetrics": "application.services.maintenance_pipeline",
+    "FleetSimulation": "application.services.simulation",
+    "SimulationReport": "application.services.simulation",
+    "DispatchOptimizer": "application.services.dispatch",
+    "DispatchPlan": "application.services.dispatch",
+    "LocationIngestor": "application.services.location_ingest",
+    "IngestStats": "application.services.location_ingest",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
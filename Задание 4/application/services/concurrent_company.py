@@ -0,0 +1,172 @@
+from concurrent.futures import Executor
+from typing import Any, ContextManager, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+from application.services.locks import RWLock, StripedLock
+from application.services.transport_company import TransportCompany
+from domain.driver import Driver
+from domain.vehicle import Vehicle
+
+
+class ConcurrentTransportCompany(TransportCompany):
+    """Транспортная компания для работы из нескольких потоков.
+
+    Коллекции ТС и водителей, индексы и агрегаты защищены блокировкой читателей и писателя:
+    поиск, статистика и выборки выполняются одновременно и возвращают согласованный снимок
+    (списки строятся под блокировкой чтения). Добавление, удаление, назначения, сохранение
+    и изменение полей ТС берут запись на короткий участок. Изменения одного ТС или водителя
+    (update_vehicle, assign_driver_to_vehicle) упорядочиваются полосной блокировкой по id.
+
+    update_vehicle записывает поля и обновляет индексы под одной блокировкой записи, поэтому
+    читатели не видят ТС, поля которого расходятся с индексами и агрегатами. Прямое присваивание
+    полям ТС из других потоков такой гарантии не даёт: сеттер пишет поле до захвата записи.
+    """
+
+    def __init__(self, name: str, vehicle_store: Optional[MutableMapping[str, Vehicle]] = None,
+                 stripes: int = 64) -> None:
+        """Инициализация компании; stripes — число полосных блокировок по id."""
+        self._lock = RWLock()
+        self._stripes = StripedLock(stripes)
+        super().__init__(name, vehicle_store)
+
+    def _read(self) -> ContextManager[None]:
+        """Блокировка чтения; отложенные индексы строятся заранее под записью."""
+        if not self._indexed:
+            with self._lock.write():
+                self._ensure_indexes()
+        return self._lock.read()
+
+    def add_vehicle(self, user, vehicle: Vehicle) -> None:
+        """Добавление ТС под блокировкой записи."""
+        with self._lock.write():
+            super().add_vehicle(user, vehicle)
+
+    def add_vehicles(self, user, vehicles: Iterable[Vehicle]) -> None:
+        """Пакетное добавление ТС: пакет собирается до захвата записи и вставляется целиком."""
+        batch = list(vehicles)
+        with self._lock.write():
+            super().add_vehicles(user, batch)
+
+    def remove_vehicle(self, user, vehicle_id: str) -> None:
+        """Удаление ТС под полосой его id и блокировкой записи."""
+        with self._stripes.lock_for(vehicle_id), self._lock.write():
+            super().remove_vehicle(user, vehicle_id)
+
+    def update_vehicle(self, user, vehicle_id: str, **fields: Any) -> Vehicle:
+        """Изменение полей ТС и индексов под полосой его id и одной блокировкой записи."""
+        with self._stripes.lock_for(vehicle_id), self._lock.write():
+            return super().update_vehicle(user, vehicle_id, **fields)
+
+    def get_all_vehicles(self) -> List[Vehicle]:
+        """Снимок списка всех ТС."""
+        with self._lock.read():
+            return super().get_all_vehicles()
+
+    def search_by_model(self, model_substr: str) -> List[Vehicle]:
+        """Поиск по подстроке модели под блокировкой чтения."""
+        with self._read():
+            return super().search_by_model(model_substr)
+
+    def find_vehicles(self, vehicle_type: Optional[str] = None, status: Optional[str] = None,
+                      year_range: Optional[Tuple[int, int]] = None) -> List[Vehicle]:
+        """Поиск по типу, статусу и годам под блокировкой чтения."""
+        with self._read():
+            return super().find_vehicles(vehicle_type, status, year_range)
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Vehicle]:
+        """Поиск ближайших ТС под блокировкой чтения."""
+        with self._read():
+            return super().nearest(lat, lon, k)
+
+    def within_radius(self, lat: float, lon: float, radius_km: float) -> List[Vehicle]:
+        """Поиск ТС в радиусе под блокировкой чтения."""
+        with self._read():
+            return super().within_radius(lat, lon, radius_km)
+
+    def update_locations(self, updates: Iterable[Tuple[str, str]]) -> int:
+        """Пакетная запись местоположений: весь пакет — одна блокировка записи."""
+        batch = list(updates)
+        with self._lock.write():
+            return super().update_locations(batch)
+
+    def add_driver(self, user, driver: Driver) -> None:
+        """Добавление водителя под блокировкой записи."""
+        with self._lock.write():
+            super().add_driver(user, driver)
+
+    def add_drivers(self, user, drivers: Iterable[Driver]) -> None:
+        """Пакетное добавление водителей под блокировкой записи."""
+        batch = list(drivers)
+        with self._lock.write():
+            super().add_drivers(user, batch)
+
+    def remove_driver(self, user, driver_id: str) -> None:
+        """Удаление водителя под полосой его id и блокировкой записи."""
+        with self._stripes.lock_for(driver_id), self._lock.write():
+            super().remove_driver(user, driver_id)
+
+    def get_all_drivers(self) -> List[Driver]:
+        """Снимок списка всех водителей."""
+        with self._lock.read():
+            return super().get_all_drivers()
+
+    def get_driver(self, driver_id: str) -> Driver:
+        """Возврат водителя под блокировкой чтения."""
+        with self._lock.read():
+            return super().get_driver(driver_id)
+
+    def driver_for_vehicle(self, vehicle_id: str) -> Optional[Driver]:
+        """Водитель ТС под блокировкой чтения."""
+        with self._read():
+            return super().driver_for_vehicle(vehicle_id)
+
+    def assign_driver_to_vehicle(self, user, driver_id: str, vehicle_id: str) -> None:
+        """Назначение под полосами водителя и ТС; индекс назначений меняется под записью."""
+        with self._stripes.hold(driver_id, vehicle_id), self._lock.write():
+            super().assign_driver_to_vehicle(user, driver_id, vehicle_id)
+
+    def assign_drivers(self, user, assignments: Mapping[str, Optional[str]]) -> None:
+        """Пакетное назначение под одной блокировкой записи."""
+        with self._lock.write():
+            super().assign_drivers(user, assignments)
+
+    def save(self, path: Optional[str] = None, vehicle_refs: bool = True, fmt: Optional[str] = None,
+             compress: bool = False, delta: bool = False) -> None:
+        """Сохранение согласованного состояния: изменения ждут окончания записи файла."""
+        with self._lock.write():
+            super().save(path, vehicle_refs, fmt, compress, delta)
+
+    def attach_backend(self, path: str) -> None:
+        """Подключение базы SQLite под блокировкой записи."""
+        with self._lock.write():
+            super().attach_backend(path)
+
+    def validate(self, executor: Optional[Executor] = None, chunk_size: int = 10_000) -> None:
+        """Полная проверка данных по снимку, снятому под блокировкой чтения."""
+        with self._lock.read():
+            super().validate(executor, chunk_size)
+
+    def _on_vehicle_changed(self, vehicle: Vehicle, field: str, old: Any, new: Any) -> None:
+        """Обновление индексов под блокировкой записи; изменения ТС, уже удалённого из парка, пропускаются."""
+        with self._lock.write():
+            if (old if field == "vehicle_id" else vehicle.vehicle_id) in self._vehicles:
+                super()._on_vehicle_changed(vehicle, field, old, new)
+
+    def _on_driver_changed(self, driver: Driver) -> None:
+        """Учёт изменения водителя под блокировкой записи."""
+        with self._lock.write():
+            super()._on_driver_changed(driver)
+
+    def stats_capacity_by_type(self, verify: bool = False) -> Dict[str, int]:
+        """Вместимость по типам под блокировкой чтения."""
+        with self._read():
+            return super().stats_capacity_by_type(verify)
+
+    def stats_by_type(self, verify: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Агрегаты по типам под блокировкой чтения."""
+        with self._read():
+            return super().stats_by_type(verify)
+
+    def calculate_costs(self, distances: Sequence[float]) -> Dict[str, List[float]]:
+        """Расчёт стоимостей по согласованному снимку парка под блокировкой чтения."""
+        with self._lock.read():
+            return super().calculate_costs(distances)
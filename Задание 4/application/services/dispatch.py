@@ -0,0 +1,256 @@
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from core.exceptions import InvalidVehicleError
+from domain.driver import Driver
+from domain.vehicle import Vehicle
+
+# Статусы ТС, которые не выходят на смену.
+UNAVAILABLE_STATUSES = ("maintenance", "retired")
+
+
+def _max_flow(capacity: List[Dict[int, int]], source: int, sink: int) -> List[Dict[int, int]]:
+    """Максимальный поток (Эдмондс — Карп) в малом графе capacity[u][v]; возвращает поток по рёбрам."""
+    n = len(capacity)
+    residual = [dict(edges) for edges in capacity]
+    for u in range(n):
+        for v in capacity[u]:
+            residual[v].setdefault(u, 0)
+
+    while True:
+        parent = {source: source}
+        queue = deque([source])
+        while queue and sink not in parent:
+            u = queue.popleft()
+            for v, cap in residual[u].items():
+                if cap > 0 and v not in parent:
+                    parent[v] = u
+                    queue.append(v)
+        if sink not in parent:
+            break
+
+        path = []
+        v = sink
+        while v != source:
+            path.append((parent[v], v))
+            v = parent[v]
+        amount = min(residual[u][v] for u, v in path)
+        for u, v in path:
+            residual[u][v] -= amount
+            residual[v][u] += amount
+
+    return [{v: cap - residual[u][v] for v, cap in capacity[u].items()} for u in range(n)]
+
+
+class DispatchPlan:
+    """План смены: назначения водителей, изменения относительно текущих и стоимость."""
+
+    def __init__(self, assignments: Dict[str, Optional[str]], current: Mapping[str, Optional[str]],
+                 costs: Mapping[str, float], unassigned_vehicles: List[str], elapsed: float) -> None:
+        """Формирование плана по назначениям driver_id -> vehicle_id (None — без ТС)."""
+        self.assignments = assignments
+        self.changes = {d: v for d, v in assignments.items() if current.get(d) != v}
+        self.total_cost = round(sum(costs[v] for v in assignments.values() if v is not None), 2)
+        self.unassigned_drivers = [d for d, v in assignments.items() if v is None]
+        self.unassigned_vehicles = unassigned_vehicles
+        self.elapsed = elapsed
+
+    @property
+    def assigned(self) -> int:
+        """Число водителей, получивших ТС."""
+        return len(self.assignments) - len(self.unassigned_drivers)
+
+    def summary(self) -> Dict[str, Any]:
+        """Сводка плана."""
+        return {
+            "assigned": self.assigned,
+            "changes": len(self.changes),
+            "total_cost": self.total_cost,
+            "unassigned_drivers": len(self.unassigned_drivers),
+            "unassigned_vehicles": len(self.unassigned_vehicles),
+            "elapsed": self.elapsed,
+        }
+
+
+class DispatchOptimizer:
+    """Подбор водителей на ТС всего парка: максимум назначений при минимальной стоимости смены.
+
+    Водитель может получить ТС, только если его права включают категорию ТС (Driver.can_drive),
+    каждое ТС получает не больше одного водителя. Стоимость назначения — стоимость эксплуатации
+    ТС на смене (calculate_cost для distance_km), поэтому задача сводится к потоку минимальной
+    стоимости в сжатой сети «группы водителей с одинаковым набором категорий → категории ТС → ТС».
+    Все стоимости лежат на рёбрах ТС, и последовательные кратчайшие пути добавляют ТС по
+    возрастанию стоимости, пока выполняется условие Холла для категорий (жадный алгоритм
+    на трансверсальном матроиде), — O(V log V) вместо O(n³) венгерского алгоритма на полной матрице.
+    """
+
+    def __init__(self, company: Any) -> None:
+        """Инициализация по компании (TransportCompany или ConcurrentTransportCompany)."""
+        self.company = company
+
+    def plan(self, distance_km: float, drivers: Optional[Iterable[str]] = None,
+             vehicles: Optional[Iterable[str]] = None,
+             costs: Optional[Mapping[str, float]] = None) -> DispatchPlan:
+        """Оптимальный план для водителей drivers и ТС vehicles (по умолчанию — все водители и доступные ТС).
+
+        Доступные ТС — не в статусах UNAVAILABLE_STATUSES и не закреплённые за водителями вне плана.
+        costs — готовые стоимости по id ТС вместо расчёта calculate_costs([distance_km]).
+        Текущие назначения сохраняются, если их ТС входит в оптимальный набор.
+        """
+        start = time.perf_counter()
+        company = self.company
+        if drivers is None:
+            planned = company.get_all_drivers()
+        else:
+            planned = [company.get_driver(driver_id) for driver_id in drivers]
+        current = {d.driver_id: self._vehicle_id(d) for d in planned}
+
+        if vehicles is None:
+            held = set()
+            if drivers is not None:
+                held = {vehicle_id for d in company.get_all_drivers() if d.driver_id not in current
+                        for vehicle_id in (self._vehicle_id(d),) if vehicle_id is not None}
+            pool = [v for v in company.get_all_vehicles()
+                    if v.status not in UNAVAILABLE_STATUSES and v.vehicle_id not in held]
+        else:
+            pool = []
+            for vehicle_id in vehicles:
+                v = company._vehicles.get(vehicle_id)
+                if v is None:
+                    raise InvalidVehicleError(f"ТС не найдено: {vehicle_id}")
+                pool.append(v)
+        pool = [v for v in pool if v.LICENSE_CATEGORY is not None]
+        if costs is None:
+            costs = {vehicle_id: row[0] for vehicle_id, row in company.calculate_costs([distance_km]).items()}
+
+        categories = sorted({v.LICENSE_CATEGORY for v in pool})
+        bit = {category: 1 << j for j, category in enumerate(categories)}
+        chosen = self._choose(planned, pool, costs, bit)
+        assignments = self._match(planned, chosen, current, bit)
+
+        picked = set(assignments.values())
+        unassigned = [v.vehicle_id for v in pool if v.vehicle_id not in picked]
+        return DispatchPlan(assignments, current, costs, unassigned, time.perf_counter() - start)
+
+    def apply(self, user, plan: DispatchPlan) -> None:
+        """Применение изменений плана одним пакетом (TransportCompany.assign_drivers)."""
+        self.company.assign_drivers(user, plan.changes)
+
+    @staticmethod
+    def _vehicle_id(driver: Driver) -> Optional[str]:
+        """Id закреплённого за водителем ТС или None."""
+        v = driver.get_assigned_vehicle()
+        return v.vehicle_id if v is not None else None
+
+    @staticmethod
+    def _mask(driver: Driver, bit: Mapping[str, int]) -> int:
+        """Битовая маска категорий ТС, которые водитель может вести."""
+        mask = 0
+        for category in driver.license_categories:
+            mask |= bit.get(category, 0)
+        return mask
+
+    def _choose(self, drivers: List[Driver], pool: List[Vehicle], costs: Mapping[str, float],
+                bit: Mapping[str, int]) -> List[Vehicle]:
+        """Самый дешёвый набор ТС наибольшего размера, который можно полностью обеспечить водителями.
+
+        ТС перебираются по возрастанию стоимости; ТС берётся, если для каждого набора категорий T
+        с его категорией число взятых ТС в T не превышает числа водителей, допущенных хотя бы к одной
+        категории из T (условие Холла).
+        """
+        full = (1 << len(bit)) - 1
+        groups: Dict[int, int] = {}
+        for d in drivers:
+            mask = self._mask(d, bit)
+            if mask:
+                groups[mask] = groups.get(mask, 0) + 1
+
+        supply = [0] * (full + 1)
+        for subset in range(1, full + 1):
+            supply[subset] = sum(n for mask, n in groups.items() if mask & subset)
+        containing = {b: [subset for subset in range(1, full + 1) if subset & b] for b in bit.values()}
+
+        load = [0] * (full + 1)
+        chosen: List[Vehicle] = []
+        for v in sorted(pool, key=lambda v: costs[v.vehicle_id]):
+            if len(chosen) == supply[full]:
+                break
+            subsets = containing[bit[v.LICENSE_CATEGORY]]
+            if all(load[subset] < supply[subset] for subset in subsets):
+                for subset in subsets:
+                    load[subset] += 1
+                chosen.append(v)
+        return chosen
+
+    def _match(self, drivers: List[Driver], chosen: List[Vehicle], current: Mapping[str, Optional[str]],
+               bit: Mapping[str, int]) -> Dict[str, Optional[str]]:
+        """Распределение водителей по выбранным ТС с сохранением текущих назначений, где это возможно.
+
+        Водитель остаётся на своём ТС, если после этого остальные выбранные ТС по-прежнему можно
+        обеспечить водителями (условие Холла для оставшихся); остальные распределяются потоком
+        между группами водителей и категориями, затем по конкретным id.
+        """
+        full = (1 << len(bit)) - 1
+        groups: Dict[int, List[Driver]] = {}
+        for d in drivers:
+            mask = self._mask(d, bit)
+            if mask:
+                groups.setdefault(mask, []).append(d)
+        # Выбранные ТС по категориям в порядке возрастания стоимости.
+        by_category: Dict[int, List[str]] = {b: [] for b in bit.values()}
+        category_of: Dict[str, int] = {}
+        for v in chosen:
+            b = bit[v.LICENSE_CATEGORY]
+            by_category[b].append(v.vehicle_id)
+            category_of[v.vehicle_id] = b
+
+        supply = [sum(len(members) for mask, members in groups.items() if mask & subset) for subset in range(full + 1)]
+        demand = [sum(len(ids) for b, ids in by_category.items() if b & subset) for subset in range(full + 1)]
+        assignments: Dict[str, Optional[str]] = {d.driver_id: None for d in drivers}
+        taken: Set[str] = set()
+        for mask, members in groups.items():
+            rest = []
+            for d in members:
+                vehicle_id = current[d.driver_id]
+                b = category_of.get(vehicle_id) if vehicle_id is not None else None
+                # Назначенное вручную ТС может быть не по правам водителя. Наборы категорий без b,
+                # но доступные водителю, теряют его: им нужен запас.
+                if (b is None or not mask & b or vehicle_id in taken
+                        or any(demand[t] >= supply[t] for t in range(1, full + 1) if mask & t and not b & t)):
+                    rest.append(d)
+                    continue
+                taken.add(vehicle_id)
+                assignments[d.driver_id] = vehicle_id
+                for t in range(1, full + 1):
+                    if mask & t:
+                        supply[t] -= 1
+                    if b & t:
+                        demand[t] -= 1
+            groups[mask] = rest
+
+        # Узлы: 0 — исток, затем группы, затем категории, последний — сток.
+        masks, bits = list(groups), list(by_category)
+        sink = 1 + len(masks) + len(bits)
+        capacity: List[Dict[int, int]] = [{} for _ in range(sink + 1)]
+        for g, mask in enumerate(masks, 1):
+            capacity[0][g] = len(groups[mask])
+            for c, b in enumerate(bits, 1 + len(masks)):
+                if mask & b:
+                    capacity[g][c] = len(chosen)
+        for c, b in enumerate(bits, 1 + len(masks)):
+            capacity[c][sink] = demand[b]
+        flow = _max_flow(capacity, 0, sink)
+
+        cursor = dict.fromkeys(bits, 0)
+        for g, mask in enumerate(masks, 1):
+            members = iter(groups[mask])
+            for c, b in enumerate(bits, 1 + len(masks)):
+                vehicle_ids = by_category[b]
+                for _ in range(flow[g].get(c, 0)):
+                    i = cursor[b]
+                    while vehicle_ids[i] in taken:
+                        i += 1
+                    cursor[b] = i + 1
+                    assignments[next(members).driver_id] = vehicle_ids[i]
+        return assignments
@@ -0,0 +1,128 @@
+import math
+from typing import Any, Dict, Iterable, Optional
+
+from core.exceptions import StatsMismatchError
+from domain.vehicle import Vehicle
+
+
+class _TypeStats:
+    """Накопленные показатели по одному типу ТС."""
+
+    def __init__(self) -> None:
+        """Инициализация нулевых показателей."""
+        self.count = 0
+        self.capacity = 0
+        self.cargo_capacity = 0.0
+        # Мультимножество годов: позволяет поддерживать min/max при удалениях.
+        self.years: Dict[int, int] = {}
+        self._min_year: Optional[int] = None
+        self._max_year: Optional[int] = None
+
+    def add_year(self, year: int) -> None:
+        """Учёт года выпуска."""
+        self.years[year] = self.years.get(year, 0) + 1
+        if self._min_year is not None and year < self._min_year:
+            self._min_year = year
+        if self._max_year is not None and year > self._max_year:
+            self._max_year = year
+
+    def remove_year(self, year: int) -> None:
+        """Исключение года выпуска; границы пересчитываются лениво при чтении."""
+        left = self.years[year] - 1
+        if left:
+            self.years[year] = left
+            return
+
+        del self.years[year]
+        if year == self._min_year:
+            self._min_year = None
+        if year == self._max_year:
+            self._max_year = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Возврат показателей в виде словаря."""
+        if self._min_year is None and self.years:
+            self._min_year = min(self.years)
+        if self._max_year is None and self.years:
+            self._max_year = max(self.years)
+
+        return {
+            "count": self.count,
+            "total_capacity": self.capacity,
+            "total_cargo_capacity": self.cargo_capacity,
+            "min_year": self._min_year,
+            "max_year": self._max_year,
+        }
+
+
+class FleetStats:
+    """Живые агрегаты по типам ТС, обновляемые при добавлении, удалении и изменении полей."""
+
+    def __init__(self) -> None:
+        """Инициализация пустых агрегатов."""
+        self._types: Dict[str, _TypeStats] = {}
+
+    def add(self, vehicle: Vehicle) -> None:
+        """Учёт ТС в агрегатах."""
+        t = vehicle.__class__.__name__
+        st = self._types.get(t)
+        if st is None:
+            st = self._types[t] = _TypeStats()
+
+        st.count += 1
+        st.capacity += vehicle.capacity
+        st.cargo_capacity += getattr(vehicle, "cargo_capacity", 0.0)
+        st.add_year(vehicle.year)
+
+    def remove(self, vehicle: Vehicle) -> None:
+        """Исключение ТС из агрегатов (вызывается до удаления ТС из хранилища)."""
+        t = vehicle.__class__.__name__
+        st = self._types[t]
+        st.count -= 1
+        if not st.count:
+            del self._types[t]
+            return
+
+        st.capacity -= vehicle.capacity
+        st.cargo_capacity -= getattr(vehicle, "cargo_capacity", 0.0)
+        st.remove_year(vehicle.year)
+
+    def change(self, vehicle: Vehicle, field: str, old: Any, new: Any) -> None:
+        """Учёт изменения поля ТС."""
+        st = self._types.get(vehicle.__class__.__name__)
+        if st is None:
+            return
+
+        if field == "capacity":
+            st.capacity += new - old
+        elif field == "cargo_capacity":
+            st.cargo_capacity += new - old
+        elif field == "year":
+            st.remove_year(old)
+            st.add_year(new)
+
+    def capacity_by_type(self) -> Dict[str, int]:
+        """Возврат суммарной вместимости по типам."""
+        return {t: st.capacity for t, st in self._types.items()}
+
+    def by_type(self) -> Dict[str, Dict[str, Any]]:
+        """Возврат всех показателей по типам."""
+        return {t: st.as_dict() for t, st in self._types.items()}
+
+    def verify(self, vehicles: Iterable[Vehicle]) -> None:
+        """Сверка агрегатов с полным пересчётом; при расхождении — StatsMismatchError."""
+        fresh = FleetStats()
+        for v in vehicles:
+            fresh.add(v)
+
+        expected, actual = fresh.by_type(), self.by_type()
+        if expected.keys() != actual.keys():
+            raise StatsMismatchError(f"Расхождение типов ТС: {sorted(actual)} вместо {sorted(expected)}")
+
+        for t, exp in expected.items():
+            act = actual[t]
+            for key, value in exp.items():
+                same = (math.isclose(act[key], value, abs_tol=1e-9) if isinstance(value, float)
+                        else act[key] == value)
+                if not same:
+                    raise StatsMismatchError(f"Расхождение {key} для {t}: {act[key]} вместо {value}")
@@ -0,0 +1,76 @@
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, Mapping, Set
+
+
+class LazySnapshotMap(MutableMapping):
+    """Отображение id -> объект поверх индекса снимка с материализацией при первом обращении.
+
+    Ключи снимка берутся из его индекса смещений; объект создаётся загрузчиком при первом
+    чтении и кешируется. Добавленные и заменённые объекты хранятся в памяти, удалённые
+    ключи снимка помечаются, поэтому сам снимок не изменяется.
+    """
+
+    def __init__(self, keys: Mapping[str, Any], loader: Callable[[str], Any]) -> None:
+        """Инициализация по ключам снимка и функции создания объекта по ключу."""
+        self._base = keys
+        self._loader = loader
+        self._cache: Dict[str, Any] = {}
+        self._deleted: Set[str] = set()
+        # Ключи вне снимка (новые или повторно добавленные после удаления) — в порядке добавления.
+        self._added: Dict[str, Any] = {}
+
+    def _in_base(self, key: str) -> bool:
+        """Проверка, что ключ берётся из снимка и не удалён."""
+        return key in self._base and key not in self._deleted
+
+    @property
+    def materialized(self) -> int:
+        """Количество объектов, созданных из снимка."""
+        return len(self._cache)
+
+    def __getitem__(self, key: str) -> Any:
+        """Возврат объекта с материализацией из снимка при первом обращении."""
+        obj = self._added.get(key)
+        if obj is not None:
+            return obj
+
+        obj = self._cache.get(key)
+        if obj is None:
+            if not self._in_base(key):
+                raise KeyError(key)
+            # setdefault: при одновременном первом чтении из нескольких потоков все получают один объект.
+            obj = self._cache.setdefault(key, self._loader(key))
+        return obj
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Запись объекта; ключ снимка сохраняет свою позицию при обходе."""
+        if self._in_base(key):
+            self._cache[key] = value
+        else:
+            self._added[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Удаление объекта без изменения снимка."""
+        if key in self._added:
+            del self._added[key]
+        elif self._in_base(key):
+            self._deleted.add(key)
+            self._cache.pop(key, None)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Проверка наличия ключа без материализации объекта."""
+        return key in self._added or (isinstance(key, str) and self._in_base(key))
+
+    def __iter__(self) -> Iterator[str]:
+        """Обход ключей: сначала ключи снимка в порядке файла, затем добавленные."""
+        deleted = self._deleted
+        for key in self._base:
+            if key not in deleted:
+                yield key
+        yield from self._added
+
+    def __len__(self) -> int:
+        """Количество объектов."""
+        return len(self._base) - len(self._deleted) + len(self._added)
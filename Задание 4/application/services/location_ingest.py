@@ -0,0 +1,117 @@
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Отметка GPS: (id ТС, строка координат, время отметки в секундах).
+Ping = Tuple[str, str, float]
+
+
+class IngestStats:
+    """Счётчики приёма отметок местоположения."""
+
+    def __init__(self) -> None:
+        """Инициализация нулевых счётчиков."""
+        self.received = 0
+        self.coalesced = 0
+        self.late = 0
+        self.applied = 0
+        self.unknown = 0
+        self.flushes = 0
+        self.busy = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Принятые отметки в секунду собственного времени обработки."""
+        return self.received / self.busy if self.busy else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Сводка счётчиков и пропускной способности."""
+        return {
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "late": self.late,
+            "applied": self.applied,
+            "unknown": self.unknown,
+            "flushes": self.flushes,
+            "throughput": self.throughput,
+        }
+
+
+class LocationIngestor:
+    """Приём потока отметок GPS с объединением по окнам времени и пакетной записью в компанию.
+
+    Отметки группируются в окна [k·window, (k+1)·window) по своему времени (timestamp); в окне
+    для каждого ТС остаётся только самая поздняя отметка (остальные учитываются как coalesced).
+    Окно записывается одним вызовом TransportCompany.update_locations, когда приходит отметка
+    следующего окна или при явном flush. Отметки старее начала текущего окна отбрасываются (late).
+    """
+
+    def __init__(self, company: Any, window: float = 1.0) -> None:
+        """Инициализация приёма для компании с окном window секунд."""
+        if window <= 0:
+            raise ValueError("Длина окна должна быть положительной.")
+
+        self._company = company
+        self._window = window
+        self._start: Optional[float] = None
+        self._pending: Dict[str, Tuple[float, str]] = {}
+        self.stats = IngestStats()
+
+    @property
+    def pending(self) -> int:
+        """Число ТС с ещё не записанным местоположением."""
+        return len(self._pending)
+
+    def submit(self, pings: Iterable[Ping]) -> int:
+        """Приём пакета отметок; возвращает число ТС, обновлённых закрытыми при этом окнами."""
+        started = time.perf_counter()
+        stats = self.stats
+        pending = self._pending
+        window = self._window
+        start = self._start
+        applied = received = coalesced = late = 0
+
+        for vehicle_id, location, ts in pings:
+            received += 1
+            if start is None:
+                start = ts // window * window
+            elif ts >= start + window:
+                applied += self._apply()
+                pending = self._pending
+                start = ts // window * window
+            elif ts < start:
+                late += 1
+                continue
+
+            prev = pending.get(vehicle_id)
+            if prev is not None:
+                coalesced += 1
+                if ts < prev[0]:
+                    continue
+            pending[vehicle_id] = (ts, location)
+
+        self._start = start
+        stats.received += received
+        stats.coalesced += coalesced
+        stats.late += late
+        stats.busy += time.perf_counter() - started
+        return applied
+
+    def flush(self) -> int:
+        """Запись накопленных местоположений; возвращает число обновлённых ТС."""
+        started = time.perf_counter()
+        applied = self._apply()
+        self.stats.busy += time.perf_counter() - started
+        return applied
+
+    def _apply(self) -> int:
+        """Запись текущего окна в компанию одним пакетом."""
+        if not self._pending:
+            return 0
+
+        batch = self._pending
+        self._pending = {}
+        applied = self._company.update_locations((vid, loc) for vid, (_, loc) in batch.items())
+        self.stats.applied += applied
+        self.stats.unknown += len(batch) - applied
+        self.stats.flushes += 1
+        return applied
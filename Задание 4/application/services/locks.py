@@ -0,0 +1,130 @@
+import threading
+from contextlib import contextmanager
+from typing import Callable, Hashable, Iterator, Optional
+
+
+class _Guard:
+    """Контекстный менеджер над парой функций захвата и освобождения (без состояния, общий для потоков)."""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]) -> None:
+        """Инициализация по функциям захвата и освобождения."""
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self) -> None:
+        """Захват блокировки."""
+        self._acquire()
+
+    def __exit__(self, *exc: object) -> None:
+        """Освобождение блокировки."""
+        self._release()
+
+
+class RWLock:
+    """Блокировка читателей и писателя: чтения выполняются одновременно, запись — монопольно.
+
+    Ожидающий писатель получает приоритет перед новыми читателями, поэтому поток чтений
+    не откладывает запись бесконечно. Поток, удерживающий запись, может повторно захватить
+    запись или чтение (например, наблюдатель ТС внутри метода компании); повышение чтения
+    до записи не поддерживается.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация свободной блокировки."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        # Поток-писатель, глубина повторных захватов в нём и число ожидающих писателей.
+        self._writer: Optional[int] = None
+        self._depth = 0
+        self._waiting = 0
+        self._read_guard = _Guard(self.acquire_read, self.release_read)
+        self._write_guard = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        """Захват на чтение: ожидание, пока нет писателя и ожидающих писателей."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._depth += 1
+                return
+            while self._writer is not None or self._waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Освобождение чтения."""
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Захват на запись: ожидание ухода читателей и другого писателя."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._depth += 1
+                return
+            self._waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            self._writer = me
+            self._depth = 1
+
+    def release_write(self) -> None:
+        """Освобождение записи (после последнего повторного захвата)."""
+        with self._cond:
+            self._depth -= 1
+            if not self._depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    def read(self) -> _Guard:
+        """Контекстный менеджер чтения."""
+        return self._read_guard
+
+    def write(self) -> _Guard:
+        """Контекстный менеджер записи."""
+        return self._write_guard
+
+
+class StripedLock:
+    """Набор блокировок, распределяющий ключи (id ТС и водителей) по полосам по хешу.
+
+    Операции с разными ключами почти всегда берут разные блокировки и не ждут друг друга,
+    а память не растёт с числом ключей.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        """Инициализация stripes блокировок."""
+        if stripes < 1:
+            raise ValueError("Число полос должно быть положительным.")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, key: Hashable) -> int:
+        """Номер полосы ключа."""
+        return hash(key) % len(self._locks)
+
+    def lock_for(self, key: Hashable) -> threading.Lock:
+        """Блокировка полосы ключа."""
+        return self._locks[self._stripe(key)]
+
+    @contextmanager
+    def hold(self, *keys: Hashable) -> Iterator[None]:
+        """Захват полос нескольких ключей в порядке номеров (без взаимной блокировки потоков)."""
+        locks = [self._locks[i] for i in sorted({self._stripe(key) for key in keys})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
@@ -0,0 +1,258 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from application.patterns.chain_of_responsibility import NOT_HANDLED, Handler, MaintenanceRequest
+
+# Уровень для запросов, которые не одобрил ни один обработчик: ответ выдаётся без согласования.
+UNHANDLED_LEVEL = "unhandled"
+
+
+class FakeApprover:
+    """Локальная имитация внешней службы согласования (склад запчастей, проверка бюджета).
+
+    delays задаёт задержку ответа по имени класса обработчика, fail_above — стоимость,
+    выше которой согласование завершается ошибкой RuntimeError.
+    """
+
+    def __init__(self, delays: Optional[Dict[str, float]] = None, default_delay: float = 0.0,
+                 fail_above: Optional[float] = None) -> None:
+        """Инициализация имитации с задержками по уровням."""
+        self.delays = dict(delays or {})
+        self.default_delay = default_delay
+        self.fail_above = fail_above
+        self.calls: List[Tuple[str, str]] = []
+        self.in_flight: Dict[str, int] = {}
+        self.max_in_flight: Dict[str, int] = {}
+
+    async def approve(self, handler: Handler, request: MaintenanceRequest) -> None:
+        """Согласование запроса уровнем handler."""
+        level = type(handler).__name__
+        self.in_flight[level] = self.in_flight.get(level, 0) + 1
+        self.max_in_flight[level] = max(self.max_in_flight.get(level, 0), self.in_flight[level])
+        try:
+            await asyncio.sleep(self.delays.get(level, self.default_delay))
+            if self.fail_above is not None and request.cost > self.fail_above:
+                raise RuntimeError(f"Согласование отклонено: {request.description}")
+            self.calls.append((level, request.description))
+        finally:
+            self.in_flight[level] -= 1
+
+
+class PipelineMetrics:
+    """Счётчики и задержки обработки запросов конвейером (по уровням обработчиков)."""
+
+    def __init__(self) -> None:
+        """Инициализация пустых метрик."""
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.latencies: Dict[str, List[float]] = {}
+        self.waits: Dict[str, List[float]] = {}
+
+    def record(self, level: str, wait: float, latency: float) -> None:
+        """Учёт завершённого запроса: ожидание в очередях и полная задержка, с."""
+        self.waits.setdefault(level, []).append(wait)
+        self.latencies.setdefault(level, []).append(latency)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Сводка задержек по уровням: количество, среднее, p50, p95, максимум (с)."""
+        res: Dict[str, Dict[str, float]] = {}
+        for level, values in self.latencies.items():
+            ordered = sorted(values)
+            n = len(ordered)
+            res[level] = {
+                "count": n,
+                "mean": sum(ordered) / n,
+                "p50": ordered[(n - 1) // 2],
+                "p95": ordered[min(n - 1, int(n * 0.95))],
+                "max": ordered[-1],
+                "mean_wait": sum(self.waits[level]) / n,
+            }
+        return res
+
+
+def _route(head: Handler, request: MaintenanceRequest) -> Tuple[Optional[Handler], str]:
+    """Поиск обработчика, принимающего решение, и текста решения (порядок как в Handler.handle).
+
+    Обработчик с переопределённым handle сам решает за себя и остаток цепочки: вызывается его
+    handle, а заявка согласуется на его уровне.
+    """
+    node: Optional[Handler] = head
+    while node is not None:
+        if type(node).handle is not Handler.handle:
+            res = node.handle(request)
+            return (node, res) if res and res != NOT_HANDLED else (None, NOT_HANDLED)
+        res = node._handle(request)
+        if res:
+            return node, res
+        node = node._next
+    return None, NOT_HANDLED
+
+
+class MaintenancePipeline:
+    """Асинхронный конвейер согласования заявок на обслуживание поверх цепочки обязанностей.
+
+    submit определяет уровень обработчика и ставит заявку в ограниченную очередь этого уровня,
+    где её согласует пул из concurrency[уровень] исполнителей. Общего диспетчера нет: при
+    заполнении очереди уровня submit ожидает места только для заявок этого уровня, поэтому
+    медленный уровень не задерживает остальные.
+    """
+
+    def __init__(self, chain: Handler, approver: Any, queue_size: int = 100,
+                 concurrency: Optional[Dict[str, int]] = None, default_concurrency: int = 4) -> None:
+        """Настройка конвейера.
+
+        approver — объект с корутиной approve(handler, request), например FakeApprover.
+        concurrency — число одновременных согласований по имени класса обработчика.
+        """
+        if queue_size < 1:
+            raise ValueError("Размер очереди должен быть положительным.")
+
+        self._chain = chain
+        self._approver = approver
+        self._queue_size = queue_size
+        self._concurrency = dict(concurrency or {})
+        self._default_concurrency = default_concurrency
+        self.metrics = PipelineMetrics()
+
+        self._levels: Dict[str, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._pending: Dict[asyncio.Future, None] = {}
+
+    async def __aenter__(self) -> "MaintenancePipeline":
+        """Запуск конвейера в блоке async with."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Дожидание обработки заявок (или отмена при ошибке) и остановка."""
+        await self.close(cancel=exc_type is not None)
+
+    def start(self) -> None:
+        """Создание очередей уровней и запуск исполнителей (внутри работающего цикла событий)."""
+        if self._tasks:
+            return
+
+        node: Optional[Handler] = self._chain
+        while node is not None:
+            level = type(node).__name__
+            if level not in self._levels:
+                queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+                self._levels[level] = queue
+                workers = self._concurrency.get(level, self._default_concurrency)
+                if workers < 1:
+                    raise ValueError(f"Число исполнителей уровня {level} должно быть положительным.")
+                self._tasks.extend(asyncio.ensure_future(self._work(queue)) for _ in range(workers))
+            node = node._next
+
+    async def submit(self, request: MaintenanceRequest) -> "asyncio.Future[str]":
+        """Постановка заявки в очередь её уровня; при заполненной очереди ожидает места (обратное давление).
+
+        Возвращает future с текстом решения. Отмена future снимает заявку с обработки.
+        Заявка, которую не одобрил ни один обработчик, и ошибка маршрутизации завершают
+        future сразу, без очереди.
+        """
+        if not self._tasks:
+            raise RuntimeError("Конвейер не запущен.")
+
+        submitted = time.perf_counter()
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        try:
+            handler, decision = _route(self._chain, request)
+        except Exception as e:
+            self.metrics.failed += 1
+            fut.set_exception(e)
+            return fut
+
+        if handler is None:
+            self.metrics.completed += 1
+            self.metrics.record(UNHANDLED_LEVEL, 0.0, time.perf_counter() - submitted)
+            fut.set_result(decision)
+            return fut
+
+        self._pending[fut] = None
+        fut.add_done_callback(self._forget)
+        try:
+            await self._levels[type(handler).__name__].put((handler, decision, request, fut, submitted))
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        return fut
+
+    async def process(self, requests: Iterable[MaintenanceRequest]) -> List[str]:
+        """Обработка набора заявок; результаты в порядке заявок.
+
+        Заявки ставятся одновременно, поэтому заполненная очередь одного уровня не задерживает
+        постановку заявок других уровней; порядок внутри уровня сохраняется.
+        """
+        futures = await asyncio.gather(*(self.submit(r) for r in requests))
+        return list(await asyncio.gather(*futures))
+
+    async def close(self, cancel: bool = False) -> None:
+        """Остановка конвейера; без cancel сначала дожидается обработки принятых заявок."""
+        if not self._tasks:
+            return
+
+        if not cancel:
+            for queue in self._levels.values():
+                await queue.join()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._levels.clear()
+
+        for fut in list(self._pending):
+            fut.cancel()
+
+    def _forget(self, fut: asyncio.Future) -> None:
+        """Учёт завершения future заявки."""
+        self._pending.pop(fut, None)
+        if fut.cancelled():
+            self.metrics.cancelled += 1
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        """Исполнитель уровня: согласование заявок по одной."""
+        while True:
+            handler, decision, request, fut, submitted = await queue.get()
+            try:
+                if fut.done():
+                    continue
+
+                started = time.perf_counter()
+                approval = asyncio.ensure_future(self._approver.approve(handler, request))
+                # Отмена заявки вызывающим прерывает и её согласование.
+                fut.add_done_callback(lambda f, t=approval: t.cancel() if f.cancelled() else None)
+                try:
+                    await asyncio.wait({approval})
+                except asyncio.CancelledError:
+                    approval.cancel()
+                    raise
+
+                if fut.done():
+                    continue
+                if approval.cancelled():
+                    fut.cancel()
+                elif approval.exception() is not None:
+                    self.metrics.failed += 1
+                    fut.set_exception(approval.exception())
+                else:
+                    self.metrics.completed += 1
+                    self.metrics.record(type(handler).__name__, started - submitted, time.perf_counter() - submitted)
+                    fut.set_result(decision)
+            finally:
+                queue.task_done()
+
+
+def run_pipeline(chain: Handler, requests: Iterable[MaintenanceRequest], approver: Any,
+                 **options: Any) -> Tuple[List[str], PipelineMetrics]:
+    """Синхронная обработка заявок конвейером в собственном цикле событий."""
+
+    async def main() -> Tuple[List[str], PipelineMetrics]:
+        async with MaintenancePipeline(chain, approver, **options) as pipeline:
+            results = await pipeline.process(requests)
+        return results, pipeline.metrics
+
+    return asyncio.run(main())
@@ -0,0 +1,82 @@
+from typing import Dict, Iterable, List, Set
+
+# Длина n-граммы индекса. Запросы короче неё проверяются по кешу моделей в нижнем регистре.
+NGRAM = 3
+
+
+def _ngrams(text: str) -> Set[str]:
+    """Возврат множества n-грамм строки."""
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class ModelIndex:
+    """Инвертированный триграммный индекс моделей ТС для поиска по подстроке."""
+
+    def __init__(self) -> None:
+        """Инициализация пустого индекса."""
+        self._postings: Dict[str, Set[str]] = {}
+        self._models: Dict[str, str] = {}
+        # Порядковые номера добавления: результаты выдаются в порядке обхода коллекции ТС.
+        self._order: Dict[str, int] = {}
+        self._counter = 0
+
+    def add(self, vehicle_id: str, model: str) -> None:
+        """Добавление ТС в индекс (в конец порядка обхода)."""
+        self.remove(vehicle_id)
+        self._order[vehicle_id] = self._counter
+        self._counter += 1
+        self._put(vehicle_id, model)
+
+    def update(self, vehicle_id: str, model: str) -> None:
+        """Обновление модели ТС с сохранением его позиции."""
+        if vehicle_id not in self._models:
+            return
+
+        self._drop(vehicle_id)
+        self._put(vehicle_id, model)
+
+    def remove(self, vehicle_id: str) -> None:
+        """Удаление ТС из индекса."""
+        if vehicle_id in self._models:
+            self._drop(vehicle_id)
+            del self._order[vehicle_id]
+
+    def search(self, model_substr: str) -> List[str]:
+        """Возврат идентификаторов ТС, модель которых содержит подстроку (без учёта регистра)."""
+        q = model_substr.lower()
+        grams = _ngrams(q)
+
+        if not grams:
+            candidates: Iterable[str] = self._models
+        else:
+            postings = sorted((self._postings.get(g) for g in grams), key=lambda p: len(p) if p else 0)
+            if not postings[0]:
+                return []
+
+            found = set(postings[0])
+            for p in postings[1:]:
+                found &= p
+                if not found:
+                    return []
+            candidates = found
+
+        # Наличие всех n-грамм не гарантирует вхождение подстроки — кандидаты проверяются.
+        models = self._models
+        hits = [vid for vid in candidates if q in models[vid]]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def _put(self, vehicle_id: str, model: str) -> None:
+        """Запись модели и её n-грамм в индекс."""
+        lowered = model.lower()
+        self._models[vehicle_id] = lowered
+        for g in _ngrams(lowered):
+            self._postings.setdefault(g, set()).add(vehicle_id)
+
+    def _drop(self, vehicle_id: str) -> None:
+        """Удаление n-грамм модели ТС из индекса."""
+        for g in _ngrams(self._models.pop(vehicle_id)):
+            posting = self._postings[g]
+            posting.discard(vehicle_id)
+            if not posting:
+                del self._postings[g]
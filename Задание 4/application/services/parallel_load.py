@@ -0,0 +1,102 @@
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from application.services.validation import RecordError, normalize_drivers, normalize_vehicles
+from infrastructure.binary_snapshot import MappedSnapshot
+
+# Часть результата: (раздел, номер первой записи, записи в формате to_dict, ошибки проверки).
+Chunk = Tuple[str, int, List[Dict[str, Any]], List[RecordError]]
+
+_NORMALIZERS: Dict[str, Callable[..., Tuple[List[Dict[str, Any]], List[RecordError]]]] = {
+    "vehicles": normalize_vehicles,
+    "drivers": normalize_drivers,
+}
+
+
+def _decode_snapshot_chunk(path: str, kind: str, offsets: Sequence[int],
+                           start: int) -> Tuple[List[Dict[str, Any]], List[RecordError]]:
+    """Декодирование и проверка части записей снимка по смещениям (выполняется в процессе пула)."""
+    snapshot = MappedSnapshot(path, offsets=False)
+    try:
+        read = snapshot.vehicle_at if kind == "vehicles" else snapshot.driver_at
+        records = [read(off) for off in offsets]
+    finally:
+        snapshot.close()
+    return _NORMALIZERS[kind](records, start)
+
+
+class InlineExecutor(Executor):
+    """Исполнитель, выполняющий задачи сразу в вызывающем потоке (загрузка без пула процессов)."""
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Выполнение задачи и возврат завершённого future."""
+        fut: Future = Future()
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            fut.set_exception(e)
+        return fut
+
+
+class ParallelLoader:
+    """Распределение декодирования и проверки записей компании по частям между исполнителями.
+
+    Части отправляются в executor по мере чтения источника, а результаты выдаются
+    в порядке записей независимо от порядка завершения задач.
+    """
+
+    def __init__(self, executor: Executor, chunk_size: int = 10_000) -> None:
+        """Инициализация загрузчика."""
+        if chunk_size < 1:
+            raise ValueError("Размер части должен быть положительным.")
+
+        self._executor = executor
+        self._chunk_size = chunk_size
+        self.name: Optional[str] = None
+        self._futures: Dict[str, List[Tuple[int, Future]]] = {"vehicles": [], "drivers": []}
+
+    def feed_events(self, events: Iterable[Tuple[str, Any]]) -> None:
+        """Чтение потока пар формата iter_company с отправкой записей частями."""
+        buffers: Dict[str, List[Dict[str, Any]]] = {"vehicles": [], "drivers": []}
+        counts = {"vehicles": 0, "drivers": 0}
+        for key, item in events:
+            buf = buffers.get(key)
+            if buf is not None:
+                buf.append(item)
+                if len(buf) == self._chunk_size:
+                    self._submit_records(key, counts[key], buf)
+                    counts[key] += len(buf)
+                    buffers[key] = []
+            elif key == "name":
+                self.name = item
+
+        for key, buf in buffers.items():
+            if buf:
+                self._submit_records(key, counts[key], buf)
+
+    def feed_snapshot(self, path: str, snapshot: MappedSnapshot) -> None:
+        """Отправка частей снимка с индексом: процессы пула сами читают записи по смещениям."""
+        self.name = snapshot.name
+        for kind, offsets in (("vehicles", snapshot.vehicle_offsets), ("drivers", snapshot.driver_offsets)):
+            ordered = list(offsets.values())
+            for start in range(0, len(ordered), self._chunk_size):
+                part = ordered[start:start + self._chunk_size]
+                fut = self._executor.submit(_decode_snapshot_chunk, path, kind, part, start)
+                self._futures[kind].append((start, fut))
+
+    def _submit_records(self, kind: str, start: int, records: List[Dict[str, Any]]) -> None:
+        """Отправка части уже прочитанных записей."""
+        self._futures[kind].append((start, self._executor.submit(_NORMALIZERS[kind], records, start)))
+
+    def chunks(self) -> Iterator[Chunk]:
+        """Результаты по частям: сначала все ТС, затем водители, в порядке записей."""
+        for kind in ("vehicles", "drivers"):
+            for start, fut in self._futures[kind]:
+                records, errors = fut.result()
+                yield kind, start, records, errors
+
+    def cancel(self) -> None:
+        """Отмена ещё не начатых задач (при ошибке загрузки)."""
+        for futures in self._futures.values():
+            for _, fut in futures:
+                fut.cancel()
@@ -0,0 +1,318 @@
+import heapq
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from application.patterns.chain_of_responsibility import (
+    DepartmentHead,
+    Director,
+    Handler,
+    MaintenanceRequest,
+    Mechanic,
+)
+from application.patterns.template_method import CostCalculator
+from domain.route_graph import RouteGraph
+from domain.vehicle import Vehicle
+from utils.vectorized import numpy
+
+MINUTES_PER_DAY = 24 * 60
+
+# Виды событий; при равном времени сначала обрабатываются прибытия.
+_ARRIVE = 0
+_TRIP_START = 1
+
+# Средняя скорость по типам ТС, км/ч.
+DEFAULT_SPEEDS = {"bus": 25.0, "truck": 45.0, "taxi": 35.0}
+
+
+def default_maintenance_cost(vehicle: Vehicle, interval_km: float) -> float:
+    """Оценка стоимости ТО: 10% стоимости эксплуатации ТС на межсервисном пробеге."""
+    return round(0.1 * vehicle.calculate_cost(interval_km), 2)
+
+
+class SimulationReport:
+    """Итоги моделирования по ТС: пробег, рейсы, стоимость эксплуатации и ТО."""
+
+    def __init__(self, days: float, events: int, elapsed: float, vehicles: List[Vehicle],
+                 km: List[float], trips: List[int], costs: List[float], maintenance_costs: List[float],
+                 maintenance: List[Tuple[float, str, float, str]]) -> None:
+        """Формирование отчёта из состояния модели."""
+        self.days = days
+        self.events = events
+        self.elapsed = elapsed
+        ids = [v.vehicle_id for v in vehicles]
+        self._types = {v.vehicle_id: v.__class__.__name__.lower() for v in vehicles}
+        self.km = dict(zip(ids, km))
+        self.trips = dict(zip(ids, trips))
+        self.costs = dict(zip(ids, costs))
+        self.maintenance_costs = dict(zip(ids, maintenance_costs))
+        # Заявки на ТО: (день модели, id ТС, стоимость, решение цепочки обязанностей).
+        self.maintenance = maintenance
+
+    @property
+    def total_cost(self) -> float:
+        """Суммарная стоимость эксплуатации и ТО."""
+        return sum(self.costs.values()) + sum(self.maintenance_costs.values())
+
+    def by_type(self) -> Dict[str, Dict[str, float]]:
+        """Итоги по типам ТС: количество, пробег, рейсы, стоимость эксплуатации и ТО."""
+        res: Dict[str, Dict[str, float]] = {}
+        for vehicle_id, tag in self._types.items():
+            row = res.setdefault(tag, {"count": 0, "km": 0.0, "trips": 0, "cost": 0.0, "maintenance": 0.0})
+            row["count"] += 1
+            row["km"] += self.km[vehicle_id]
+            row["trips"] += self.trips[vehicle_id]
+            row["cost"] += self.costs[vehicle_id]
+            row["maintenance"] += self.maintenance_costs[vehicle_id]
+        return res
+
+
+class FleetSimulation:
+    """Дискретно-событийная модель работы парка на маршрутной сети.
+
+    ТС выполняют рейсы между случайными остановками графа в пределах смены. События хранятся
+    в куче по времени; ТС с update_location (Trackable) получают местоположение на каждой
+    остановке, остальным достаточно события прибытия в конец рейса. Раз в шаг tick_minutes
+    пробег и стоимость по всему парку обновляются векторно по линейным коэффициентам
+    калькуляторов, а ТС, достигшие межсервисного пробега, отправляют заявки на ТО в
+    цепочку обязанностей и на время обслуживания снимаются с рейсов (in_service).
+    Статус ТС модель не меняет: прогноз не затрагивает индексы, базу и журнал компании.
+    Пункт назначения рейса выбирается в компоненте связности графа, где находится ТС.
+    """
+
+    def __init__(self, vehicles: Iterable[Vehicle], graph: RouteGraph, chain: Optional[Handler] = None,
+                 calculators: Optional[Dict[str, CostCalculator]] = None,
+                 speeds: Optional[Dict[str, float]] = None, tick_minutes: float = 60.0,
+                 shift: Tuple[float, float] = (6.0, 22.0), dwell_minutes: Tuple[float, float] = (10.0, 40.0),
+                 service_interval_km: float = 5000.0, service_days: float = 1.0,
+                 maintenance_cost: Callable[[Vehicle, float], float] = default_maintenance_cost,
+                 seed: int = 0) -> None:
+        """Настройка модели.
+
+        calculators — калькуляторы стоимости по тегу типа ТС (иначе используется calculate_cost
+        самого ТС), speeds — скорости по тегу типа (км/ч), shift — часы начала и конца смены.
+        """
+        if tick_minutes <= 0:
+            raise ValueError("Шаг модели должен быть положительным.")
+        if not graph.stops:
+            raise ValueError("В графе нет остановок.")
+
+        self._graph = graph
+        # Остановки компоненты связности по каждой остановке: рейсы не выходят за пределы компоненты.
+        self._reachable: Dict[str, List[str]] = {}
+        for component in graph.components():
+            for stop in component:
+                self._reachable[stop] = component
+        self._stops = graph.stops
+        self._chain = (chain or Mechanic(DepartmentHead(Director()))).compile()
+        self._tick = tick_minutes
+        self._shift = (shift[0] * 60, shift[1] * 60)
+        self._dwell = dwell_minutes
+        self._interval = service_interval_km
+        self._service_minutes = service_days * MINUTES_PER_DAY
+        self._maintenance_cost = maintenance_cost
+        self._rng = random.Random(seed)
+
+        self._vehicles = [v for v in vehicles if v.status != "retired"]
+        n = len(self._vehicles)
+        speeds = {**DEFAULT_SPEEDS, **(speeds or {})}
+        calculators = calculators or {}
+
+        # Скорости хранятся в км/мин; у ТС без линейных коэффициентов стоимость считается по рейсам.
+        self._speed: List[float] = []
+        self._trackable: List[bool] = []
+        self._scalar_cost: Dict[int, Callable[[float], float]] = {}
+        per_km: List[float] = []
+        fixed: List[float] = []
+        for i, v in enumerate(self._vehicles):
+            tag = v.__class__.__name__.lower()
+            self._speed.append(speeds.get(tag, 40.0) / 60)
+            self._trackable.append(callable(getattr(v, "update_location", None)))
+            terms, scalar = self._cost_model(v, calculators.get(tag))
+            per_km.append(terms[0] if terms else 0.0)
+            fixed.append(terms[1] if terms else 0.0)
+            if scalar is not None:
+                self._scalar_cost[i] = scalar
+
+        self._node = [self._stops[self._rng.randrange(len(self._stops))] for _ in range(n)]
+        self._trip: List[Tuple[List[str], List[float]]] = [([], [])] * n
+        self._trip_km = [0.0] * n
+        self._due = [False] * n
+        self._in_service = [False] * n
+        self._tick_km = [0.0] * n
+        self._tick_trips = [0] * n
+        self._maintenance_costs = [0.0] * n
+        self.maintenance: List[Tuple[float, str, float, str]] = []
+
+        # NumPy необязателен: без него шаг модели считается циклом.
+        self._np = np = numpy()
+        if np is not None:
+            self._per_km: Any = np.array(per_km, dtype=np.float64)
+            self._fixed: Any = np.array(fixed, dtype=np.float64)
+            self._costs: Any = np.zeros(n)
+            self._km: Any = np.zeros(n)
+            self._trips: Any = np.zeros(n, dtype=np.int64)
+            self._next_service: Any = np.full(n, float(service_interval_km))
+        else:
+            self._per_km, self._fixed = per_km, fixed
+            self._costs, self._km, self._trips = [0.0] * n, [0.0] * n, [0] * n
+            self._next_service = [float(service_interval_km)] * n
+
+        self.now = 0.0
+        self._next_tick = tick_minutes
+        self._events = 0
+        self._heap: List[Tuple[float, int, int, int, int]] = []
+        self._seq = 0
+        for i in range(n):
+            self._push(self._shift[0] + self._rng.uniform(0, 60), _TRIP_START, i)
+
+    @staticmethod
+    def _cost_model(vehicle: Vehicle, calculator: Optional[CostCalculator]
+                    ) -> Tuple[Optional[Tuple[float, float]], Optional[Callable[[float], float]]]:
+        """Линейные коэффициенты стоимости ТС или функция стоимости рейса, если их нет."""
+        if calculator is not None:
+            rate = calculator._linear_rate()
+            if rate is not None:
+                return (rate, calculator.get_extra_cost(vehicle, 0.0)), None
+            return None, lambda km: calculator.calculate_cost(vehicle, km)
+
+        terms = vehicle._cost_terms()
+        if terms is not None:
+            return terms, None
+        return None, vehicle.calculate_cost
+
+    def _push(self, at: float, kind: int, i: int, seg: int = 0) -> None:
+        """Постановка события в очередь."""
+        self._seq += 1
+        heapq.heappush(self._heap, (at, self._seq, kind, i, seg))
+
+    def run(self, days: float) -> SimulationReport:
+        """Моделирование следующих days суток; повторный вызов продолжает с того же момента."""
+        started = time.perf_counter()
+        end = self.now + days * MINUTES_PER_DAY
+        heap = self._heap
+        pop = heapq.heappop
+
+        while heap and heap[0][0] < end:
+            at, _, kind, i, seg = pop(heap)
+            while at >= self._next_tick:
+                self._flush_tick(self._next_tick)
+                self._next_tick += self._tick
+            self.now = at
+            self._events += 1
+            if kind == _ARRIVE:
+                self._arrive(i, seg, at)
+            else:
+                self._start_trip(i, at)
+
+        while self._next_tick <= end:
+            self._flush_tick(self._next_tick)
+            self._next_tick += self._tick
+        self.now = end
+        return self.report(time.perf_counter() - started)
+
+    def _start_trip(self, i: int, now: float) -> None:
+        """Начало рейса (или ТО, если оно назначено) с учётом смены."""
+        if self._due[i]:
+            self._due[i] = False
+            self._in_service[i] = True
+            self._push(now + self._service_minutes, _TRIP_START, i)
+            return
+        self._in_service[i] = False
+
+        minute = now % MINUTES_PER_DAY
+        if not self._shift[0] <= minute < self._shift[1]:
+            day_start = now - minute + self._shift[0]
+            self._push(day_start if minute < self._shift[0] else day_start + MINUTES_PER_DAY, _TRIP_START, i)
+            return
+
+        stops = self._reachable[self._node[i]]
+        k = self._rng.randrange(len(stops))
+        dest = stops[k] if stops[k] != self._node[i] or len(stops) == 1 else stops[(k + 1) % len(stops)]
+        trip = self._trip[i] = self._graph.path(self._node[i], dest)
+        if not trip[0]:
+            # Единственная остановка компоненты: рейс нулевой длины.
+            self._push(now + self._rng.uniform(*self._dwell), _TRIP_START, i)
+            return
+
+        if self._trackable[i]:
+            self._push(now + trip[1][0] / self._speed[i], _ARRIVE, i, 0)
+        else:
+            self._push(now + sum(trip[1]) / self._speed[i], _ARRIVE, i, -1)
+
+    def _arrive(self, i: int, seg: int, now: float) -> None:
+        """Прибытие на остановку (seg — номер участка, -1 — сразу в конец рейса)."""
+        stops, lengths = self._trip[i]
+        if seg < 0:
+            km = sum(lengths)
+            last = True
+        else:
+            km = lengths[seg]
+            last = seg == len(stops) - 1
+            self._vehicles[i].update_location(self._graph.location(stops[seg]))
+        self._tick_km[i] += km
+        self._trip_km[i] += km
+
+        if not last:
+            self._push(now + lengths[seg + 1] / self._speed[i], _ARRIVE, i, seg + 1)
+            return
+
+        self._node[i] = stops[-1]
+        self._tick_trips[i] += 1
+        scalar = self._scalar_cost.get(i)
+        if scalar is not None:
+            self._costs[i] += scalar(self._trip_km[i])
+        self._trip_km[i] = 0.0
+        self._push(now + self._rng.uniform(*self._dwell), _TRIP_START, i)
+
+    def _flush_tick(self, now: float) -> None:
+        """Векторное обновление пробега и стоимости за шаг и отправка заявок на ТО."""
+        km, trips = self._tick_km, self._tick_trips
+        n = len(km)
+        np = self._np
+        if np is not None:
+            km_arr = np.array(km)
+            trips_arr = np.array(trips)
+            self._costs += self._per_km * km_arr + self._fixed * trips_arr
+            self._km += km_arr
+            self._trips += trips_arr
+            due = np.flatnonzero(self._km >= self._next_service).tolist()
+            if due:
+                self._next_service[due] += self._interval
+        else:
+            due = []
+            for i in range(n):
+                if km[i] or trips[i]:
+                    self._costs[i] += self._per_km[i] * km[i] + self._fixed[i] * trips[i]
+                    self._km[i] += km[i]
+                    self._trips[i] += trips[i]
+                    if self._km[i] >= self._next_service[i]:
+                        self._next_service[i] += self._interval
+                        due.append(i)
+        self._tick_km = [0.0] * n
+        self._tick_trips = [0] * n
+
+        if not due:
+            return
+
+        requests = []
+        for i in due:
+            v = self._vehicles[i]
+            self._due[i] = True
+            cost = self._maintenance_cost(v, self._interval)
+            self._maintenance_costs[i] += cost
+            requests.append(MaintenanceRequest(v, cost, f"ТО {v.vehicle_id} ({float(self._km[i]):.0f} км)"))
+        day = now / MINUTES_PER_DAY
+        for r, decision in zip(requests, self._chain.handle_many(requests)):
+            self.maintenance.append((day, r.vehicle.vehicle_id, r.cost, decision))
+
+    def in_service(self) -> List[str]:
+        """Id ТС, находящихся на ТО в текущий момент модели."""
+        return [v.vehicle_id for v, flag in zip(self._vehicles, self._in_service) if flag]
+
+    def report(self, elapsed: float = 0.0) -> SimulationReport:
+        """Отчёт по текущему состоянию модели."""
+        to_list = (lambda a: a.tolist()) if self._np is not None else list
+        return SimulationReport(self.now / MINUTES_PER_DAY, self._events, elapsed, self._vehicles,
+                                to_list(self._km), to_list(self._trips), to_list(self._costs),
+                                list(self._maintenance_costs), list(self.maintenance))
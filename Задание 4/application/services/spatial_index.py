@@ -0,0 +1,147 @@
+import heapq
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from domain.geo import KM_PER_DEGREE, haversine_km
+
+Cell = Tuple[int, int]
+
+
+class GridIndex:
+    """Пространственный индекс точек на равномерной сетке по широте и долготе.
+
+    Перемещение точки — перенос между двумя ячейками за O(1). Запросы просматривают только
+    ячейки, пересекающие круг поиска (within_radius), или расширяющиеся кольца ячеек вокруг
+    точки запроса (nearest). Переход через меридиан 180° не учитывается.
+    """
+
+    def __init__(self, cell_km: float = 1.0) -> None:
+        """Инициализация пустого индекса с размером ячейки cell_km по широте."""
+        if cell_km <= 0:
+            raise ValueError("Размер ячейки должен быть положительным.")
+
+        self._cell_deg = cell_km / KM_PER_DEGREE
+        self._cells: Dict[Cell, Dict[str, Tuple[float, float]]] = {}
+        self._points: Dict[str, Tuple[float, float, Cell]] = {}
+
+    def __len__(self) -> int:
+        """Количество точек в индексе."""
+        return len(self._points)
+
+    def __contains__(self, key: object) -> bool:
+        """Проверка наличия точки."""
+        return key in self._points
+
+    def get(self, key: str) -> Optional[Tuple[float, float]]:
+        """Координаты точки или None."""
+        point = self._points.get(key)
+        return None if point is None else point[:2]
+
+    def _cell(self, lat: float, lon: float) -> Cell:
+        """Ячейка, содержащая точку."""
+        return math.floor(lat / self._cell_deg), math.floor(lon / self._cell_deg)
+
+    def update(self, key: str, lat: float, lon: float) -> None:
+        """Добавление точки или её перемещение."""
+        cell = self._cell(lat, lon)
+        old = self._points.get(key)
+        if old is not None and old[2] != cell:
+            self._drop(key, old[2])
+        self._points[key] = (lat, lon, cell)
+        self._cells.setdefault(cell, {})[key] = (lat, lon)
+
+    def remove(self, key: str) -> None:
+        """Удаление точки (если она есть)."""
+        old = self._points.pop(key, None)
+        if old is not None:
+            self._drop(key, old[2])
+
+    def _drop(self, key: str, cell: Cell) -> None:
+        """Удаление ключа из ячейки."""
+        members = self._cells[cell]
+        del members[key]
+        if not members:
+            del self._cells[cell]
+
+    def _lon_factor(self, lat: float, span_deg: float) -> float:
+        """Наименьший косинус широты в полосе lat ± span_deg (сжатие градуса долготы)."""
+        return max(math.cos(math.radians(min(90.0, abs(lat) + span_deg))), 1e-9)
+
+    def within_radius(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, str]]:
+        """Точки не дальше radius_km от (lat, lon): пары (расстояние, ключ) по возрастанию расстояния."""
+        if radius_km < 0:
+            return []
+
+        dlat = radius_km / KM_PER_DEGREE
+        dlon = dlat / self._lon_factor(lat, dlat)
+        lat0, lon0 = self._cell(lat - dlat, lon - dlon)
+        lat1, lon1 = self._cell(lat + dlat, lon + dlon)
+
+        if (lat1 - lat0 + 1) * (lon1 - lon0 + 1) > len(self._cells):
+            # Круг накрывает больше ячеек, чем занято: дешевле перебрать занятые.
+            cells = [members for cell, members in self._cells.items()
+                     if lat0 <= cell[0] <= lat1 and lon0 <= cell[1] <= lon1]
+        else:
+            cells = [self._cells[cell] for cell in ((i, j) for i in range(lat0, lat1 + 1)
+                                                    for j in range(lon0, lon1 + 1)) if cell in self._cells]
+
+        found: List[Tuple[float, str]] = []
+        for members in cells:
+            for key, (plat, plon) in members.items():
+                d = haversine_km(lat, lon, plat, plon)
+                if d <= radius_km:
+                    found.append((d, key))
+        found.sort()
+        return found
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Tuple[float, str]]:
+        """k ближайших точек: пары (расстояние, ключ) по возрастанию расстояния."""
+        if k <= 0 or not self._points:
+            return []
+
+        ci, cj = self._cell(lat, lon)
+        best: List[Tuple[float, str]] = []  # куча с обратным знаком расстояния: k лучших
+        seen = 0
+        visited = 0
+        ring = 0
+        while True:
+            for cell in self._ring(ci, cj, ring):
+                visited += 1
+                members = self._cells.get(cell)
+                if not members:
+                    continue
+                for key, (plat, plon) in members.items():
+                    seen += 1
+                    item = (-haversine_km(lat, lon, plat, plon), key)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+
+            if seen == len(self._points):
+                break
+            # Точки вне просмотренных колец удалены от запроса не меньше чем на ring ячеек
+            # (с небольшим запасом: дуга параллели чуть длиннее дуги большого круга).
+            span = (ring + 1) * self._cell_deg
+            bound = 0.99 * ring * self._cell_deg * KM_PER_DEGREE * self._lon_factor(lat, span)
+            if len(best) == k and -best[0][0] <= bound:
+                break
+            if visited > len(self._points) + len(self._cells):
+                # Точки далеко от запроса: полный просмотр дешевле дальнейших колец.
+                return sorted((haversine_km(lat, lon, p[0], p[1]), key) for key, p in self._points.items())[:k]
+            ring += 1
+
+        return sorted((-d, key) for d, key in best)
+
+    @staticmethod
+    def _ring(ci: int, cj: int, r: int) -> Iterator[Cell]:
+        """Ячейки на расстоянии ровно r ячеек (по Чебышёву) от (ci, cj)."""
+        if r == 0:
+            yield ci, cj
+            return
+        for j in range(cj - r, cj + r + 1):
+            yield ci - r, j
+            yield ci + r, j
+        for i in range(ci - r + 1, ci + r):
+            yield i, cj - r
+            yield i, cj + r
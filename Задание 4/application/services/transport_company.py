@@ -1,24 +1,109 @@
-import json
+import logging
 import os
-from typing import Dict, List, Optional
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set,
+                    Tuple)
 
-from core.exceptions import InvalidVehicleError, DriverNotFoundError
+from application.services.fleet_stats import FleetStats
+from application.services.model_index import ModelIndex
+from application.services.spatial_index import GridIndex
+from application.services.vehicle_index import VehicleIndex
+from application.services.vehicle_store import ColumnarVehicleStore
+from core.exceptions import InvalidVehicleError, DriverNotFoundError, RecordsValidationError
 from domain.driver import Driver
+from domain.geo import parse_location
 from domain.vehicle import Vehicle
 from utils.decorators import check_permissions
 
+# Форматы хранения, параллельная загрузка, проверка записей и векторный расчёт импортируются
+# в методах, которым они нужны: импорт модуля (и запуск CLI) их не загружает.
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from application.services.parallel_load import Chunk
+    from application.services.validation import RecordError
+    from infrastructure.journal import JournalDelta
+    from infrastructure.sqlite_backend import SQLiteBackend
+
 DATA_DIR = "data"
-os.makedirs(DATA_DIR, exist_ok=True)
+
+# Журнал изменений сворачивается в полный файл, когда число операций в нём превышает
+# эту долю от размера компании (ТС + водители).
+JOURNAL_COMPACT_RATIO = 0.25
+
+logger = logging.getLogger("transport_company")
+
+
+def _resolve_path(path: Optional[str], default: str = "transport_company.json") -> str:
+    """Путь файла компании: без пути — default в директории data.
+
+    Относительный путь, не содержащий директорию data, переносится в неё (по имени файла).
+    """
+    if path is None:
+        return os.path.join(DATA_DIR, default)
+    if not os.path.isabs(path) and DATA_DIR not in path:
+        return os.path.join(DATA_DIR, os.path.basename(path))
+    return path
+
+
+def _ensure_data_dir(path: str) -> None:
+    """Создание директории data перед первой записью в неё (при импорте модуля она не создаётся)."""
+    if os.path.dirname(path) == DATA_DIR:
+        os.makedirs(DATA_DIR, exist_ok=True)
 
 
 class TransportCompany:
     """Фасад над коллекциями ТС и водителей. Поддержка CRUD, поиск, анализ и сериализации."""
 
-    def __init__(self, name: str) -> None:
-        """Инициализация транспортной компании."""
-        self.name = name
-        self._vehicles: Dict[str, Vehicle] = {}
-        self._drivers: Dict[str, Driver] = {}
+    def __init__(self, name: str, vehicle_store: Optional[MutableMapping[str, Vehicle]] = None) -> None:
+        """Инициализация транспортной компании.
+
+        vehicle_store — необязательное хранилище ТС (например, ColumnarVehicleStore), по умолчанию словарь.
+        """
+        self._name = name
+        self._vehicles: MutableMapping[str, Vehicle] = vehicle_store if vehicle_store is not None else {}
+        self._drivers: MutableMapping[str, Driver] = {}
+        self._model_index = ModelIndex()
+        self._vehicle_index = VehicleIndex()
+        self._stats = FleetStats()
+        # Координаты ТС с разбираемым местоположением (обновляются через update_location).
+        self._spatial = GridIndex()
+        # Назначения водителей: driver_id -> vehicle_id и vehicle_id -> {driver_id} в порядке назначения.
+        self._vehicle_of_driver: Dict[str, str] = {}
+        self._drivers_of_vehicle: Dict[str, Dict[str, None]] = {}
+        # False у компании, открытой из снимка лениво: индексы строятся при первом запросе к ним.
+        self._indexed = True
+        # Подключённое хранилище SQLite: изменения записываются в него сразу (write-through).
+        self._backend: Optional["SQLiteBackend"] = None
+        # Изменения с последнего полного сохранения или загрузки — для журнала save(..., delta=True):
+        # id изменённых и добавленных, id удалённых ТС и водителей.
+        self._dirty_vehicles: Dict[str, None] = {}
+        self._dirty_drivers: Dict[str, None] = {}
+        self._removed_vehicles: Set[str] = set()
+        self._removed_drivers: Set[str] = set()
+        # Файл компании с журналом изменений (абсолютный путь, формат), число операций в журнале
+        # и имя компании на момент последней записи.
+        self._journal: Optional[Tuple[str, str]] = None
+        self._journal_records = 0
+        self._journal_name = name
+
+        if isinstance(self._vehicles, ColumnarVehicleStore):
+            # Представления создаются на лету, поэтому наблюдатель подключается к самому хранилищу.
+            self._vehicles._observer = self
+        for v in self._vehicles.values():
+            self._index_vehicle(v)
+            v._bind(self)
+
+    @property
+    def name(self) -> str:
+        """Название компании."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """Переименование компании с записью в подключённую базу."""
+        self._name = value
+        if self._backend is not None:
+            self._backend.set_name(value)
 
     @check_permissions(["admin", "manager", "dispatcher"])
     def add_vehicle(self, user, vehicle: Vehicle) -> None:
@@ -26,13 +111,86 @@ class TransportCompany:
         if vehicle.vehicle_id in self._vehicles:
             raise InvalidVehicleError("ТС с таким идентификатором уже существует.")
 
-        self._vehicles[vehicle.vehicle_id] = vehicle
-        vehicle.log_action(f"Добавлено ТС {vehicle}")
+        self._register_vehicle(vehicle)
+        if self._backend is not None:
+            self._backend.put_vehicle(vehicle.to_dict())
+        vehicle.log_action("Добавлено ТС %s", vehicle)
+
+    @check_permissions(["admin", "manager", "dispatcher"])
+    def add_vehicles(self, user, vehicles: Iterable[Vehicle]) -> None:
+        """Пакетное добавление ТС (в том числе из генератора).
+
+        Права проверяются один раз; весь пакет (id, поля для колоночного хранилища, записи для базы)
+        проверяется до вставки, и при ошибке — в том числе при записи в подключённую базу —
+        не добавляется ни одно ТС. Вместо записи на каждое ТС в лог пишется одна сводная.
+        """
+        batch = list(vehicles)
+        seen: Set[str] = set()
+        store = self._vehicles if isinstance(self._vehicles, ColumnarVehicleStore) else None
+        for v in batch:
+            vehicle_id = v.vehicle_id
+            if vehicle_id in seen or vehicle_id in self._vehicles:
+                raise InvalidVehicleError(f"ТС с идентификатором {vehicle_id} уже существует.")
+            seen.add(vehicle_id)
+            if store is not None:
+                store.check(v)
+        records = [v.to_dict() for v in batch] if self._backend is not None else None
+
+        added: List[Vehicle] = []
+        try:
+            for v in batch:
+                self._register_vehicle(v)
+                added.append(v)
+            if records is not None:
+                self._backend.put_vehicles(records)
+        except BaseException:
+            for v in reversed(added):
+                self._unregister_vehicle(v.vehicle_id, v)
+            raise
+        logger.info("[LOG] Добавлено ТС: %d", len(batch))
 
     @check_permissions(["admin", "manager"])
     def remove_vehicle(self, user, vehicle_id: str) -> None:
         """Удаление транспортного средства из парка компании."""
-        self._vehicles.pop(vehicle_id, None)
+        v = self._vehicles.get(vehicle_id)
+        if v is None:
+            return
+
+        if isinstance(self._vehicles, ColumnarVehicleStore):
+            # Строка хранилища будет занята другим ТС, а представления удалённого ТС недействительны:
+            # водители получают отвязанную копию ТС, как при хранении объектов в словаре.
+            self._ensure_indexes()
+            self._detach_holders(vehicle_id, v)
+        if self._backend is not None:
+            # Водители удалённого ТС сохраняют его копию, как при сохранении в файл.
+            self._ensure_indexes()
+            orphans = [self._drivers[d].to_dict() for d in self._drivers_of_vehicle.get(vehicle_id, ())]
+            self._backend.delete_vehicle(vehicle_id, orphans)
+        if self._journal is not None:
+            # Водители удалённого ТС попадают в журнал заново: вместо ссылки на ТС — его копия.
+            self._ensure_indexes()
+            for driver_id in self._drivers_of_vehicle.get(vehicle_id, ()):
+                self._dirty_drivers[driver_id] = None
+        self._removed_vehicles.add(vehicle_id)
+        # Водители удалённого ТС больше не считаются закреплёнными за ТС парка с этим id.
+        for driver_id in self._drivers_of_vehicle.pop(vehicle_id, ()):
+            del self._vehicle_of_driver[driver_id]
+        self._unregister_vehicle(vehicle_id, v)
+
+    @check_permissions(["admin", "manager", "dispatcher"])
+    def update_vehicle(self, user, vehicle_id: str, **fields: Any) -> Vehicle:
+        """Изменение полей ТС (model, status, year и др.) через сеттеры: значения проверяются, индексы обновляются."""
+        v = self._vehicles.get(vehicle_id)
+        if v is None:
+            raise InvalidVehicleError("ТС не найдено.")
+
+        for field in fields:
+            attr = getattr(type(v), field, None)
+            if not isinstance(attr, property) or attr.fset is None:
+                raise InvalidVehicleError(f"Поле ТС нельзя изменить: {field}")
+        for field, value in fields.items():
+            setattr(v, field, value)
+        return v
 
     def get_all_vehicles(self) -> List[Vehicle]:
         """Возврат списка всех транспортных средств компании."""
@@ -40,8 +198,48 @@ class TransportCompany:
 
     def search_by_model(self, model_substr: str) -> List[Vehicle]:
         """Поиск транспортных средств по подстроке в названии модели."""
-        q = model_substr.lower()
-        return [v for v in self._vehicles.values() if q in v.model.lower()]
+        self._ensure_indexes()
+        return [self._vehicles[vid] for vid in self._model_index.search(model_substr)]
+
+    def find_vehicles(self, vehicle_type: Optional[str] = None, status: Optional[str] = None,
+                      year_range: Optional[Tuple[int, int]] = None) -> List[Vehicle]:
+        """Поиск ТС по типу (ключ реестра, например "bus", — с подклассами), статусу и диапазону годов включительно."""
+        self._ensure_indexes()
+        return [self._vehicles[vid] for vid in self._vehicle_index.find(vehicle_type, status, year_range)]
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Vehicle]:
+        """Поиск k ближайших к точке ТС с известным местоположением (по возрастанию расстояния)."""
+        self._ensure_indexes()
+        return [self._vehicles[key] for _, key in self._spatial.nearest(lat, lon, k)]
+
+    def within_radius(self, lat: float, lon: float, radius_km: float) -> List[Vehicle]:
+        """Поиск ТС не дальше radius_km от точки (по возрастанию расстояния)."""
+        self._ensure_indexes()
+        return [self._vehicles[key] for _, key in self._spatial.within_radius(lat, lon, radius_km)]
+
+    def update_locations(self, updates: Iterable[Tuple[str, str]]) -> int:
+        """Пакетная запись местоположений (id ТС, строка координат) ТС с методом update_location.
+
+        Значения записываются напрямую, без уведомления наблюдателя по каждому ТС; пространственный
+        индекс обновляется в том же проходе. Неизвестные ТС и ТС без update_location пропускаются.
+        Возвращает число обновлённых ТС.
+        """
+        vehicles = self._vehicles
+        spatial = self._spatial if self._indexed else None
+        applied = 0
+        for vehicle_id, location in updates:
+            v = vehicles.get(vehicle_id)
+            if v is None or not hasattr(v, "update_location"):
+                continue
+            v._last_location = location
+            applied += 1
+            if spatial is not None:
+                coords = parse_location(location)
+                if coords is None:
+                    spatial.remove(vehicle_id)
+                else:
+                    spatial.update(vehicle_id, *coords)
+        return applied
 
     @check_permissions(["admin", "manager", "dispatcher"])
     def add_driver(self, user, driver: Driver) -> None:
@@ -49,12 +247,46 @@ class TransportCompany:
         if driver.driver_id in self._drivers:
             raise InvalidVehicleError("Водитель с таким id уже существует.")
 
-        self._drivers[driver.driver_id] = driver
+        self._register_driver(driver)
+        if self._backend is not None:
+            self._backend.put_driver(driver.to_dict(self._owns_assigned_vehicle(driver)))
+
+    @check_permissions(["admin", "manager", "dispatcher"])
+    def add_drivers(self, user, drivers: Iterable[Driver]) -> None:
+        """Пакетное добавление водителей (в том числе из генератора) по правилам add_vehicles."""
+        batch = list(drivers)
+        seen: Set[str] = set()
+        for d in batch:
+            driver_id = d.driver_id
+            if driver_id in seen or driver_id in self._drivers:
+                raise InvalidVehicleError(f"Водитель с id {driver_id} уже существует.")
+            seen.add(driver_id)
+
+        added: List[Driver] = []
+        try:
+            for d in batch:
+                self._register_driver(d)
+                added.append(d)
+            if self._backend is not None:
+                self._backend.put_drivers([d.to_dict(self._owns_assigned_vehicle(d)) for d in batch])
+        except BaseException:
+            for d in reversed(added):
+                self._unregister_driver(d.driver_id)
+            raise
+        logger.info("[LOG] Добавлено водителей: %d", len(batch))
 
     @check_permissions(["admin", "manager"])
     def remove_driver(self, user, driver_id: str) -> None:
         """Удаление водителя из компании."""
-        self._drivers.pop(driver_id, None)
+        if driver_id in self._drivers:
+            self._unregister_driver(driver_id)
+            self._removed_drivers.add(driver_id)
+            if self._backend is not None:
+                self._backend.delete_driver(driver_id)
+
+    def get_all_drivers(self) -> List[Driver]:
+        """Возврат списка всех водителей компании."""
+        return list(self._drivers.values())
 
     def get_driver(self, driver_id: str) -> Driver:
         """Возврат водителя по идентификатору."""
@@ -63,6 +295,14 @@ class TransportCompany:
             raise DriverNotFoundError("Водитель не найден.")
         return d
 
+    def driver_for_vehicle(self, vehicle_id: str) -> Optional[Driver]:
+        """Возврат водителя, закреплённого за ТС (последнего назначенного), или None."""
+        self._ensure_indexes()
+        drivers = self._drivers_of_vehicle.get(vehicle_id)
+        if not drivers:
+            return None
+        return self._drivers[next(reversed(drivers))]
+
     @check_permissions(["admin", "manager", "dispatcher"])
     def assign_driver_to_vehicle(self, user, driver_id: str, vehicle_id: str) -> None:
         """Назначение водителя на транспортное средство."""
@@ -73,59 +313,592 @@ class TransportCompany:
             raise InvalidVehicleError("ТС не найдено.")
 
         d.assign_vehicle(v)
-        v.log_action(f"Водитель {d.name} назначен на {v}")
+        self._index_assignment(d.driver_id, vehicle_id)
+        if self._backend is not None:
+            self._backend.put_driver(d.to_dict(vehicle_ref=True))
+        v.log_action("Водитель %s назначен на %s", d.name, v)
+
+    @check_permissions(["admin", "manager", "dispatcher"])
+    def assign_drivers(self, user, assignments: Mapping[str, Optional[str]]) -> None:
+        """Пакетное назначение водителей: driver_id -> vehicle_id (None — открепление от ТС).
+
+        Права проверяются один раз; все водители и ТС проверяются до изменений, и при ошибке
+        не меняется ни одно назначение. В подключённую базу водители записываются одним пакетом,
+        в лог — одна сводная запись.
+        """
+        batch: List[Tuple[Driver, Optional[Vehicle]]] = []
+        for driver_id, vehicle_id in assignments.items():
+            d = self.get_driver(driver_id)
+            v = None
+            if vehicle_id is not None:
+                v = self._vehicles.get(vehicle_id)
+                if v is None:
+                    raise InvalidVehicleError(f"ТС не найдено: {vehicle_id}")
+            batch.append((d, v))
+
+        for d, v in batch:
+            if v is not None:
+                d.assign_vehicle(v)
+                self._index_assignment(d.driver_id, v.vehicle_id)
+            elif d.get_assigned_vehicle() is not None:
+                d.remove_vehicle()
+                self._drop_assignment(d.driver_id)
+        if self._backend is not None:
+            self._backend.put_drivers(d.to_dict(self._owns_assigned_vehicle(d)) for d, _ in batch)
+        logger.info("[LOG] Назначено водителей: %d, откреплено: %d",
+                    sum(v is not None for _, v in batch), sum(v is None for _, v in batch))
+
+    def save(self, path: Optional[str] = None, vehicle_refs: bool = True, fmt: Optional[str] = None,
+             compress: bool = False, delta: bool = False) -> None:
+        """Сохранение данных компании в JSON-файл, бинарный снимок или базу SQLite.
+
+        vehicle_refs=True записывает у водителей ссылку на ТС парка вместо полной копии ТС.
+        fmt — "json", "binary" или "sqlite"; по умолчанию выбирается по расширению
+        (.snap — бинарный снимок, .db/.sqlite — SQLite). compress=True сжимает бинарный снимок gzip.
+        При подключённом хранилище SQLite save() без пути лишь фиксирует транзакцию: данные уже записаны.
+        delta=True для JSON и снимка дописывает в журнал <файл>.journal только изменения с прошлого
+        сохранения или загрузки этого файла; файл переписывается целиком (журнал сворачивается),
+        если журнала ещё нет или он вырос больше JOURNAL_COMPACT_RATIO от размера компании.
+        """
+        if self._backend is not None and path is None and fmt is None:
+            self._backend.commit()
+            return
+
+        from infrastructure.binary_snapshot import SNAPSHOT_EXTENSIONS, dump_snapshot
+        from infrastructure.journal import drop_journal, start_journal
+        from infrastructure.json_stream import dump_company
+        from infrastructure.sqlite_backend import SQLITE_EXTENSIONS, SQLiteBackend
 
-    def save(self, path: Optional[str] = None) -> None:
-        """Сохранение данных компании в JSON-файл."""
-        if path is None:
-            path = os.path.join(DATA_DIR, "transport_company.json")
+        path = _resolve_path(path)
+
+        if fmt is None:
+            if path.endswith(SNAPSHOT_EXTENSIONS):
+                fmt = "binary"
+            elif path.endswith(SQLITE_EXTENSIONS):
+                fmt = "sqlite"
+            else:
+                fmt = "json"
+        if fmt not in ("json", "binary", "sqlite"):
+            raise ValueError(f"Неизвестный формат сохранения: {fmt}")
+
+        if fmt == "sqlite" and self._backend is not None and os.path.abspath(path) == self._backend.path:
+            self._backend.commit()
+            return
+
+        if delta and self._journal == (os.path.abspath(path), fmt) and self._save_delta(path, vehicle_refs):
+            return
+
+        _ensure_data_dir(path)
+        # Записи сериализуются по одной, поэтому весь набор данных в памяти не собирается.
+        vehicles = (v.to_dict() for v in self._vehicles.values())
+        drivers = (d.to_dict(vehicle_refs and self._owns_assigned_vehicle(d)) for d in self._drivers.values())
+
+        if fmt == "sqlite":
+            backend = SQLiteBackend(path)
+            try:
+                backend.write_company(self.name, vehicles, drivers)
+            finally:
+                backend.close()
+        elif fmt == "binary":
+            # Запись во временный файл с заменой: открытый через mmap снимок нельзя перезаписывать на месте.
+            import tempfile
+
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    dump_snapshot(f, self.name, vehicles, drivers, compress, index=not compress)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                dump_company(f, self.name, vehicles, drivers)
+
+        if fmt == "sqlite":
+            self._journal = None
+        elif delta:
+            start_journal(path)
+            self._journal = (os.path.abspath(path), fmt)
         else:
-            # Добавление директории data, если путь относительный и не содержит её.
-            if not os.path.isabs(path) and DATA_DIR not in path:
-                path = os.path.join(DATA_DIR, os.path.basename(path))
+            drop_journal(path)
+            self._journal = None
+        self._reset_changes(0)
+
+    def _save_delta(self, path: str, vehicle_refs: bool) -> bool:
+        """Дозапись изменений в журнал файла; False, если журнал пора свернуть в полный файл."""
+        ops: List[Tuple[str, Any]] = []
+        if self.name != self._journal_name:
+            ops.append(("name", self.name))
+        for vehicle_id in self._removed_vehicles:
+            ops.append(("-vehicles", vehicle_id))
+        for vehicle_id in self._dirty_vehicles:
+            v = self._vehicles.get(vehicle_id)
+            if v is None:
+                continue
+            data = v.to_dict()
+            if data["vehicle_id"] != vehicle_id:
+                ops.append(("-vehicles", vehicle_id))
+            ops.append(("vehicles", data))
+        for driver_id in self._removed_drivers:
+            ops.append(("-drivers", driver_id))
+        for driver_id in self._dirty_drivers:
+            d = self._drivers.get(driver_id)
+            if d is not None:
+                ops.append(("drivers", d.to_dict(vehicle_refs and self._owns_assigned_vehicle(d))))
 
-        data = {
-            "name": self.name,
-            "vehicles": [v.to_dict() for v in self._vehicles.values()],
-            "drivers": [d.to_dict() for d in self._drivers.values()],
-        }
+        if self._journal_records + len(ops) > JOURNAL_COMPACT_RATIO * (len(self._vehicles) + len(self._drivers)):
+            return False
+        if ops:
+            from infrastructure.journal import append_journal
+            append_journal(path, ops)
+        self._reset_changes(self._journal_records + len(ops))
+        return True
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _reset_changes(self, journal_records: int) -> None:
+        """Сброс учёта изменений после записи файла или журнала (или после загрузки)."""
+        self._dirty_vehicles.clear()
+        self._dirty_drivers.clear()
+        self._removed_vehicles.clear()
+        self._removed_drivers.clear()
+        self._journal_records = journal_records
+        self._journal_name = self.name
 
     @classmethod
-    def load(cls, path: Optional[str] = None) -> "TransportCompany":
-        """Загрузка данные компании из JSON-файла."""
-        if path is None:
-            path = os.path.join(DATA_DIR, "transport_company.json")
-        else:
-            # Добавление директории data, если путь относительный и не содержит её.
-            if not os.path.isabs(path) and DATA_DIR not in path:
-                path = os.path.join(DATA_DIR, os.path.basename(path))
+    def load(cls, path: Optional[str] = None,
+             vehicle_store: Optional[MutableMapping[str, Vehicle]] = None,
+             trusted: bool = False) -> "TransportCompany":
+        """Загрузка данных компании из JSON-файла, бинарного снимка или базы SQLite.
 
-        from domain.vehicle import Vehicle
-        from domain.driver import Driver
+        Формат определяется по содержимому файла. Загруженная из SQLite компания остаётся
+        подключённой к базе: дальнейшие изменения записываются в неё сразу. К JSON и снимку
+        применяется их журнал изменений (см. save с delta=True), если он есть.
+        trusted=True — файл записан самой компанией: ТС создаются без проверок и приведения
+        типов (см. Vehicle.from_dict), а индексы строятся при первом запросе, которому нужны.
+        Проверить данные можно отдельно методом validate.
+        """
+        path = _resolve_path(path)
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        comp = cls(data["name"])
+        import io
 
-        for vdata in data["vehicles"]:
-            v = Vehicle.from_dict(vdata)
-            comp._vehicles[v.vehicle_id] = v
+        from infrastructure.binary_snapshot import MAGIC, is_snapshot, iter_snapshot
+        from infrastructure.journal import read_journal
+        from infrastructure.json_stream import iter_company
+        from infrastructure.sqlite_backend import SQLITE_MAGIC, SQLiteBackend, is_sqlite
 
-        for ddata in data["drivers"]:
-            d = Driver.from_dict(ddata)
-            comp._drivers[d.driver_id] = d
+        comp = cls("", vehicle_store)
+        # Доверенная загрузка откладывает построение индексов до первого запроса, которому они нужны.
+        comp._indexed = not trusted
+        with open(path, "rb") as f:
+            head = f.read(max(len(MAGIC), len(SQLITE_MAGIC)))
+            if not is_sqlite(head):
+                f.seek(0)
+                events = iter_snapshot(f) if is_snapshot(head) else iter_company(io.TextIOWrapper(f, encoding="utf-8"))
+                journal = read_journal(path)
+                comp._load_events(events if journal is None else journal.merge(events), trusted)
+                comp._attach_journal(path, "binary" if is_snapshot(head) else "json", journal)
+                return comp
 
+        backend = SQLiteBackend(path)
+        try:
+            comp._load_events(backend.iter_company(), trusted)
+        except BaseException:
+            backend.close()
+            raise
+        comp._backend = backend
+        comp._attach_journal(path, "sqlite", None)
         return comp
 
-    def stats_capacity_by_type(self) -> Dict[str, int]:
-        """Возврат статистики суммарной вместимости по типам транспортных средств."""
-        res: Dict[str, int] = {}
+    @classmethod
+    def load_parallel(cls, path: Optional[str] = None, workers: Optional[int] = None, chunk_size: int = 10_000,
+                      vehicle_store: Optional[MutableMapping[str, Vehicle]] = None,
+                      executor: Optional["Executor"] = None) -> "TransportCompany":
+        """Загрузка компании с декодированием и полной проверкой записей частями в пуле процессов.
+
+        Части снимка с индексом процессы читают сами по смещениям; JSON, SQLite и снимки без
+        индекса читаются в текущем процессе, а пулу отправляются готовые записи. Порядок ТС и
+        водителей совпадает с load, индексы строятся при первом запросе. Ошибки записей
+        собираются в RecordsValidationError с номерами записей. workers=1 — та же работа без пула.
+        """
+        path = _resolve_path(path)
+
+        import io
+
+        from application.services.parallel_load import InlineExecutor, ParallelLoader
+        from infrastructure.binary_snapshot import MAGIC, MappedSnapshot, is_snapshot, iter_snapshot
+        from infrastructure.journal import read_journal
+        from infrastructure.json_stream import iter_company
+        from infrastructure.sqlite_backend import SQLITE_MAGIC, SQLiteBackend, is_sqlite
 
+        own_executor = executor is None
+        if own_executor:
+            workers = workers or os.cpu_count() or 1
+            if workers > 1:
+                # Модуль пула процессов (и multiprocessing) загружается только для параллельной загрузки.
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(workers)
+            else:
+                executor = InlineExecutor()
+
+        backend: Optional[SQLiteBackend] = None
+        journal: Optional["JournalDelta"] = None
+        fmt = "sqlite"
+        loader = ParallelLoader(executor, chunk_size)
+        try:
+            with open(path, "rb") as f:
+                head = f.read(max(len(MAGIC), len(SQLITE_MAGIC)))
+                if is_sqlite(head):
+                    backend = SQLiteBackend(path)
+                    loader.feed_events(backend.iter_company())
+                else:
+                    fmt = "binary" if is_snapshot(head) else "json"
+                    journal = read_journal(path)
+                    snapshot: Optional[MappedSnapshot] = None
+                    # Изменения из журнала применяются к потоку записей, поэтому снимок с журналом читается потоком.
+                    if is_snapshot(head) and journal is None:
+                        try:
+                            snapshot = MappedSnapshot(path)
+                        except InvalidVehicleError:
+                            # Сжатый снимок или снимок без индекса читается потоком.
+                            pass
+                    if snapshot is not None:
+                        try:
+                            loader.feed_snapshot(os.path.abspath(path), snapshot)
+                        finally:
+                            snapshot.close()
+                    else:
+                        f.seek(0)
+                        events = (iter_snapshot(f) if is_snapshot(head)
+                                  else iter_company(io.TextIOWrapper(f, encoding="utf-8")))
+                        loader.feed_events(events if journal is None else journal.merge(events))
+
+            if loader.name is None:
+                raise KeyError("name")
+            comp = cls(loader.name, vehicle_store)
+            # Записи уже проверены пулом; как и при доверенной загрузке, индексы строятся по первому запросу.
+            comp._indexed = False
+            comp._merge_chunks(loader.chunks())
+        except BaseException:
+            loader.cancel()
+            if backend is not None:
+                backend.close()
+            raise
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        comp._backend = backend
+        comp._attach_journal(path, fmt, journal)
+        return comp
+
+    def _merge_chunks(self, chunks: Iterable["Chunk"]) -> None:
+        """Наполнение компании проверенными частями записей через доверенные конструкторы.
+
+        После первой ошибки части только просматриваются, чтобы сообщить обо всех ошибках.
+        """
+        errors: List["RecordError"] = []
+        for kind, start, records, chunk_errors in chunks:
+            errors.extend(chunk_errors)
+            if errors:
+                continue
+
+            if kind == "vehicles":
+                for data in records:
+                    self._register_vehicle(Vehicle.from_dict(data, trusted=True))
+                continue
+
+            for i, data in enumerate(records, start):
+                ref = data.get("assigned_vehicle_id")
+                if ref is not None and ref not in self._vehicles:
+                    errors.append(("drivers", i, f"ТС водителя не найдено: {ref}"))
+                    continue
+                self._register_driver(Driver.from_dict(data, self._vehicles, trusted=True))
+
+        if errors:
+            raise RecordsValidationError(errors)
+
+    def attach_backend(self, path: str) -> None:
+        """Подключение базы SQLite: текущие данные записываются в неё целиком, далее изменения — по одному."""
+        path = _resolve_path(path)
+
+        from infrastructure.sqlite_backend import SQLiteBackend
+
+        _ensure_data_dir(path)
+        backend = SQLiteBackend(path)
+        backend.write_company(self.name, (v.to_dict() for v in self._vehicles.values()),
+                              (d.to_dict(self._owns_assigned_vehicle(d)) for d in self._drivers.values()))
+        if self._backend is not None:
+            self._backend.close()
+        self._backend = backend
+
+    def validate(self, executor: Optional["Executor"] = None, chunk_size: int = 10_000) -> None:
+        """Полная проверка данных компании (например, после load(trusted=True)).
+
+        Записи проверяются частями в executor, если он задан. При ошибках выбрасывается
+        RecordsValidationError с номерами записей в порядке обхода ТС и водителей.
+        """
+        from application.services.validation import validate_records
+
+        vehicles = [v.to_dict() for v in self._vehicles.values()]
+        drivers = [d.to_dict(self._owns_assigned_vehicle(d)) for d in self._drivers.values()]
+        errors = validate_records(vehicles, drivers, executor, chunk_size)
+        if errors:
+            raise RecordsValidationError(errors)
+
+    def _load_events(self, events: Iterable[Tuple[str, Any]], trusted: bool = False) -> None:
+        """Наполнение компании из потока пар (ключ, значение) формата iter_company."""
+        has_name = False
+        # Водители, чьи ТС встретились в файле позже них: ссылки разрешаются вторым проходом.
+        pending: List[Tuple[Driver, str]] = []
+
+        for key, item in events:
+            if key == "vehicles":
+                self._register_vehicle(Vehicle.from_dict(item, trusted))
+            elif key == "drivers":
+                ref = item.get("assigned_vehicle_id")
+                if ref is not None and ref not in self._vehicles:
+                    item = {k: v for k, v in item.items() if k != "assigned_vehicle_id"}
+                    d = Driver.from_dict(item, trusted=trusted)
+                    pending.append((d, ref))
+                else:
+                    d = Driver.from_dict(item, self._vehicles, trusted)
+                self._register_driver(d)
+            elif key == "name":
+                self.name = item
+                has_name = True
+
+        if not has_name:
+            raise KeyError("name")
+
+        for d, ref in pending:
+            v = self._vehicles.get(ref)
+            if v is None:
+                raise InvalidVehicleError(f"ТС водителя {d.driver_id} не найдено: {ref}")
+            d.assign_vehicle(v)
+            self._index_assignment(d.driver_id, ref)
+
+    @classmethod
+    def open_snapshot(cls, path: Optional[str] = None) -> "TransportCompany":
+        """Открытие бинарного снимка через mmap без загрузки парка.
+
+        ТС и водители создаются из снимка при первом обращении по id. Индексы поиска,
+        назначений и агрегаты строятся при первом вызове поиска или статистики.
+        """
+        path = _resolve_path(path, "transport_company.snap")
+
+        from application.services.lazy_store import LazySnapshotMap
+        from infrastructure.binary_snapshot import MappedSnapshot
+        from infrastructure.journal import JournalDelta, read_journal
+
+        snapshot = MappedSnapshot(path)
+        journal = read_journal(path)
+        delta = journal if journal is not None else JournalDelta()
+        comp = cls(snapshot.name if delta.name is None else delta.name)
+        comp._indexed = False
+        # Записи, изменённые по журналу, берутся из него, остальные — из снимка.
+        vehicle_puts, driver_puts = delta.puts["vehicles"], delta.puts["drivers"]
+
+        def load_vehicle(vehicle_id: str) -> Vehicle:
+            data = vehicle_puts.get(vehicle_id)
+            v = Vehicle.from_dict(snapshot.vehicle(vehicle_id) if data is None else data)
+            v._bind(comp)
+            return v
+
+        def load_driver(driver_id: str) -> Driver:
+            data = driver_puts.get(driver_id)
+            data = snapshot.driver(driver_id) if data is None else dict(data)
+            ref = data.get("assigned_vehicle_id")
+            if ref is not None and ref not in comp._vehicles:
+                # ТС удалено из парка после открытия: водитель получает свою копию, как при полной загрузке.
+                data["assigned_vehicle"] = snapshot.vehicle(data.pop("assigned_vehicle_id"))
+            d = Driver.from_dict(data, comp._vehicles)
+            d._bind(comp)
+            return d
+
+        comp._vehicles = LazySnapshotMap(snapshot.vehicle_offsets, load_vehicle)
+        comp._drivers = LazySnapshotMap(snapshot.driver_offsets, load_driver)
+
+        # Удалённые по журналу записи снимка помечаются, новые и повторно добавленные создаются сразу.
+        for key in delta.dropped["vehicles"]:
+            if key in comp._vehicles:
+                del comp._vehicles[key]
+        for key in delta.dropped["drivers"]:
+            if key in comp._drivers:
+                del comp._drivers[key]
+        for key, data in vehicle_puts.items():
+            if key not in comp._vehicles:
+                comp._register_vehicle(Vehicle.from_dict(data))
+        for key, data in driver_puts.items():
+            if key not in comp._drivers:
+                comp._register_driver(Driver.from_dict(data, comp._vehicles))
+
+        comp._attach_journal(path, "binary", journal)
+        return comp
+
+    def _attach_journal(self, path: str, fmt: str, journal: Optional["JournalDelta"]) -> None:
+        """Привязка загруженной компании к журналу файла: save(..., delta=True) будет дописывать его."""
+        self._journal = (os.path.abspath(path), fmt) if journal is not None else None
+        self._reset_changes(journal.records if journal is not None else 0)
+
+    def _ensure_indexes(self) -> None:
+        """Построение индексов и агрегатов по всему парку, если они отложены (ленивый снимок, доверенная загрузка)."""
+        if self._indexed:
+            return
+
+        self._indexed = True
         for v in self._vehicles.values():
-            t = v.__class__.__name__
-            res[t] = res.get(t, 0) + v.capacity
+            self._index_vehicle(v)
+        for d in self._drivers.values():
+            assigned = d.get_assigned_vehicle()
+            if assigned is not None and self._in_fleet(assigned):
+                self._index_assignment(d.driver_id, assigned.vehicle_id)
+
+    def _index_vehicle(self, vehicle: Vehicle) -> None:
+        """Добавление ТС в индексы поиска и агрегаты."""
+        self._model_index.add(vehicle.vehicle_id, vehicle.model)
+        self._vehicle_index.add(vehicle)
+        self._stats.add(vehicle)
+        coords = vehicle.coordinates
+        if coords is not None:
+            self._spatial.update(vehicle.vehicle_id, *coords)
+
+    def _register_vehicle(self, vehicle: Vehicle) -> None:
+        """Помещение ТС в хранилище с обновлением индексов."""
+        self._vehicles[vehicle.vehicle_id] = vehicle
+        self._dirty_vehicles[vehicle.vehicle_id] = None
+        if self._indexed:
+            self._index_vehicle(vehicle)
+        vehicle._bind(self)
+
+    def _unregister_vehicle(self, vehicle_id: str, vehicle: Vehicle) -> None:
+        """Изъятие ТС из хранилища и индексов (обратное _register_vehicle)."""
+        self._dirty_vehicles.pop(vehicle_id, None)
+        if self._indexed:
+            self._stats.remove(vehicle)
+        del self._vehicles[vehicle_id]
+        vehicle._bind(None)
+        self._model_index.remove(vehicle_id)
+        self._vehicle_index.remove(vehicle_id)
+        self._spatial.remove(vehicle_id)
+
+    def _unregister_driver(self, driver_id: str) -> None:
+        """Изъятие водителя из коллекции и индекса назначений (обратное _register_driver)."""
+        d = self._drivers.pop(driver_id)
+        d._bind(None)
+        self._dirty_drivers.pop(driver_id, None)
+        self._drop_assignment(driver_id)
+
+    def _detach_holders(self, vehicle_id: str, view: Vehicle) -> None:
+        """Замена представления удаляемого ТС у закреплённых водителей отвязанной копией."""
+        store = self._vehicles
+        copy: Optional[Vehicle] = None
+        for driver_id in self._drivers_of_vehicle.get(vehicle_id, ()):
+            d = self._drivers[driver_id]
+            assigned = d.get_assigned_vehicle()
+            if assigned is not None and store.owns(assigned) and assigned._row == view._row:
+                if copy is None:
+                    copy = store.detach(vehicle_id)
+                d._assigned_vehicle = copy
+
+    def _owns_assigned_vehicle(self, driver: Driver) -> bool:
+        """Проверка, что закреплённое за водителем ТС находится в парке компании."""
+        v = driver.get_assigned_vehicle()
+        return v is not None and self._in_fleet(v)
+
+    def _in_fleet(self, vehicle: Vehicle) -> bool:
+        """Проверка, что объект — само ТС парка, а не копия ТС (например, удалённого) с тем же id."""
+        if isinstance(self._vehicles, ColumnarVehicleStore):
+            return self._vehicles.owns(vehicle)
+        return self._vehicles.get(vehicle.vehicle_id) is vehicle
+
+    def _register_driver(self, driver: Driver) -> None:
+        """Помещение водителя в коллекцию с учётом закреплённого ТС."""
+        self._drivers[driver.driver_id] = driver
+        self._dirty_drivers[driver.driver_id] = None
+        driver._bind(self)
+        assigned = driver.get_assigned_vehicle()
+        if assigned is not None and self._indexed and self._in_fleet(assigned):
+            self._index_assignment(driver.driver_id, assigned.vehicle_id)
+
+    def _index_assignment(self, driver_id: str, vehicle_id: str) -> None:
+        """Запись назначения водителя в индекс."""
+        if not self._indexed:
+            return
+
+        self._drop_assignment(driver_id)
+        self._vehicle_of_driver[driver_id] = vehicle_id
+        self._drivers_of_vehicle.setdefault(vehicle_id, {})[driver_id] = None
+
+    def _drop_assignment(self, driver_id: str) -> None:
+        """Удаление назначения водителя из индекса."""
+        vehicle_id = self._vehicle_of_driver.pop(driver_id, None)
+        if vehicle_id is None:
+            return
+
+        drivers = self._drivers_of_vehicle[vehicle_id]
+        del drivers[driver_id]
+        if not drivers:
+            del self._drivers_of_vehicle[vehicle_id]
+
+    def _on_vehicle_changed(self, vehicle: Vehicle, field: str, old: Any, new: Any) -> None:
+        """Поддержка индексов (и подключённой базы) в актуальном состоянии при изменении полей ТС."""
+        if self._backend is not None and field != "location":
+            # Объект ещё может хранить старое значение (колоночные представления), поэтому оно подменяется.
+            data = vehicle.to_dict()
+            data[field] = new
+            self._backend.update_vehicle(old if field == "vehicle_id" else vehicle.vehicle_id, data)
+        if field != "location":
+            self._dirty_vehicles[old if field == "vehicle_id" else vehicle.vehicle_id] = None
+
+        if not self._indexed:
+            return
+
+        if field == "location":
+            coords = parse_location(new)
+            if coords is None:
+                self._spatial.remove(vehicle.vehicle_id)
+            else:
+                self._spatial.update(vehicle.vehicle_id, *coords)
+            return
+        if field == "model":
+            self._model_index.update(vehicle.vehicle_id, new)
+        elif field == "status":
+            self._vehicle_index.update_status(vehicle.vehicle_id, new)
+        elif field == "year":
+            self._vehicle_index.update_year(vehicle.vehicle_id, new)
+        self._stats.change(vehicle, field, old, new)
+
+    def _on_driver_changed(self, driver: Driver) -> None:
+        """Учёт изменения назначения водителя для журнала."""
+        self._dirty_drivers[driver.driver_id] = None
+
+    def stats_capacity_by_type(self, verify: bool = False) -> Dict[str, int]:
+        """Возврат статистики суммарной вместимости по типам транспортных средств.
+
+        verify=True дополнительно сверяет накопленные агрегаты с полным пересчётом по парку.
+        """
+        self._ensure_indexes()
+        if verify:
+            self._stats.verify(self._vehicles.values())
+        return self._stats.capacity_by_type()
+
+    def stats_by_type(self, verify: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Возврат агрегатов по типам ТС: количество, вместимость, грузоподъёмность, min/max год."""
+        self._ensure_indexes()
+        if verify:
+            self._stats.verify(self._vehicles.values())
+        return self._stats.by_type()
+
+    def calculate_costs(self, distances: Sequence[float]) -> Dict[str, List[float]]:
+        """Пакетный расчёт стоимости эксплуатации всех ТС для набора расстояний."""
+        from utils.vectorized import linear_costs
+
+        vehicles = list(self._vehicles.values())
+        terms = [v._cost_terms() for v in vehicles]
+        rows = iter(linear_costs([t for t in terms if t is not None], distances))
+
+        res: Dict[str, List[float]] = {}
+        for v, t in zip(vehicles, terms):
+            res[v.vehicle_id] = next(rows) if t is not None else [v.calculate_cost(d) for d in distances]
 
         return res
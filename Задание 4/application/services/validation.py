@@ -0,0 +1,121 @@
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.exceptions import InvalidVehicleError
+from domain.driver import Driver
+from domain.vehicle import Vehicle
+
+# Ошибка проверки записи: (раздел "vehicles" или "drivers", номер записи в разделе, описание).
+RecordError = Tuple[str, int, str]
+
+_ERRORS = (InvalidVehicleError, KeyError, TypeError, ValueError, AttributeError)
+
+
+def _describe(e: Exception) -> str:
+    """Текст ошибки проверки записи."""
+    if isinstance(e, KeyError):
+        return f"нет поля {e.args[0]!r}"
+    return f"{type(e).__name__}: {e}"
+
+
+def _check_vehicle(data: Dict[str, Any]) -> Optional[str]:
+    """Проверка записи ТС обычным конструктором; None, если запись корректна."""
+    try:
+        rebuilt = Vehicle.from_dict(data).to_dict()
+    except _ERRORS as e:
+        return _describe(e)
+    # Доверенная загрузка берёт значения как есть: запись должна совпадать с результатом обычной.
+    if rebuilt != data:
+        return "значения требуют приведения типов или неполны"
+    return None
+
+
+def validate_vehicles(records: Sequence[Dict[str, Any]], start: int = 0) -> List[RecordError]:
+    """Полная проверка записей ТС; start — номер первой записи в наборе.
+
+    Функция не зависит от состояния, поэтому части набора можно проверять в разных процессах.
+    """
+    errors: List[RecordError] = []
+    for i, data in enumerate(records, start):
+        message = _check_vehicle(data)
+        if message is not None:
+            errors.append(("vehicles", i, message))
+    return errors
+
+
+def validate_drivers(records: Sequence[Dict[str, Any]], start: int = 0) -> List[RecordError]:
+    """Полная проверка записей водителей, включая вложенные копии ТС.
+
+    Ссылки assigned_vehicle_id не проверяются: их разрешает сама загрузка.
+    """
+    errors: List[RecordError] = []
+    for i, data in enumerate(records, start):
+        try:
+            item = {k: v for k, v in data.items() if k != "assigned_vehicle_id"}
+            Driver.from_dict(item)
+        except _ERRORS as e:
+            errors.append(("drivers", i, _describe(e)))
+            continue
+
+        embedded = item.get("assigned_vehicle")
+        message = _check_vehicle(embedded) if embedded else None
+        if message is not None:
+            errors.append(("drivers", i, f"ТС водителя: {message}"))
+    return errors
+
+
+def normalize_vehicles(records: Sequence[Dict[str, Any]],
+                       start: int = 0) -> Tuple[List[Dict[str, Any]], List[RecordError]]:
+    """Проверка записей ТС обычным конструктором с приведением к формату to_dict.
+
+    Корректные записи пригодны для доверенной загрузки (Vehicle.from_dict(..., trusted=True)).
+    """
+    out: List[Dict[str, Any]] = []
+    errors: List[RecordError] = []
+    for i, data in enumerate(records, start):
+        try:
+            out.append(Vehicle.from_dict(data).to_dict())
+        except _ERRORS as e:
+            errors.append(("vehicles", i, _describe(e)))
+    return out, errors
+
+
+def normalize_drivers(records: Sequence[Dict[str, Any]],
+                      start: int = 0) -> Tuple[List[Dict[str, Any]], List[RecordError]]:
+    """Проверка записей водителей с приведением к формату to_dict; ссылки на ТС сохраняются как есть."""
+    out: List[Dict[str, Any]] = []
+    errors: List[RecordError] = []
+    for i, data in enumerate(records, start):
+        try:
+            ref = data.get("assigned_vehicle_id")
+            norm = Driver.from_dict({k: v for k, v in data.items() if k != "assigned_vehicle_id"}).to_dict()
+        except _ERRORS as e:
+            errors.append(("drivers", i, _describe(e)))
+            continue
+        if ref is not None:
+            del norm["assigned_vehicle"]
+            norm["assigned_vehicle_id"] = ref
+        out.append(norm)
+    return out, errors
+
+
+def validate_records(vehicles: Sequence[Dict[str, Any]], drivers: Sequence[Dict[str, Any]],
+                     executor: Optional[Executor] = None, chunk_size: int = 10_000) -> List[RecordError]:
+    """Проверка записей компании частями по chunk_size (в executor, если он задан).
+
+    Ошибки возвращаются в порядке записей независимо от порядка завершения частей.
+    """
+    if chunk_size < 1:
+        raise ValueError("Размер части должен быть положительным.")
+
+    jobs: List[Tuple[Callable[..., List[RecordError]], Sequence[Dict[str, Any]], int]] = []
+    for check, records in ((validate_vehicles, vehicles), (validate_drivers, drivers)):
+        for start in range(0, len(records), chunk_size):
+            jobs.append((check, records[start:start + chunk_size], start))
+
+    if executor is None:
+        results = [check(chunk, start) for check, chunk, start in jobs]
+    else:
+        futures = [executor.submit(check, chunk, start) for check, chunk, start in jobs]
+        results = [f.result() for f in futures]
+    return [e for part in results for e in part]
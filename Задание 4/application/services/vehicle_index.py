@@ -0,0 +1,135 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.meta import VehicleMeta
+from domain.vehicle import Vehicle
+
+# Ключи типа по классу ТС (кешируются: набор не меняется после создания класса).
+_TYPE_KEYS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _type_keys(klass: type) -> Tuple[str, ...]:
+    """Ключи реестра VehicleMeta для класса и его доменных предков (TrackableBus — и "bus")."""
+    keys = _TYPE_KEYS.get(klass)
+    if keys is None:
+        keys = _TYPE_KEYS[klass] = tuple(dict.fromkeys(
+            base.__name__.lower() for base in klass.__mro__
+            if VehicleMeta.registry.get(base.__name__.lower()) is base))
+    return keys
+
+
+class VehicleIndex:
+    """Вторичные индексы ТС по типу, статусу и году выпуска.
+
+    ТС индексируется под ключами своего типа и всех доменных типов-предков, поэтому
+    поиск по типу находит и подклассы (по "bus" — и TrackableBus).
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустых индексов."""
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_year: Dict[int, Set[str]] = {}
+        self._years: List[int] = []
+        # Текущие значения ключей по ТС, чтобы удалять записи без обращения к объекту.
+        self._keys: Dict[str, Tuple[Tuple[str, ...], str, int]] = {}
+        self._order: Dict[str, int] = {}
+        self._counter = 0
+
+    def add(self, vehicle: Vehicle) -> None:
+        """Добавление ТС в индексы (в конец порядка обхода)."""
+        vehicle_id = vehicle.vehicle_id
+        self.remove(vehicle_id)
+        self._order[vehicle_id] = self._counter
+        self._counter += 1
+
+        key = (_type_keys(type(vehicle)), vehicle.status, vehicle.year)
+        self._keys[vehicle_id] = key
+        for type_key in key[0]:
+            self._by_type.setdefault(type_key, set()).add(vehicle_id)
+        self._by_status.setdefault(key[1], set()).add(vehicle_id)
+        self._put_year(vehicle_id, key[2])
+
+    def remove(self, vehicle_id: str) -> None:
+        """Удаление ТС из индексов."""
+        key = self._keys.pop(vehicle_id, None)
+        if key is None:
+            return
+
+        del self._order[vehicle_id]
+        for type_key in key[0]:
+            self._discard(self._by_type, type_key, vehicle_id)
+        self._discard(self._by_status, key[1], vehicle_id)
+        self._drop_year(vehicle_id, key[2])
+
+    def update_status(self, vehicle_id: str, status: str) -> None:
+        """Перенос ТС в индексе статусов."""
+        key = self._keys.get(vehicle_id)
+        if key is None:
+            return
+
+        self._discard(self._by_status, key[1], vehicle_id)
+        self._by_status.setdefault(status, set()).add(vehicle_id)
+        self._keys[vehicle_id] = (key[0], status, key[2])
+
+    def update_year(self, vehicle_id: str, year: int) -> None:
+        """Перенос ТС в индексе годов выпуска."""
+        key = self._keys.get(vehicle_id)
+        if key is None:
+            return
+
+        self._drop_year(vehicle_id, key[2])
+        self._put_year(vehicle_id, year)
+        self._keys[vehicle_id] = (key[0], key[1], year)
+
+    def find(self, vehicle_type: Optional[str] = None, status: Optional[str] = None,
+             year_range: Optional[Tuple[int, int]] = None) -> List[str]:
+        """Возврат идентификаторов ТС, удовлетворяющих всем заданным условиям, в порядке добавления."""
+        sets: List[Set[str]] = []
+        if vehicle_type is not None:
+            sets.append(self._by_type.get(vehicle_type.lower(), set()))
+        if status is not None:
+            sets.append(self._by_status.get(status, set()))
+        if year_range is not None:
+            lo, hi = year_range
+            years = self._years[bisect_left(self._years, lo):bisect_right(self._years, hi)]
+            in_range: Set[str] = set()
+            for y in years:
+                in_range |= self._by_year[y]
+            sets.append(in_range)
+
+        if not sets:
+            return list(self._order)
+
+        sets.sort(key=len)
+        found = set(sets[0])
+        for s in sets[1:]:
+            found &= s
+            if not found:
+                return []
+
+        return sorted(found, key=self._order.__getitem__)
+
+    def _put_year(self, vehicle_id: str, year: int) -> None:
+        """Добавление ТС в индекс годов."""
+        ids = self._by_year.get(year)
+        if ids is None:
+            ids = self._by_year[year] = set()
+            insort(self._years, year)
+        ids.add(vehicle_id)
+
+    def _drop_year(self, vehicle_id: str, year: int) -> None:
+        """Удаление ТС из индекса годов."""
+        ids = self._by_year[year]
+        ids.discard(vehicle_id)
+        if not ids:
+            del self._by_year[year]
+            del self._years[bisect_left(self._years, year)]
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, vehicle_id: str) -> None:
+        """Удаление ТС из множества по ключу с очисткой пустых множеств."""
+        ids = index[key]
+        ids.discard(vehicle_id)
+        if not ids:
+            del index[key]
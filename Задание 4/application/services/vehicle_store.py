@@ -0,0 +1,288 @@
+import sys
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.exceptions import InvalidVehicleError
+from domain.vehicle import Vehicle
+
+# Поля, общие для всех ТС. Порядок совпадает с порядком параметров Vehicle.__init__.
+_BASE_FIELDS = ("vehicle_id", "model", "year", "capacity", "status")
+_NO_LOCATION = "N/A"
+
+# Представления кешируются на уровне модуля: класс представления не зависит от конкретного хранилища.
+_VIEW_CLASSES: Dict[type, type] = {}
+
+
+def _column_property(field: str, base: Optional[property]) -> property:
+    """Создание свойства, читающего и записывающего значение в колонку хранилища."""
+
+    def fget(self: Any) -> Any:
+        return self._store._get(self._live_row(), field)
+
+    def fset(self: Any, value: Any) -> None:
+        row = self._live_row()
+        # Валидация делегируется исходному сеттеру доменной модели.
+        if base is not None and base.fset is not None:
+            base.fset(self, value)
+        self._store._set(row, field, value)
+
+    return property(fget, fset, doc=base.__doc__ if base is not None else None)
+
+
+def _bind_view(self: Any, observer: Optional[Any]) -> None:
+    """Подключение наблюдателя: у представлений он общий и хранится в хранилище."""
+    if observer is not None:
+        self._store._observer = observer
+
+
+def _live_row(self: Any) -> int:
+    """Номер строки представления; строка удалённого ТС (даже занятая другим ТС) недействительна."""
+    row = self._row
+    if self._store._generations[row] != self._generation:
+        raise InvalidVehicleError("ТС удалено из хранилища, представление недействительно.")
+    return row
+
+
+def _view_class(klass: type, extra_fields: Tuple[str, ...]) -> type:
+    """Возврат (с созданием при необходимости) класса представления для типа ТС."""
+    view = _VIEW_CLASSES.get(klass)
+    if view is not None:
+        return view
+
+    namespace: Dict[str, Any] = {
+        "__slots__": ("_store", "_row", "_generation"),
+        "__module__": klass.__module__,
+        "__doc__": f"Лёгкое представление {klass.__name__} поверх колоночного хранилища.",
+        "_source_class": klass,
+        "_last_location": _column_property("_last_location", None),
+        "_observer": property(lambda self: self._store._observer),
+        "_bind": _bind_view,
+        "_live_row": _live_row,
+    }
+    for field in _BASE_FIELDS + extra_fields:
+        base = getattr(klass, field, None)
+        namespace[field] = _column_property(field, base if isinstance(base, property) else None)
+
+    # Имя с подчёркиванием не попадает в VehicleMeta.registry, после создания
+    # классу возвращается исходное имя, чтобы to_dict и статистика видели настоящий тип.
+    view = type(klass)(f"_{klass.__name__}View", (klass,), namespace)
+    view.__name__ = klass.__name__
+    view.__qualname__ = klass.__qualname__
+    _VIEW_CLASSES[klass] = view
+    return view
+
+
+class ColumnarVehicleStore(MutableMapping):
+    """Колоночное хранилище ТС: параллельные типизированные массивы вместо объектов Vehicle.
+
+    Объекты ТС не хранятся: при обращении по идентификатору выдаётся лёгкое
+    представление, которое читает и пишет поля напрямую в колонки.
+    Строки удалённых ТС используются повторно, поэтому у каждой строки есть номер поколения:
+    представление удалённого ТС при обращении выбрасывает InvalidVehicleError, а не читает
+    данные ТС, занявшего строку позже. Копию ТС, не зависящую от хранилища, возвращает detach.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого хранилища."""
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        # Поколение строки увеличивается при удалении ТС из неё.
+        self._generations = array("Q")
+
+        self._ids: List[Optional[str]] = []
+        self._types = array("B")
+        self._models: List[Optional[str]] = []
+        self._years = array("i")
+        self._capacities = array("q")
+        self._statuses = array("B")
+        # Местоположение известно лишь у малой части парка, поэтому колонка разреженная.
+        self._locations: Dict[int, str] = {}
+        self._extras: Dict[str, Any] = {
+            "route_number": [],
+            "cargo_capacity": array("d"),
+            "license_plate": [],
+        }
+
+        self._classes: List[type] = []
+        self._class_codes: Dict[type, int] = {}
+        self._class_extras: List[Tuple[str, ...]] = []
+        self._status_table: List[str] = []
+        self._status_codes: Dict[str, int] = {}
+        self._observer: Optional[Any] = None
+
+    def __getitem__(self, vehicle_id: str) -> Vehicle:
+        """Возврат представления ТС по идентификатору."""
+        row = self._rows[vehicle_id]
+        code = self._types[row]
+        klass = _view_class(self._classes[code], self._class_extras[code])
+        view = klass.__new__(klass)
+        view._store = self
+        view._row = row
+        view._generation = self._generations[row]
+        return view
+
+    def __setitem__(self, vehicle_id: str, vehicle: Vehicle) -> None:
+        """Копирование полей ТС в колонки хранилища."""
+        if self.owns(vehicle) and self._rows.get(vehicle_id) == vehicle._row:
+            return
+
+        values = self._encode(vehicle)
+        row = self._rows.get(vehicle_id)
+        if row is None:
+            row = self._allocate()
+            self._rows[vehicle_id] = row
+        self._write_row(row, vehicle_id, values)
+
+    def __delitem__(self, vehicle_id: str) -> None:
+        """Удаление ТС и освобождение строки для повторного использования."""
+        row = self._rows.pop(vehicle_id)
+        self._ids[row] = None
+        self._models[row] = None
+        self._locations.pop(row, None)
+        for column in self._extras.values():
+            if isinstance(column, list):
+                column[row] = None
+        self._generations[row] += 1
+        self._free.append(row)
+
+    def __iter__(self) -> Iterator[str]:
+        """Итерация по идентификаторам ТС."""
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        """Количество ТС в хранилище."""
+        return len(self._rows)
+
+    def __contains__(self, vehicle_id: object) -> bool:
+        """Проверка наличия ТС без создания представления."""
+        return vehicle_id in self._rows
+
+    def owns(self, vehicle: Vehicle) -> bool:
+        """Проверка, что vehicle — действительное представление ТС этого хранилища."""
+        return (getattr(vehicle, "_store", None) is self
+                and self._generations[vehicle._row] == vehicle._generation)
+
+    def check(self, vehicle: Vehicle) -> None:
+        """Проверка, что поля ТС помещаются в колонки (InvalidVehicleError — нет), без записи."""
+        self._encode(vehicle)
+
+    def detach(self, vehicle_id: str) -> Vehicle:
+        """Создание обычного объекта ТС с текущими значениями строки (без связи с хранилищем)."""
+        view = self[vehicle_id]
+        copy = Vehicle.from_dict(view.to_dict())
+        copy._last_location = view._last_location
+        return copy
+
+    def _encode(self, vehicle: Vehicle) -> Tuple[Any, ...]:
+        """Подготовка значений строки с проверкой, что они помещаются в колонки."""
+        klass = getattr(type(vehicle), "_source_class", type(vehicle))
+        code = self._class_codes.get(klass)
+        if code is None:
+            code = len(self._classes)
+            if code > 255:
+                raise InvalidVehicleError("Слишком много типов ТС для колоночного хранилища.")
+            self._classes.append(klass)
+            self._class_codes[klass] = code
+            self._class_extras.append(tuple(vehicle._extra_dict()))
+            _view_class(klass, self._class_extras[code])
+
+        year, capacity = vehicle.year, vehicle.capacity
+        if not isinstance(year, int) or not isinstance(capacity, int):
+            raise InvalidVehicleError("Год выпуска и вместимость должны быть целыми числами.")
+        if not (-2 ** 31 <= year < 2 ** 31 and -2 ** 63 <= capacity < 2 ** 63):
+            raise InvalidVehicleError("Год выпуска или вместимость вне допустимого диапазона.")
+
+        extras = vehicle._extra_dict()
+        for name, value in extras.items():
+            if isinstance(self._extras.get(name), array) and not isinstance(value, (int, float)):
+                raise InvalidVehicleError(f"Поле {name} должно быть числом.")
+
+        return (code, vehicle.vehicle_id, vehicle.model, year, capacity,
+                self._status_code(vehicle.status), vehicle._last_location, extras)
+
+    def _allocate(self) -> int:
+        """Выделение строки: повторное использование освобождённой или добавление новой."""
+        if self._free:
+            return self._free.pop()
+
+        self._ids.append(None)
+        self._generations.append(0)
+        self._types.append(0)
+        self._models.append(None)
+        self._years.append(0)
+        self._capacities.append(0)
+        self._statuses.append(0)
+        for column in self._extras.values():
+            column.append(0.0 if isinstance(column, array) else None)
+        return len(self._ids) - 1
+
+    def _write_row(self, row: int, key: str, values: Tuple[Any, ...]) -> None:
+        """Запись подготовленных значений в строку."""
+        code, vehicle_id, model, year, capacity, status, location, extras = values
+        self._types[row] = code
+        # Ключ и идентификатор обычно совпадают — храним одну строку вместо двух.
+        self._ids[row] = key if key == vehicle_id else vehicle_id
+        self._models[row] = sys.intern(model) if type(model) is str else model
+        self._years[row] = year
+        self._capacities[row] = capacity
+        self._statuses[row] = status
+        self._set(row, "_last_location", location)
+        for name, column in self._extras.items():
+            column[row] = extras.get(name, 0.0 if isinstance(column, array) else None)
+        for name, value in extras.items():
+            if name not in self._extras:
+                self._extra_column(name)[row] = value
+
+    def _extra_column(self, name: str) -> List[Any]:
+        """Создание колонки для дополнительного поля нового типа ТС."""
+        column: List[Any] = [None] * len(self._ids)
+        self._extras[name] = column
+        return column
+
+    def _status_code(self, status: str) -> int:
+        """Кодирование статуса в номер из таблицы статусов."""
+        code = self._status_codes.get(status)
+        if code is None:
+            code = len(self._status_table)
+            if code > 255:
+                raise InvalidVehicleError("Слишком много различных статусов ТС.")
+            self._status_table.append(status)
+            self._status_codes[status] = code
+        return code
+
+    def _get(self, row: int, field: str) -> Any:
+        """Чтение значения поля из колонки."""
+        if field == "vehicle_id":
+            return self._ids[row]
+        if field == "model":
+            return self._models[row]
+        if field == "year":
+            return self._years[row]
+        if field == "capacity":
+            return self._capacities[row]
+        if field == "status":
+            return self._status_table[self._statuses[row]]
+        if field == "_last_location":
+            return self._locations.get(row, _NO_LOCATION)
+        return self._extras[field][row]
+
+    def _set(self, row: int, field: str, value: Any) -> None:
+        """Запись значения поля в колонку."""
+        if field == "vehicle_id":
+            self._ids[row] = value
+        elif field == "model":
+            self._models[row] = sys.intern(value) if type(value) is str else value
+        elif field == "year":
+            self._years[row] = value
+        elif field == "capacity":
+            self._capacities[row] = value
+        elif field == "status":
+            self._statuses[row] = self._status_code(value)
+        elif field == "_last_location":
+            if value == _NO_LOCATION:
+                self._locations.pop(row, None)
+            else:
+                self._locations[row] = value
+        else:
+            self._extras[field][row] = value
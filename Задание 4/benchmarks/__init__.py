@@ -0,0 +1 @@
+"""Бенчмарки транспортной компании. Запуск из директории проекта: python3 -m benchmarks.<имя>."""
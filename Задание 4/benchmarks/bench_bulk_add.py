@@ -0,0 +1,45 @@
+import logging
+import os
+import sys
+import tempfile
+
+from application.services import TransportCompany
+from benchmarks.common import ADMIN, make_drivers, make_vehicles, timed
+
+
+def main(n: int = 50_000) -> None:
+    """Сравнение поштучного и пакетного добавления ТС и водителей (с записью лога в файл)."""
+    log = logging.getLogger("transport_company")
+    saved_level, saved_handlers = log.level, log.handlers[:]
+    log.setLevel(logging.INFO)
+    log.handlers = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = logging.FileHandler(os.path.join(tmp, "bench.log"), encoding="utf-8")
+        log.addHandler(handler)
+        try:
+            print(f"ТС: {n}, водителей: {n}")
+            vehicles, drivers = list(make_vehicles(n)), list(make_drivers(n))
+
+            company = TransportCompany("BenchCo")
+            with timed("add_vehicle × n"):
+                for v in vehicles:
+                    company.add_vehicle(ADMIN, v)
+            with timed("add_driver × n"):
+                for d in drivers:
+                    company.add_driver(ADMIN, d)
+
+            company = TransportCompany("BenchCo")
+            with timed("add_vehicles"):
+                company.add_vehicles(ADMIN, (v for v in vehicles))
+            with timed("add_drivers"):
+                company.add_drivers(ADMIN, (d for d in drivers))
+        finally:
+            log.removeHandler(handler)
+            handler.close()
+            log.setLevel(saved_level)
+            log.handlers = saved_handlers
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,27 @@
+import random
+import sys
+
+from application.patterns import DepartmentHead, Director, MaintenanceRequest, Mechanic
+from benchmarks.common import timed
+from domain import Bus
+
+
+def main(n_requests: int = 100_000) -> None:
+    """Сравнение рекурсивной цепочки обслуживания со скомпилированной таблицей порогов."""
+    bus = Bus("B-1", "LiAZ-5292", 2015, 90, "12")
+    rnd = random.Random(1)
+    requests = [MaintenanceRequest(bus, round(rnd.uniform(0, 20000), 2), f"Заявка {i}") for i in range(n_requests)]
+
+    chain = Mechanic()
+    chain.set_next(DepartmentHead()).set_next(Director())
+    print(f"Заявок: {n_requests}")
+
+    with timed("рекурсивная цепочка"):
+        expected = [chain.handle(r) for r in requests]
+    with timed("compile + handle_many"):
+        got = chain.compile().handle_many(requests)
+    assert got == expected
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,150 @@
+import os
+import random
+import sys
+import threading
+import time
+from typing import Callable, List
+
+from application.services import ConcurrentTransportCompany, TransportCompany
+from application.services.locks import RWLock, StripedLock
+from benchmarks.common import ADMIN, build_company
+from core.exceptions import StatsMismatchError
+
+_STATUSES = ("idle", "on_route", "maintenance")
+
+
+def _workload(company: TransportCompany, ids: List[str], ops: int, write_share: float,
+              seed: int) -> Callable[[], None]:
+    """Поток операций: чтения (поиск, выборки, водители) и доля изменений статуса и года."""
+    rnd = random.Random(seed)
+    plan = [(rnd.random() < write_share, rnd.choice(ids), rnd.randrange(4)) for _ in range(ops)]
+
+    def run() -> None:
+        for write, vehicle_id, kind in plan:
+            if write:
+                company.update_vehicle(ADMIN, vehicle_id, status=_STATUSES[kind % 3], year=2000 + kind)
+            elif kind == 0:
+                company.search_by_model("Octavia")
+            elif kind == 1:
+                company.find_vehicles("bus", "on_route", (2010, 2012))
+            elif kind == 2:
+                company.driver_for_vehicle(vehicle_id)
+            else:
+                company.get_driver("D-0")
+
+    return run
+
+
+def _measure(company: TransportCompany, threads: int, ops: int, write_share: float) -> float:
+    """Выполнение ops операций, поровну разделённых между threads потоками; возвращает операций в секунду."""
+    ids = list(company._vehicles)
+    runs = [_workload(company, ids, ops // threads, write_share, seed) for seed in range(threads)]
+    workers = [threading.Thread(target=run) for run in runs]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return ops / (time.perf_counter() - start)
+
+
+def _hold(enter: Callable[[int], object], threads: int, holds: int, pause: float) -> float:
+    """Захваты блокировки из threads потоков с ожиданием pause внутри (как ввод-вывод без GIL); захватов в секунду."""
+    def run(worker: int) -> None:
+        for i in range(holds):
+            with enter(worker * holds + i):
+                time.sleep(pause)
+
+    workers = [threading.Thread(target=run, args=(w,)) for w in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return threads * holds / (time.perf_counter() - start)
+
+
+def _stress(company: TransportCompany, writes: int, reads: int) -> int:
+    """Изменения вместимости и статуса из двух потоков и сверка снимков читателем; число расхождений.
+
+    Читатель под блокировкой чтения сверяет агрегаты с полным пересчётом, а выборку по статусу —
+    со статусами найденных ТС (компания должна быть ConcurrentTransportCompany). Интервал переключения потоков уменьшен, чтобы чаще прерывать запись.
+    """
+    ids = list(company._vehicles)
+    done = threading.Event()
+    mismatches = [0]
+
+    def write(seed: int) -> None:
+        rnd = random.Random(seed)
+        for _ in range(writes):
+            company.update_vehicle(ADMIN, rnd.choice(ids), capacity=rnd.randrange(1, 200),
+                                   status=rnd.choice(_STATUSES))
+
+    def read() -> None:
+        for i in range(reads):
+            if done.is_set():
+                break
+            status = _STATUSES[i % 3]
+            try:
+                company.stats_capacity_by_type(verify=True)
+            except StatsMismatchError:
+                mismatches[0] += 1
+            # Возвращаемые ТС живые, поэтому их статус сверяется под той же блокировкой чтения.
+            with company._lock.read():
+                if any(v.status != status for v in TransportCompany.find_vehicles(company, status=status)):
+                    mismatches[0] += 1
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writers = [threading.Thread(target=write, args=(seed,)) for seed in range(2)]
+        reader = threading.Thread(target=read)
+        for t in writers + [reader]:
+            t.start()
+        for t in writers:
+            t.join()
+        done.set()
+        reader.join()
+    finally:
+        sys.setswitchinterval(interval)
+    return mismatches[0]
+
+
+def main(n: int = 20_000, ops: int = 10_000) -> None:
+    """Масштабирование блокировок и смешанная нагрузка по числу потоков; проверка индексов после неё."""
+    print(f"ТС: {n}, операций: {ops}, процессоров: {os.cpu_count()}")
+
+    # Участки под блокировкой, ожидающие вне GIL: видно, какие захваты идут одновременно.
+    mutex, rw, stripes = threading.Lock(), RWLock(), StripedLock()
+    kinds = (("один мьютекс", lambda key: mutex), ("RWLock, чтение", lambda key: rw.read()),
+             ("RWLock, запись", lambda key: rw.write()), ("полосы по id", lambda key: stripes.lock_for(f"B-{key}")))
+    print("Захваты с ожиданием 2 мс внутри, захватов/с:")
+    print(f"{'потоков':<16}" + "".join(f"{t:>10}" for t in (1, 2, 4, 8)))
+    for label, enter in kinds:
+        print(f"{label:<16}" + "".join(f"{_hold(enter, t, 50, 0.002):10,.0f}" for t in (1, 2, 4, 8)))
+
+    plain = build_company(n)
+    company = build_company(n, company=ConcurrentTransportCompany("BenchCo"))
+
+    for write_share in (0.0, 0.1, 0.5):
+        label = f"изменений {write_share:.0%}"
+        base = _measure(plain, 1, ops, write_share)
+        print(f"{label}: без блокировок, 1 поток {base:12,.0f} оп/с")
+        for threads in (1, 2, 4, 8):
+            rate = _measure(company, threads, ops, write_share)
+            print(f"{'':<14} потоков: {threads:<9} {rate:12,.0f} оп/с ({rate / base:5.2f}× без блокировок)")
+
+    # Индексы и агрегаты после одновременных изменений совпадают с полным пересчётом.
+    company.stats_by_type(verify=True)
+    found = {v.vehicle_id for v in company.find_vehicles(status="on_route")}
+    assert found == {v.vehicle_id for v in company.get_all_vehicles() if v.status == "on_route"}
+    print("Индексы согласованы с парком")
+
+    # Читатели не должны видеть поля ТС, расходящиеся с индексами и агрегатами.
+    mismatches = _stress(build_company(300, company=ConcurrentTransportCompany("StressCo")), 5_000, 3_000)
+    print(f"Нагрузочная проверка снимков: расхождений {mismatches}")
+    assert mismatches == 0
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+import time
+
+from application.services import TransportCompany
+from benchmarks.common import ADMIN, build_company, timed
+
+
+def main(n: int = 100_000, changes: int = 100) -> None:
+    """Полное сохранение против дозаписи журнала после небольшого числа изменений; загрузка с журналом."""
+    company = build_company(n)
+    ids = list(company._vehicles)
+    print(f"ТС: {n}, водителей: {len(company._drivers)}, изменений между сохранениями: {changes}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in ("json", "snap"):
+            path = os.path.join(tmp, f"company.{ext}")
+            with timed(f"{ext}: полное сохранение"):
+                company.save(path, delta=True)
+
+            rounds = 10
+            start = time.perf_counter()
+            for r in range(rounds):
+                for i in range(changes):
+                    company._vehicles[ids[(r * changes + i) % n]].status = ("on_route", "idle")[r % 2]
+                company.assign_driver_to_vehicle(ADMIN, f"D-{r}", ids[-1 - r])
+                company.save(path, delta=True)
+            elapsed = (time.perf_counter() - start) / rounds
+            print(f"{ext + ': сохранение изменений (delta)':<40} {elapsed:8.4f} с")
+            print(f"  журнал: {os.path.getsize(path + '.journal') / 1024:,.0f} КБ, "
+                  f"файл: {os.path.getsize(path) / 1024 / 1024:,.1f} МБ")
+
+            with timed(f"{ext}: загрузка снимка с журналом"):
+                loaded = TransportCompany.load(path)
+            assert loaded._vehicles[ids[0]].status == company._vehicles[ids[0]].status
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,76 @@
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from application.services import DispatchOptimizer, TransportCompany
+from benchmarks.common import ADMIN, make_vehicles
+from domain import Address, Driver
+
+# Права водителей: в основном одна категория, часть — несколько.
+_LICENSES = ("B", "C", "D", "B", "C", "B, C", "C, D", "B, C, D")
+
+
+def _company(n_vehicles: int, n_drivers: int) -> TransportCompany:
+    """Компания с n_vehicles ТС и n_drivers водителями без назначений."""
+    company = TransportCompany("BenchCo")
+    company.add_vehicles(ADMIN, make_vehicles(n_vehicles))
+    company.add_drivers(ADMIN, (Driver(f"Водитель {i}", f"D-{i}", _LICENSES[i % len(_LICENSES)],
+                                       Address("Казань", "Ленина", str(i % 200))) for i in range(n_drivers)))
+    return company
+
+
+def _greedy(company: TransportCompany, costs: Dict[str, float]) -> Tuple[int, float]:
+    """Жадный проход: каждый водитель по очереди берёт самое дешёвое свободное ТС по своим правам (O(n²))."""
+    pool = sorted(company.get_all_vehicles(), key=lambda v: costs[v.vehicle_id])
+    free: List[Optional[object]] = list(pool)
+    assigned, total = 0, 0.0
+    for d in company.get_all_drivers():
+        for i, v in enumerate(free):
+            if v is not None and d.can_drive(v):
+                free[i] = None
+                assigned += 1
+                total += costs[v.vehicle_id]
+                break
+    return assigned, round(total, 2)
+
+
+def main(distance_km: float = 120.0) -> None:
+    """Оптимальный подбор водителей против жадного прохода; пакетное применение против поштучного (с SQLite)."""
+    for n in (1_000, 5_000, 50_000):
+        company = _company(n, n)
+        optimizer = DispatchOptimizer(company)
+        plan = optimizer.plan(distance_km)
+        print(f"ТС: {n}, водителей: {n}")
+        print(f"  {'оптимизатор':<30} {plan.elapsed:8.3f} с, назначено {plan.assigned}, стоимость {plan.total_cost:,.2f}")
+        if n > 5_000:
+            continue
+
+        costs = {vid: row[0] for vid, row in company.calculate_costs([distance_km]).items()}
+        start = time.perf_counter()
+        assigned, total = _greedy(company, costs)
+        elapsed = time.perf_counter() - start
+        print(f"  {'жадный проход':<30} {elapsed:8.3f} с, назначено {assigned}, стоимость {total:,.2f}")
+
+        # Назначения записываются в подключённую базу: поштучно — транзакция на водителя.
+        with tempfile.TemporaryDirectory() as tmp:
+            copy = _company(n, n)
+            copy.attach_backend(os.path.join(tmp, "single.db"))
+            start = time.perf_counter()
+            for driver_id, vehicle_id in plan.changes.items():
+                if vehicle_id is not None:
+                    copy.assign_driver_to_vehicle(ADMIN, driver_id, vehicle_id)
+            print(f"  {'поштучное назначение (SQLite)':<30} {time.perf_counter() - start:8.3f} с")
+            copy._backend.close()
+
+            company.attach_backend(os.path.join(tmp, "bulk.db"))
+            start = time.perf_counter()
+            optimizer.apply(ADMIN, plan)
+            print(f"  {'пакетное назначение (SQLite)':<30} {time.perf_counter() - start:8.3f} с")
+            company._backend.close()
+        assert not optimizer.plan(distance_km).changes
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:2]))
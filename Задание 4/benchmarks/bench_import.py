@@ -0,0 +1,53 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+# Бюджет времени импорта, мс (минимум из нескольких запусков). Без ленивой загрузки пакетов
+# импорт занимал 65–100 мс (с NumPy), после — около 35 мс.
+BUDGET_MS: Dict[str, float] = {"cli": 50.0, "main": 50.0}
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _importtime(module: str, cwd: str) -> List[Tuple[str, int, int]]:
+    """Импорт модуля в отдельном процессе с -X importtime: (модуль, собственное, суммарное время, мкс)."""
+    env = dict(os.environ, PYTHONPATH=_ROOT)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2))))
+    return rows
+
+
+def main(runs: int = 5) -> None:
+    """Время импорта cli и main против бюджета; проверка, что импорт не создаёт data/ и logs/."""
+    failed = False
+    with tempfile.TemporaryDirectory() as cwd:
+        for module, budget in BUDGET_MS.items():
+            _importtime(module, cwd)  # прогрев: компиляция .pyc
+            best = min((_importtime(module, cwd) for _ in range(runs)), key=lambda rows: rows[-1][2])
+            total = best[-1][2] / 1000
+            ok = total <= budget
+            failed |= not ok
+            print(f"{'import ' + module:<40} {total:8.1f} мс (бюджет {budget:.0f} мс){'' if ok else '  ПРЕВЫШЕН'}")
+            for name, own, _ in sorted(best, key=lambda r: -r[1])[:5]:
+                print(f"  {name:<38} {own / 1000:8.1f} мс")
+
+        created = [d for d in ("data", "logs") if os.path.exists(os.path.join(cwd, d))]
+        if created:
+            failed = True
+            print(f"Импорт создал директории: {', '.join(created)}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
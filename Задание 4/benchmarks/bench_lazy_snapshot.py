@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from application.services import TransportCompany
+from benchmarks.common import build_company, timed
+
+
+def main(n_vehicles: int = 100_000, working_set: int = 100) -> None:
+    """Сравнение полной загрузки снимка с ленивым открытием через mmap и обращением к части парка."""
+    company = build_company(n_vehicles)
+    ids = list(company._vehicles)[::max(1, n_vehicles // working_set)][:working_set]
+    print(f"ТС: {n_vehicles}, водителей: {len(company._drivers)}, рабочий набор: {len(ids)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "company.snap")
+        company.save(path)
+        del company
+
+        for label, opener in (("полная загрузка", TransportCompany.load),
+                              ("ленивое открытие", TransportCompany.open_snapshot)):
+            tracemalloc.start()
+            with timed(f"открытие, {label}"):
+                loaded = opener(path)
+            with timed(f"чтение {len(ids)} ТС, {label}"):
+                for vid in ids:
+                    loaded._vehicles[vid].calculate_cost(100)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{'пик памяти, ' + label:<40} {peak / 1024 / 1024:8.2f} МБ")
+            del loaded
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,46 @@
+import random
+import sys
+import time
+
+from application.services import LocationIngestor, TransportCompany
+from benchmarks.common import ADMIN
+from domain import ReportableTaxi, TrackableBus
+from domain.geo import format_location
+
+
+def main(n: int = 20_000, seconds: int = 60, window: float = 10.0) -> None:
+    """Поток отметок GPS (раз в секунду от каждого ТС): поштучный update_location против окон приёма."""
+    rnd = random.Random(1)
+    fleet = [TrackableBus(f"TB-{i}", "LiAZ-5292", 2015, 90, str(i % 300)) if i % 2
+             else ReportableTaxi(f"RT-{i}", "Kia Rio", 2019, 4, f"P{i:06d}") for i in range(n)]
+    ids = [v.vehicle_id for v in fleet]
+    pings = []
+    for t in range(seconds):
+        for vehicle_id in ids:
+            # Небольшой разброс времени: часть отметок приходит не по порядку.
+            pings.append((vehicle_id, format_location(55.55 + rnd.random() * 0.36, 37.30 + rnd.random() * 0.64),
+                          t + rnd.random()))
+    print(f"ТС: {n}, отметок: {len(pings)}, окно: {window} с")
+
+    company = TransportCompany("BenchCo")
+    company.add_vehicles(ADMIN, fleet)
+    vehicles = company._vehicles
+    start = time.perf_counter()
+    for vehicle_id, location, _ in pings:
+        vehicles[vehicle_id].update_location(location)
+    elapsed = time.perf_counter() - start
+    print(f"{'update_location на каждую отметку':<40} {elapsed:8.3f} с ({len(pings) / elapsed:,.0f}/с)")
+
+    ingestor = LocationIngestor(company, window)
+    batch = 5_000
+    for i in range(0, len(pings), batch):
+        ingestor.submit(pings[i:i + batch])
+    ingestor.flush()
+    stats = ingestor.stats
+    print(f"{'LocationIngestor':<40} {stats.busy:8.3f} с ({stats.throughput:,.0f}/с)")
+    print(f"  окон: {stats.flushes}, записано: {stats.applied}, объединено: {stats.coalesced}, "
+          f"опоздавших: {stats.late}, неизвестных ТС: {stats.unknown}")
+
+
+if __name__ == "__main__":
+    main(*(t(a) for t, a in zip((int, int, float), sys.argv[1:4])))
@@ -0,0 +1,75 @@
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+
+from application.services import TransportCompany
+from benchmarks.common import ADMIN, make_drivers, make_vehicles
+from infrastructure.config import BatchingFileHandler
+from infrastructure.log_queue import BatchingQueueListener, MergingQueueHandler
+
+
+def _run(n: int, label: str) -> float:
+    """Поштучное добавление n ТС и n водителей с назначением (сообщение в лог на каждое действие)."""
+    vehicles, drivers = list(make_vehicles(n)), list(make_drivers(n))
+    company = TransportCompany("BenchCo")
+    start = time.perf_counter()
+    for v in vehicles:
+        company.add_vehicle(ADMIN, v)
+    company.add_drivers(ADMIN, drivers)
+    for v, d in zip(vehicles, drivers):
+        company.assign_driver_to_vehicle(ADMIN, d.driver_id, v.vehicle_id)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f} с ({2 * n / elapsed:,.0f} сообщений/с)")
+    return start
+
+
+def main(n: int = 20_000) -> None:
+    """Добавление ТС с логированием: синхронные обработчики, файл через очередь пачками, отключённый уровень."""
+    log = logging.getLogger("transport_company")
+    saved_level, saved_handlers = log.level, log.handlers[:]
+    formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+    print(f"ТС: {n}, водителей: {n} (консоль — в {os.devnull})")
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w", encoding="utf-8") as devnull:
+        try:
+            log.setLevel(logging.DEBUG)
+
+            # Прежняя схема: запись в консоль и файл в вызывающем потоке.
+            handlers = [logging.StreamHandler(devnull), logging.FileHandler(os.path.join(tmp, "sync.log"),
+                                                                            encoding="utf-8")]
+            for h in handlers:
+                h.setFormatter(formatter)
+            log.handlers = handlers
+            _run(n, "синхронные обработчики")
+            for h in handlers:
+                h.close()
+
+            # Как в infrastructure.config: консоль пишется сразу, запись для файла ставится в очередь
+            # и пишется пачками потоком слушателя.
+            handlers = [logging.StreamHandler(devnull), BatchingFileHandler(os.path.join(tmp, "queue.log"),
+                                                                            encoding="utf-8")]
+            for h in handlers:
+                h.setFormatter(formatter)
+            q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            listener = BatchingQueueListener(q, handlers[1])
+            log.handlers = [handlers[0], MergingQueueHandler(q)]
+            listener.start()
+            start = _run(n, "консоль сразу, файл через очередь")
+            listener.stop()
+            total = time.perf_counter() - start
+            print(f"{'  с дозаписью очереди':<40} {total:8.3f} с")
+            for h in handlers:
+                h.close()
+
+            log.setLevel(logging.WARNING)
+            _run(n, "уровень INFO отключён")
+        finally:
+            log.handlers = saved_handlers
+            log.setLevel(saved_level)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,63 @@
+import gc
+import sys
+import tracemalloc
+from typing import Callable, List
+
+from domain import Address, Bus, Driver, Taxi, Truck
+
+
+class _DictLayout:
+    """ТС с атрибутами в __dict__ — раскладка доменных моделей до перехода на __slots__."""
+
+    def __init__(self, vehicle_id: str) -> None:
+        """Присваивание атрибутов в том же порядке, что и в Vehicle/Bus (словари разделяют ключи)."""
+        self._Vehicle__vehicle_id = vehicle_id
+        self._Vehicle__model = "MAZ-203"
+        self._Vehicle__year = 2015
+        self._Vehicle__capacity = 90
+        self._Vehicle__status = "idle"
+        self._last_location = "N/A"
+        self._observer = None
+        self._Bus__route_number = "12"
+
+
+def _dict_vehicle(i: int, vehicle_id: str) -> _DictLayout:
+    """ТС с атрибутами в __dict__."""
+    return _DictLayout(vehicle_id)
+
+
+def _slotted_vehicle(i: int, vehicle_id: str):
+    """ТС доменной модели (по типу в зависимости от номера)."""
+    kind = i % 3
+    if kind == 0:
+        return Bus(vehicle_id, "MAZ-203", 2015, 90, "12")
+    if kind == 1:
+        return Truck(vehicle_id, "MAZ-203", 2015, 2, 20.0)
+    return Taxi(vehicle_id, "MAZ-203", 2015, 4, "A000AA")
+
+
+def _measure(label: str, factory: Callable[[int, str], object], ids: List[str]) -> None:
+    """Печать байт на объект, выделенных при создании len(ids) объектов (строки id созданы заранее)."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(i, vid) for i, vid in enumerate(ids)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Список ссылок на объекты в размер объекта не входит.
+    per_object = (size - sys.getsizeof(objects)) / len(objects)
+    print(f"{label:<40} {per_object:8.1f} Б/объект")
+
+
+def main(n: int = 1_000_000) -> None:
+    """Память на объект доменной модели: __dict__ против __slots__."""
+    ids = [f"V-{i}" for i in range(n)]
+    print(f"Объектов: {n}")
+    _measure("ТС, раскладка с __dict__", _dict_vehicle, ids)
+    _measure("ТС, __slots__", _slotted_vehicle, ids)
+
+    address = Address("Казань", "Ленина", "1")
+    _measure("водитель, __slots__", lambda i, vid: Driver("Водитель", vid, "B", address), ids[:n // 10])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,28 @@
+import os
+import sys
+import tempfile
+
+from application.services import TransportCompany
+from benchmarks.common import build_company, timed
+
+
+def main(n_vehicles: int = 200_000, max_workers: int = 0) -> None:
+    """Масштабирование load_parallel по числу процессов в сравнении с обычной загрузкой."""
+    max_workers = max_workers or os.cpu_count() or 1
+    company = build_company(n_vehicles)
+    print(f"ТС: {n_vehicles}, водителей: {len(company._drivers)}, ядер: {os.cpu_count()}")
+
+    workers = sorted({1, 2, 4, 8, max_workers} & set(range(1, max_workers + 1)))
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in (".snap", ".json"):
+            path = os.path.join(tmp, "company" + ext)
+            company.save(path)
+            with timed(f"load, {ext}"):
+                TransportCompany.load(path)
+            for n in workers:
+                with timed(f"load_parallel, {ext}, процессов: {n}"):
+                    TransportCompany.load_parallel(path, workers=n)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
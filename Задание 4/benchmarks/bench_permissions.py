@@ -0,0 +1,63 @@
+import sys
+import time
+from typing import Any, Callable, List
+
+from application.services import TransportCompany
+from benchmarks.common import ADMIN
+from core.exceptions import PermissionDeniedError
+from domain.user import User
+from utils.decorators import check_permissions
+
+
+def _legacy_check_permissions(required_roles: List[str]):
+    """Прежняя реализация декоратора (импорты, isinstance и пересечение множеств на каждом вызове)."""
+    req = set(required_roles)
+
+    def decorator(func):
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            from domain.user import User
+            from application.services.transport_company import TransportCompany
+
+            user = kwargs.get("user")
+            if user is None:
+                if len(args) > 1 and isinstance(args[0], TransportCompany) and isinstance(args[1], User):
+                    user = args[1]
+            if user is None or not isinstance(user, User):
+                raise PermissionDeniedError("Отсутствует пользователь для проверки прав.")
+            if not (set(user.roles) & req):
+                raise PermissionDeniedError(f"Недостаточно прав. Требуются роли из: {sorted(req)}")
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _per_call(func: Callable, company: TransportCompany, user: User, n: int) -> float:
+    """Среднее время вызова в наносекундах."""
+    start = time.perf_counter()
+    for _ in range(n):
+        func(company, user)
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def main(n_calls: int = 1_000_000) -> None:
+    """Накладные расходы проверки прав на один вызов."""
+    company = TransportCompany("BenchCo")
+    roles = ["admin", "manager", "dispatcher"]
+
+    def noop(self: TransportCompany, user: User) -> None:
+        """Пустая операция."""
+
+    variants = (
+        ("без проверки", noop),
+        ("прежний check_permissions", _legacy_check_permissions(roles)(noop)),
+        ("check_permissions (битовая маска)", check_permissions(roles)(noop)),
+    )
+    print(f"Вызовов: {n_calls}")
+    for label, func in variants:
+        print(f"{label:<40} {_per_call(func, company, ADMIN, n_calls):8.1f} нс/вызов")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+
+from application.services import TransportCompany
+from benchmarks.common import build_company, timed
+
+
+def main(n_vehicles: int = 100_000) -> None:
+    """Сравнение размера файла и времени save/load для JSON и бинарного снимка."""
+    company = build_company(n_vehicles)
+    print(f"ТС: {n_vehicles}, водителей: {len(company._drivers)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = (
+            ("JSON", "company.json", {}),
+            ("бинарный снимок", "company.snap", {}),
+            ("бинарный снимок + gzip", "company_gz.snap", {"compress": True}),
+        )
+        for label, filename, kwargs in variants:
+            path = os.path.join(tmp, filename)
+            with timed(f"save, {label}"):
+                company.save(path, **kwargs)
+            with timed(f"load, {label}"):
+                TransportCompany.load(path)
+            print(f"{'размер, ' + label:<40} {os.path.getsize(path) / 1024 / 1024:8.2f} МБ")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
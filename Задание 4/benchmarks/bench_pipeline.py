@@ -0,0 +1,44 @@
+import asyncio
+import random
+import sys
+
+from application.patterns import DepartmentHead, Director, MaintenanceRequest, Mechanic
+from application.services.maintenance_pipeline import FakeApprover, run_pipeline
+from benchmarks.common import timed
+from domain import Bus
+
+_DELAYS = {"Mechanic": 0.002, "DepartmentHead": 0.01, "Director": 0.05}
+
+
+async def _serial(chain: Mechanic, requests: list, approver: FakeApprover) -> None:
+    """Последовательное согласование: каждая заявка ждёт ответа службы перед следующей."""
+    for r in requests:
+        node = chain
+        while node is not None and not node._handle(r):
+            node = node._next
+        if node is not None:
+            await approver.approve(node, r)
+
+
+def main(n_requests: int = 500) -> None:
+    """Сравнение последовательного согласования заявок с асинхронным конвейером."""
+    bus = Bus("B-1", "LiAZ-5292", 2015, 90, "12")
+    rnd = random.Random(1)
+    requests = [MaintenanceRequest(bus, rnd.choice((300, 300, 300, 1500, 1500, 9000)), f"Заявка {i}")
+                for i in range(n_requests)]
+    chain = Mechanic()
+    chain.set_next(DepartmentHead()).set_next(Director())
+    print(f"Заявок: {n_requests}, задержки службы: {_DELAYS}")
+
+    with timed("последовательно"):
+        asyncio.run(_serial(chain, requests, FakeApprover(_DELAYS)))
+    with timed("конвейер (очередь 50, по 4 на уровень)"):
+        _, metrics = run_pipeline(chain, requests, FakeApprover(_DELAYS), queue_size=50,
+                                  concurrency={"Mechanic": 4, "DepartmentHead": 4, "Director": 4})
+
+    for level, s in metrics.summary().items():
+        print(f"{level:<16} n={s['count']:<5} p50={s['p50'] * 1000:7.1f} мс  p95={s['p95'] * 1000:7.1f} мс")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,33 @@
+import sys
+from itertools import chain
+
+from application.services.simulation import FleetSimulation
+from benchmarks.common import make_vehicles
+from domain import ReportableTaxi, TrackableBus
+from domain.route_graph import RouteGraph
+from utils.vectorized import numpy
+
+
+def main(n_vehicles: int = 10_000, days: float = 30.0) -> None:
+    """Моделирование месяца работы парка: время, число событий и итоги по типам ТС."""
+    tracked = n_vehicles // 10
+    fleet = list(chain(
+        make_vehicles(n_vehicles - 2 * tracked),
+        (TrackableBus(f"TB-{i}", "LiAZ-5292", 2015, 90, str(i % 300)) for i in range(tracked)),
+        (ReportableTaxi(f"RT-{i}", "Kia Rio", 2019, 4, f"P{i:06d}") for i in range(tracked)),
+    ))
+    sim = FleetSimulation(fleet, RouteGraph.grid(12, 12), seed=1)
+    report = sim.run(days)
+
+    print(f"ТС: {len(fleet)} (с отслеживанием: {2 * tracked}), суток: {days}, "
+          f"NumPy: {'да' if numpy() is not None else 'нет'}")
+    print(f"{'время моделирования':<40} {report.elapsed:8.1f} с")
+    print(f"{'событий':<40} {report.events:8d} ({report.events / report.elapsed:,.0f}/с)")
+    print(f"{'заявок на ТО':<40} {len(report.maintenance):8d}")
+    for tag, row in sorted(report.by_type().items()):
+        print(f"  {tag:<14} рейсов {row['trips']:>9} пробег {row['km']:>12,.0f} км "
+              f"стоимость {row['cost']:>14,.2f} ТО {row['maintenance']:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main(*(t(a) for t, a in zip((int, float), sys.argv[1:3])))
@@ -0,0 +1,51 @@
+import random
+import sys
+import time
+
+from application.services import TransportCompany
+from benchmarks.common import ADMIN
+from domain import ReportableTaxi, TrackableBus
+from domain.geo import format_location, haversine_km
+
+
+def main(n: int = 20_000, updates: int = 200_000, queries: int = 1_000) -> None:
+    """Поток обновлений местоположения и запросы ближайших ТС: индекс против полного перебора."""
+    rnd = random.Random(1)
+    company = TransportCompany("BenchCo")
+    company.add_vehicles(ADMIN, (TrackableBus(f"TB-{i}", "LiAZ-5292", 2015, 90, str(i % 300)) if i % 2
+                                 else ReportableTaxi(f"RT-{i}", "Kia Rio", 2019, 4, f"P{i:06d}")
+                                 for i in range(n)))
+    fleet = list(company._vehicles.values())
+
+    # Город около 40 × 40 км.
+    def point():
+        return 55.55 + rnd.random() * 0.36, 37.30 + rnd.random() * 0.64
+
+    moves = [(fleet[rnd.randrange(n)], format_location(*point())) for _ in range(updates)]
+    start = time.perf_counter()
+    for v, location in moves:
+        v.update_location(location)
+    elapsed = time.perf_counter() - start
+    print(f"ТС: {n}, обновлений: {updates}")
+    print(f"{'update_location':<40} {elapsed:8.3f} с ({updates / elapsed:,.0f}/с)")
+
+    targets = [point() for _ in range(queries)]
+    for label, query in (("nearest(k=5)", lambda lat, lon: company.nearest(lat, lon, 5)),
+                         ("within_radius(1 км)", lambda lat, lon: company.within_radius(lat, lon, 1.0))):
+        start = time.perf_counter()
+        for lat, lon in targets:
+            query(lat, lon)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<40} {elapsed / queries * 1e6:8.0f} мкс/запрос")
+
+    sample = targets[:max(1, queries // 20)]
+    start = time.perf_counter()
+    for lat, lon in sample:
+        sorted((haversine_km(lat, lon, *v.coordinates), v.vehicle_id)
+               for v in fleet if v.coordinates is not None)[:5]
+    elapsed = time.perf_counter() - start
+    print(f"{'перебор всех ТС (k=5)':<40} {elapsed / len(sample) * 1e6:8.0f} мкс/запрос")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:4]))
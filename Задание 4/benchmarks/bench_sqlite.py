@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+
+from application.services import TransportCompany
+from benchmarks.common import ADMIN, build_company, timed
+from domain import Bus
+
+
+def main(n_vehicles: int = 100_000, changes: int = 100) -> None:
+    """Сравнение полного сохранения в JSON с записью изменений в SQLite по одному."""
+    company = build_company(n_vehicles)
+    print(f"ТС: {n_vehicles}, водителей: {len(company._drivers)}, изменений: {changes}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "company.json")
+        with timed("save, JSON (полная перезапись)"):
+            company.save(json_path)
+
+        with timed("attach_backend (пакетная вставка)"):
+            company.attach_backend(os.path.join(tmp, "company.db"))
+
+        with timed(f"{changes} × (add_vehicle + save), SQLite"):
+            for i in range(changes):
+                company.add_vehicle(ADMIN, Bus(f"N-{i}", "MAZ-203", 2020, 90, "7"))
+                company.save()
+
+        with timed("load, SQLite"):
+            TransportCompany.load(os.path.join(tmp, "company.db"))
+        with timed("load, JSON"):
+            TransportCompany.load(json_path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
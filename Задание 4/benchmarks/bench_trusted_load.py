@@ -0,0 +1,34 @@
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from application.services import TransportCompany
+from benchmarks.common import build_company, timed
+
+
+def main(n_vehicles: int = 100_000, workers: int = os.cpu_count() or 1) -> None:
+    """Сравнение обычной и доверенной загрузки (с отложенными индексами) и вариантов полной проверки."""
+    company = build_company(n_vehicles)
+    print(f"ТС: {n_vehicles}, водителей: {len(company._drivers)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in (".json", ".snap"):
+            path = os.path.join(tmp, "company" + ext)
+            company.save(path)
+            with timed(f"load, {ext}"):
+                TransportCompany.load(path)
+            with timed(f"load(trusted=True), {ext}"):
+                loaded = TransportCompany.load(path, trusted=True)
+            with timed(f"первый поиск после trusted, {ext}"):
+                loaded.search_by_model("MAZ")
+
+    with timed("validate, последовательно"):
+        loaded.validate()
+    with ProcessPoolExecutor(workers) as pool:
+        with timed(f"validate, процессов: {workers}"):
+            loaded.validate(pool)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,59 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from application.services import TransportCompany
+from domain import Address, Bus, Driver, Taxi, Truck, User, Vehicle
+
+ADMIN = User("bench_admin", ["admin"])
+
+# Логирование каждого действия в бенчмарках заглушается, чтобы измерять саму операцию.
+logging.getLogger("transport_company").setLevel(logging.WARNING)
+
+_MODELS = ("LiAZ-5292", "MAZ-203", "Volvo FH", "KAMAZ-5490", "Skoda Octavia", "Hyundai Solaris")
+
+
+def build_company(n_vehicles: int, n_drivers: Optional[int] = None,
+                  company: Optional[TransportCompany] = None) -> TransportCompany:
+    """Создание компании с n_vehicles ТС (поровну каждого типа) и водителями на части из них."""
+    if company is None:
+        company = TransportCompany("BenchCo")
+    if n_drivers is None:
+        n_drivers = n_vehicles // 2
+
+    company.add_vehicles(ADMIN, make_vehicles(n_vehicles))
+
+    ids: List[str] = list(company._vehicles)
+    company.add_drivers(ADMIN, make_drivers(n_drivers))
+    for i in range(n_drivers):
+        company.assign_driver_to_vehicle(ADMIN, f"D-{i}", ids[i % len(ids)])
+
+    return company
+
+
+def make_vehicles(n: int, prefix: str = "") -> Iterator[Vehicle]:
+    """Генерация n ТС (поровну каждого типа)."""
+    for i in range(n):
+        model = _MODELS[i % len(_MODELS)]
+        kind = i % 3
+        if kind == 0:
+            yield Bus(f"{prefix}B-{i}", model, 2000 + i % 25, 40 + i % 80, str(i % 300))
+        elif kind == 1:
+            yield Truck(f"{prefix}T-{i}", model, 2000 + i % 25, 2, float(i % 40))
+        else:
+            yield Taxi(f"{prefix}X-{i}", model, 2000 + i % 25, 4, f"A{i:06d}")
+
+
+def make_drivers(n: int, prefix: str = "") -> Iterator[Driver]:
+    """Генерация n водителей без закреплённых ТС."""
+    for i in range(n):
+        yield Driver(f"Водитель {i}", f"{prefix}D-{i}", "BCD"[i % 3], Address("Казань", "Ленина", str(i % 200)))
+
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    """Замер и печать времени выполнения блока."""
+    start = time.perf_counter()
+    yield
+    print(f"{label:<40} {time.perf_counter() - start:8.3f} с")
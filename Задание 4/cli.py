@@ -10,6 +10,8 @@ from domain import User, Address, Driver
 from infrastructure.config import logger
 from infrastructure.factories import VehicleFactory
 
+SNAPSHOT_FILE = "transport_company.snap"
+
 
 def _input_nonempty(prompt: str) -> str:
     """Запрос непустой строки у пользователя."""
@@ -186,12 +188,28 @@ def stats_cli(company: TransportCompany) -> None:
 
 def save_company_cli(company: TransportCompany) -> None:
     """Сохранение данных компании."""
-    company.save()
-    print("Данные компании сохранены в data/transport_company.json")
+    # Дозапись изменений в журнал снимка; снимок переписывается целиком, когда журнал разрастается.
+    company.save(SNAPSHOT_FILE, delta=True)
+    print(f"Данные компании сохранены в data/{SNAPSHOT_FILE}")
 
 
 def load_or_create_company() -> TransportCompany:
     """Попытка загрузки компанию, в противном случае создание новой."""
+    try:
+        # Снимок открывается лениво: ТС и водители читаются из файла по мере обращения к ним.
+        company = TransportCompany.open_snapshot(SNAPSHOT_FILE)
+        logger.info("Компания открыта из снимка.")
+        print(f"Компания открыта из data/{SNAPSHOT_FILE}.")
+        return company
+    except FileNotFoundError:
+        pass
+    except InvalidVehicleError as e:
+        # Сжатый снимок или снимок без индекса смещений не открывается лениво — он читается целиком.
+        logger.info("Снимок не открывается лениво (%s), выполняется полная загрузка.", e)
+        company = TransportCompany.load(SNAPSHOT_FILE)
+        print(f"Компания загружена из data/{SNAPSHOT_FILE}.")
+        return company
+
     try:
         company = TransportCompany.load()
         logger.info("Компания загружена из файла.")
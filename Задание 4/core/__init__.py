@@ -1,17 +1,21 @@
 """Базовые классы и интерфейсы транспортной компании."""
-from core.interfaces import Trackable, Reportable
-from core.exceptions import InvalidVehicleError, PermissionDeniedError, DriverNotFoundError
-from core.mixins import LoggingMixin, NotificationMixin
-from core.meta import VehicleMeta
+from utils.lazy import lazy_exports
 
-__all__ = [
-    "Trackable",
-    "Reportable",
-    "InvalidVehicleError",
-    "PermissionDeniedError",
-    "DriverNotFoundError",
-    "LoggingMixin",
-    "NotificationMixin",
-    "VehicleMeta",
-]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "Trackable": "core.interfaces",
+    "Reportable": "core.interfaces",
+    "InvalidVehicleError": "core.exceptions",
+    "RecordsValidationError": "core.exceptions",
+    "PermissionDeniedError": "core.exceptions",
+    "DriverNotFoundError": "core.exceptions",
+    "StatsMismatchError": "core.exceptions",
+    "LoggingMixin": "core.mixins",
+    "NotificationMixin": "core.mixins",
+    "VehicleMeta": "core.meta",
+    "RoleRegistry": "core.roles",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,10 +1,30 @@
+from typing import List, Tuple
+
+
 class InvalidVehicleError(ValueError):
     """Исключение, которое выбрасывается, если ТС содержит некорректные данные."""
 
 
+class RecordsValidationError(InvalidVehicleError):
+    """Исключение, которое выбрасывается, если записи файла компании не прошли проверку.
+
+    errors — список (раздел "vehicles" или "drivers", номер записи в разделе, описание) в порядке записей.
+    """
+
+    def __init__(self, errors: List[Tuple[str, int, str]]) -> None:
+        """Формирование сообщения по первым ошибкам."""
+        self.errors = errors
+        shown = "; ".join(f"{section}[{i}]: {message}" for section, i, message in errors[:5])
+        super().__init__(f"Ошибок проверки: {len(errors)}. {shown}")
+
+
 class PermissionDeniedError(PermissionError):
     """Исключение, которое выбрасывается при отсутствии прав доступа."""
 
 
 class DriverNotFoundError(LookupError):
     """Исключение, которое выбрасывается, если водитель не найден."""
+
+
+class StatsMismatchError(RuntimeError):
+    """Исключение, которое выбрасывается, если накопленная статистика расходится с пересчётом."""
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class Trackable(ABC):
     """Интерфейс отслеживания местоположения транспортного средства."""
 
+    __slots__ = ()
+
     @abstractmethod
     def track_location(self) -> str:
         """Возврат строки с информацией о текущем местоположении ТС."""
@@ -13,6 +15,8 @@ class Trackable(ABC):
 class Reportable(ABC):
     """Интерфейс генерации отчётов по рейсам/поездкам."""
 
+    __slots__ = ()
+
     @abstractmethod
     def generate_report(self) -> str:
         """Возврат строки с отчётом по рейсу."""
@@ -1,4 +1,5 @@
 import logging
+from typing import Any
 
 logger = logging.getLogger("transport_company")
 
@@ -6,14 +7,20 @@ logger = logging.getLogger("transport_company")
 class LoggingMixin:
     """Добавление логирования действий с ТС."""
 
-    def log_action(self, message: str) -> None:
-        """Логирование действий с транспортным средством."""
-        logger.info(f"[LOG] {message}")
+    __slots__ = ()
+
+    def log_action(self, message: str, *args: Any) -> None:
+        """Логирование действий с транспортным средством (args подставляются в message по %, лениво)."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[LOG] " + message, *args)
 
 
 class NotificationMixin:
     """Добавление отправки уведомлений."""
 
-    def send_notification(self, message: str) -> None:
-        """Отправка уведомления."""
-        logger.info(f"[NOTIFY] {message}")
+    __slots__ = ()
+
+    def send_notification(self, message: str, *args: Any) -> None:
+        """Отправка уведомления (args подставляются в message по %, лениво)."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[NOTIFY] " + message, *args)
@@ -0,0 +1,22 @@
+from typing import Dict, Iterable
+
+
+class RoleRegistry:
+    """Реестр ролей: каждой роли при первой встрече назначается свой бит маски."""
+    bits: Dict[str, int] = {}
+
+    @classmethod
+    def bit(cls, role: str) -> int:
+        """Возврат бита роли (с регистрацией новой роли)."""
+        bit = cls.bits.get(role)
+        if bit is None:
+            bit = cls.bits[role] = 1 << len(cls.bits)
+        return bit
+
+    @classmethod
+    def mask(cls, roles: Iterable[str]) -> int:
+        """Возврат битовой маски набора ролей."""
+        mask = 0
+        for role in roles:
+            mask |= cls.bit(role)
+        return mask
@@ -1,18 +1,20 @@
 """Доменные модели транспортной компании."""
-from .user import User
-from .address import Address
-from .vehicle import Vehicle, Bus, Truck, Taxi, TrackableBus, ReportableTaxi
-from .driver import Driver
+from utils.lazy import lazy_exports
 
-__all__ = [
-    "User",
-    "Address",
-    "Vehicle",
-    "Bus",
-    "Truck",
-    "Taxi",
-    "TrackableBus",
-    "ReportableTaxi",
-    "Driver",
-]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "User": "domain.user",
+    "Address": "domain.address",
+    "Vehicle": "domain.vehicle",
+    "Bus": "domain.vehicle",
+    "Truck": "domain.vehicle",
+    "Taxi": "domain.vehicle",
+    "TrackableBus": "domain.vehicle",
+    "ReportableTaxi": "domain.vehicle",
+    "Driver": "domain.driver",
+    "RouteGraph": "domain.route_graph",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -4,6 +4,8 @@ from typing import Dict
 class Address:
     """Класс для представления адреса водителя."""
 
+    __slots__ = ("city", "street", "house")
+
     def __init__(self, city: str, street: str, house: str) -> None:
         """Инициализация адреса."""
         self.city = city
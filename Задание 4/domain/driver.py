@@ -1,12 +1,24 @@
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any, FrozenSet, Mapping
+
+from core.exceptions import InvalidVehicleError
 
 from domain.address import Address
 from domain.vehicle import Vehicle
 
 
+# Кириллические буквы, совпадающие по начертанию с латинскими категориями прав, и Д -> D.
+_CATEGORY_LETTERS = str.maketrans("АВСДЕМ", "ABCDEM")
+# Категория прав целиком (B, C1, CE, D1E); категории разделяются запятыми, "+" и пробелами.
+_CATEGORY_TOKEN = re.compile(r"[ABCDEM]1?E?")
+_CATEGORY_SEPARATORS = re.compile(r"[\s,+]+")
+
+
 class Driver:
     """Класс для представления водителя транспортной компании."""
 
+    __slots__ = ("name", "driver_id", "license_type", "address", "_assigned_vehicle", "_observer")
+
     def __init__(self, name: str, driver_id: str, license_type: str, address: Address,
                  assigned_vehicle: Optional[Vehicle] = None) -> None:
         """Инициализация водителя."""
@@ -15,35 +27,85 @@ class Driver:
         self.license_type = license_type
         self.address = address
         self._assigned_vehicle = assigned_vehicle
+        # Наблюдатель изменений назначения (компания): метод _on_driver_changed(driver).
+        self._observer: Optional[Any] = None
+
+    def _bind(self, observer: Optional[Any]) -> None:
+        """Подключение (или отключение при None) наблюдателя изменений назначения."""
+        self._observer = observer
 
     def assign_vehicle(self, vehicle: Vehicle) -> None:
         """Закрепление транспортного средства за водителем."""
         self._assigned_vehicle = vehicle
+        if self._observer is not None:
+            self._observer._on_driver_changed(self)
 
     def remove_vehicle(self) -> None:
         """Открепление транспортного средства от водителя."""
         self._assigned_vehicle = None
+        if self._observer is not None:
+            self._observer._on_driver_changed(self)
+
+    @property
+    def license_categories(self) -> FrozenSet[str]:
+        """Категории прав водителя из строки license_type ("B", "C+E", "B, C, D", "CE").
+
+        Категория с прицепом (CE, C1E) даёт и категорию без него (C, C1). Строка, в которой есть
+        что-то кроме категорий и разделителей ("B (стаж 3 года)"), не даёт ни одной категории.
+        """
+        categories = set()
+        for token in _CATEGORY_SEPARATORS.split(self.license_type.upper().translate(_CATEGORY_LETTERS)):
+            if not token:
+                continue
+            if not _CATEGORY_TOKEN.fullmatch(token):
+                return frozenset()
+            categories.add(token)
+            if len(token) > 1 and token.endswith("E"):
+                categories.add(token[:-1])
+        return frozenset(categories)
+
+    def can_drive(self, vehicle: Vehicle) -> bool:
+        """Проверка, что категории прав водителя допускают управление ТС."""
+        return vehicle.LICENSE_CATEGORY is not None and vehicle.LICENSE_CATEGORY in self.license_categories
 
     def get_assigned_vehicle(self) -> Optional[Vehicle]:
         """Возвращение закреплённого транспортного средства."""
         return self._assigned_vehicle
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Преобразование водителя в словарь для сериализации."""
-        return {
+    def to_dict(self, vehicle_ref: bool = False) -> Dict[str, Any]:
+        """Преобразование водителя в словарь для сериализации.
+
+        vehicle_ref=True сохраняет вместо копии ТС только ссылку assigned_vehicle_id.
+        """
+        data = {
             "name": self.name,
             "driver_id": self.driver_id,
             "license_type": self.license_type,
             "address": self.address.to_dict(),
-            "assigned_vehicle": self._assigned_vehicle.to_dict() if self._assigned_vehicle else None
         }
+        if vehicle_ref and self._assigned_vehicle:
+            data["assigned_vehicle_id"] = self._assigned_vehicle.vehicle_id
+        else:
+            data["assigned_vehicle"] = self._assigned_vehicle.to_dict() if self._assigned_vehicle else None
+        return data
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Driver":
-        """Создание водителя из словаря."""
+    def from_dict(cls, data: Dict[str, Any], vehicles: Optional[Mapping[str, Vehicle]] = None,
+                  trusted: bool = False) -> "Driver":
+        """Создание водителя из словаря.
+
+        Ссылка assigned_vehicle_id разрешается по таблице vehicles уже загруженных ТС;
+        trusted передаётся в Vehicle.from_dict для вложенной копии ТС.
+        """
         from domain.vehicle import Vehicle
         addr = Address.from_dict(data["address"])
-        veh = Vehicle.from_dict(data["assigned_vehicle"]) if data.get("assigned_vehicle") else None
+        ref = data.get("assigned_vehicle_id")
+        if ref is not None:
+            if vehicles is None or ref not in vehicles:
+                raise InvalidVehicleError(f"ТС водителя не найдено: {ref}")
+            veh = vehicles[ref]
+        else:
+            veh = Vehicle.from_dict(data["assigned_vehicle"], trusted=trusted) if data.get("assigned_vehicle") else None
         return cls(
             name=data["name"],
             driver_id=data["driver_id"],
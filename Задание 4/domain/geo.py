@@ -0,0 +1,42 @@
+import math
+import re
+from typing import Optional, Tuple
+
+# Средний радиус Земли, км.
+EARTH_RADIUS_KM = 6371.0088
+
+# Длина одного градуса широты, км.
+KM_PER_DEGREE = 111.195
+
+# "N55.79 E49.11", "S33.9 W18.4" или "55.79, 49.11".
+_LOCATION = re.compile(r"\s*([NS])?\s*([-+]?\d+(?:\.\d*)?)\s*[,;\s]\s*([EW])?\s*([-+]?\d+(?:\.\d*)?)\s*$", re.I)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Расстояние по дуге большого круга между двумя точками (градусы), км."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def format_location(lat: float, lon: float) -> str:
+    """Строка местоположения в формате ТС, например "N55.7900 E49.1100"."""
+    return f"{'N' if lat >= 0 else 'S'}{abs(lat):.4f} {'E' if lon >= 0 else 'W'}{abs(lon):.4f}"
+
+
+def parse_location(text: str) -> Optional[Tuple[float, float]]:
+    """Разбор строки местоположения в (широта, долгота); None, если это не координаты."""
+    m = _LOCATION.match(text)
+    if m is None:
+        return None
+
+    ns, lat, ew, lon = m.groups()
+    lat_value, lon_value = float(lat), float(lon)
+    if ns and ns.upper() == "S":
+        lat_value = -lat_value
+    if ew and ew.upper() == "W":
+        lon_value = -lon_value
+    if not (-90.0 <= lat_value <= 90.0 and -180.0 <= lon_value <= 180.0):
+        return None
+    return lat_value, lon_value
@@ -0,0 +1,129 @@
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+from domain.geo import KM_PER_DEGREE, format_location, haversine_km
+
+
+class RouteGraph:
+    """Граф маршрутной сети: остановки с координатами и дороги с длиной в км."""
+
+    def __init__(self) -> None:
+        """Инициализация пустого графа."""
+        self._coords: Dict[str, Tuple[float, float]] = {}
+        self._locations: Dict[str, str] = {}
+        self._roads: Dict[str, Dict[str, float]] = {}
+        # Кратчайшие пути по парам остановок: (остановки после начальной, длины участков).
+        self._paths: Dict[Tuple[str, str], Tuple[List[str], List[float]]] = {}
+
+    @classmethod
+    def grid(cls, rows: int, cols: int, lat: float = 55.75, lon: float = 37.62,
+             step_km: float = 2.0) -> "RouteGraph":
+        """Прямоугольная сетка rows × cols остановок с шагом step_km от точки (lat, lon)."""
+        graph = cls()
+        dlat = step_km / KM_PER_DEGREE
+        dlon = dlat / math.cos(math.radians(lat))
+        for r in range(rows):
+            for c in range(cols):
+                graph.add_stop(f"S{r}-{c}", lat + r * dlat, lon + c * dlon)
+        for r in range(rows):
+            for c in range(cols):
+                if c + 1 < cols:
+                    graph.add_road(f"S{r}-{c}", f"S{r}-{c + 1}")
+                if r + 1 < rows:
+                    graph.add_road(f"S{r}-{c}", f"S{r + 1}-{c}")
+        return graph
+
+    @property
+    def stops(self) -> List[str]:
+        """Список остановок в порядке добавления."""
+        return list(self._coords)
+
+    def add_stop(self, name: str, lat: float, lon: float) -> None:
+        """Добавление (или перенос) остановки."""
+        self._coords[name] = (lat, lon)
+        self._locations[name] = format_location(lat, lon)
+        self._roads.setdefault(name, {})
+        self._paths.clear()
+
+    def add_road(self, a: str, b: str, km: Optional[float] = None) -> None:
+        """Добавление двусторонней дороги; по умолчанию длина — расстояние между остановками."""
+        for stop in (a, b):
+            if stop not in self._coords:
+                raise KeyError(f"Неизвестная остановка: {stop}")
+        if km is None:
+            km = haversine_km(*self._coords[a], *self._coords[b])
+        if km < 0:
+            raise ValueError("Отрицательная длина дороги.")
+
+        self._roads[a][b] = km
+        self._roads[b][a] = km
+        self._paths.clear()
+
+    def coords(self, stop: str) -> Tuple[float, float]:
+        """Координаты остановки (широта, долгота)."""
+        return self._coords[stop]
+
+    def location(self, stop: str) -> str:
+        """Строка местоположения остановки для update_location."""
+        return self._locations[stop]
+
+    def components(self) -> List[List[str]]:
+        """Компоненты связности: списки остановок, между которыми есть путь (в порядке добавления)."""
+        seen: Dict[str, None] = {}
+        res: List[List[str]] = []
+        for first in self._coords:
+            if first in seen:
+                continue
+            seen[first] = None
+            component = [first]
+            for stop in component:
+                for nxt in self._roads[stop]:
+                    if nxt not in seen:
+                        seen[nxt] = None
+                        component.append(nxt)
+            res.append(component)
+        return res
+
+    def path(self, start: str, end: str) -> Tuple[List[str], List[float]]:
+        """Кратчайший путь (алгоритм Дейкстры): остановки после start и длины участков.
+
+        Результат кешируется до изменения графа; его нельзя изменять.
+        """
+        key = (start, end)
+        cached = self._paths.get(key)
+        if cached is not None:
+            return cached
+
+        dist: Dict[str, float] = {start: 0.0}
+        prev: Dict[str, str] = {}
+        heap: List[Tuple[float, str]] = [(0.0, start)]
+        while heap:
+            d, stop = heapq.heappop(heap)
+            if stop == end:
+                break
+            if d > dist[stop]:
+                continue
+            for nxt, km in self._roads[stop].items():
+                nd = d + km
+                if nd < dist.get(nxt, math.inf):
+                    dist[nxt] = nd
+                    prev[nxt] = stop
+                    heapq.heappush(heap, (nd, nxt))
+
+        if end not in dist:
+            raise ValueError(f"Нет пути из {start} в {end}.")
+
+        stops: List[str] = []
+        lengths: List[float] = []
+        stop = end
+        while stop != start:
+            before = prev[stop]
+            stops.append(stop)
+            lengths.append(self._roads[before][stop])
+            stop = before
+        stops.reverse()
+        lengths.reverse()
+
+        self._paths[key] = (stops, lengths)
+        return stops, lengths
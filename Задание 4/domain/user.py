@@ -1,10 +1,25 @@
-from typing import List
+from typing import Iterable, Tuple
+
+from core.roles import RoleRegistry
 
 
 class User:
     """Модель пользователя системы."""
 
-    def __init__(self, username: str, roles: List[str]) -> None:
+    __slots__ = ("username", "_roles", "_role_mask")
+
+    def __init__(self, username: str, roles: Iterable[str]) -> None:
         """Инициализация пользователя системы."""
         self.username = username
         self.roles = roles
+
+    @property
+    def roles(self) -> Tuple[str, ...]:
+        """Роли пользователя (неизменяемый кортеж; изменяются присваиванием)."""
+        return self._roles
+
+    @roles.setter
+    def roles(self, value: Iterable[str]) -> None:
+        """Установка ролей с пересчётом кешированной битовой маски."""
+        self._roles = tuple(value)
+        self._role_mask = RoleRegistry.mask(self._roles)
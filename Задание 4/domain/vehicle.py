@@ -1,17 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from types import MemberDescriptorType
+from typing import Callable, Dict, Any, Optional, Tuple
 
 from core.exceptions import InvalidVehicleError
 from core.interfaces import Trackable, Reportable
 from core.meta import VehicleMeta
 from core.mixins import LoggingMixin, NotificationMixin
+from domain.geo import parse_location
 
 
 class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
     """Базовый класс транспортного средства. """
 
+    # Слоты вместо __dict__: имена с двумя подчёркиваниями искажаются так же, как атрибуты в методах.
+    __slots__ = ("__vehicle_id", "__model", "__year", "__capacity", "__status", "_last_location", "_observer")
+
+    # Категория водительских прав, нужная для управления ТС (см. Driver.can_drive); None — водитель не подбирается.
+    LICENSE_CATEGORY: Optional[str] = None
+
     def __init__(self, vehicle_id: str, model: str, year: int, capacity: int, status: str = "idle") -> None:
         """Инициализация транспортного средства."""
+        # Наблюдатель изменений полей (например, индексы TransportCompany): объект с методом
+        # _on_vehicle_changed(vehicle, field, old, new). None — изменения не отслеживаются.
+        self._observer: Optional[Any] = None
         self.__vehicle_id = vehicle_id
         self.__model = model
         self.__year = year
@@ -31,7 +42,9 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         """Установка идентификатора транспортного средства."""
         if not value:
             raise InvalidVehicleError("Пустой идентификатор ТС.")
+        old = self.vehicle_id
         self.__vehicle_id = value
+        self._changed("vehicle_id", old, value)
 
     @property
     def model(self) -> str:
@@ -43,7 +56,9 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         """Установка модели транспортного средства."""
         if not value:
             raise InvalidVehicleError("Пустая модель ТС.")
+        old = self.model
         self.__model = value
+        self._changed("model", old, value)
 
     @property
     def year(self) -> int:
@@ -55,7 +70,9 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         """Установка года выпуска транспортного средства."""
         if value < 1900:
             raise InvalidVehicleError("Слишком ранний год выпуска.")
+        old = self.year
         self.__year = value
+        self._changed("year", old, value)
 
     @property
     def capacity(self) -> int:
@@ -67,7 +84,9 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         """Установка вместимости транспортного средства."""
         if value < 0:
             raise InvalidVehicleError("Отрицательная вместимость.")
+        old = self.capacity
         self.__capacity = value
+        self._changed("capacity", old, value)
 
     @property
     def status(self) -> str:
@@ -79,7 +98,30 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         """Установка статуса транспортного средства."""
         if value not in {"idle", "on_route", "maintenance", "retired"}:
             raise InvalidVehicleError("Недопустимый статус ТС.")
+        old = self.status
         self.__status = value
+        self._changed("status", old, value)
+
+    @property
+    def coordinates(self) -> Optional[Tuple[float, float]]:
+        """Возвращение координат последнего местоположения (широта, долгота) или None."""
+        return parse_location(self._last_location)
+
+    def _set_location(self, location: str) -> None:
+        """Запись местоположения с уведомлением наблюдателя (поле location)."""
+        old = self._last_location
+        self._last_location = location
+        self._changed("location", old, location)
+
+    def _bind(self, observer: Optional[Any]) -> None:
+        """Подключение (или отключение при None) наблюдателя изменений полей."""
+        self._observer = observer
+
+    def _changed(self, field: str, old: Any, new: Any) -> None:
+        """Уведомление наблюдателя об изменении поля."""
+        observer = self._observer
+        if observer is not None:
+            observer._on_vehicle_changed(self, field, old, new)
 
     def __eq__(self, other: Any) -> Any:
         """Сравнение двух транспортных средств на равенство."""
@@ -115,16 +157,28 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Vehicle":
-        """Создание транспортного средства из словаря."""
-        from core.meta import VehicleMeta
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> "Vehicle":
+        """Создание транспортного средства из словаря.
 
+        trusted=True — словарь получен из собственного сохранения компании (формат to_dict):
+        объект собирается подготовленным конструктором класса без приведения типов и проверок.
+        """
         vehicle_type = data.get("type")
+        if trusted:
+            entry = _TRUSTED_CONSTRUCTORS.get(vehicle_type)
+            # Класс под тегом мог быть переопределён после сборки конструктора.
+            if entry is not None and VehicleMeta.registry.get(vehicle_type) is entry[0]:
+                return entry[1](data)
+
         klass = VehicleMeta.registry.get(vehicle_type)
 
         if not klass:
             raise InvalidVehicleError(f"Неизвестный тип ТС: {vehicle_type}")
 
+        if trusted:
+            build = _compile_constructor(klass)
+            _TRUSTED_CONSTRUCTORS[vehicle_type] = (klass, build)
+            return build(data)
         return klass._from_dict_impl(data)
 
     @abstractmethod
@@ -136,6 +190,10 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         """Возвращение дополнительных данных для сериализации подклассов."""
         return {}
 
+    def _cost_terms(self) -> Optional[Tuple[float, float]]:
+        """Возвращение коэффициентов линейной стоимости (за км, фиксированная часть) или None."""
+        return None
+
     @classmethod
     def _from_dict_impl(cls, data: Dict[str, Any]) -> "Vehicle":
         """Реализация создания экземпляра из словаря для конкретного подкласса."""
@@ -146,9 +204,57 @@ class Vehicle(LoggingMixin, NotificationMixin, ABC, metaclass=VehicleMeta):
         return f"Транспортное средство: {self.model}, Год выпуска: {self.year}"
 
 
+# Конструкторы доверенной загрузки по тегу типа ТС; строятся при первой встрече тега.
+_TRUSTED_CONSTRUCTORS: Dict[str, Tuple[type, Callable[[Dict[str, Any]], Vehicle]]] = {}
+
+
+def _compile_constructor(klass: type) -> Callable[[Dict[str, Any]], Vehicle]:
+    """Сборка конструктора, записывающего значения словаря to_dict прямо в слоты объекта.
+
+    Поле словаря соответствует свойству класса и искажённому слоту с тем же именем
+    (route_number -> _Bus__route_number). Если состояние класса этим не описывается
+    (есть __dict__ или другие слоты), используется обычный _from_dict_impl.
+    """
+    fields: Dict[str, MemberDescriptorType] = {}
+    slots: Dict[str, MemberDescriptorType] = {}
+    for c in reversed(klass.__mro__):
+        members = vars(c)
+        for name, attr in members.items():
+            if isinstance(attr, MemberDescriptorType):
+                slots[name] = attr
+            elif isinstance(attr, property):
+                slot = members.get(f"_{c.__name__.lstrip('_')}__{name}")
+                if isinstance(slot, MemberDescriptorType):
+                    fields[name] = slot
+
+    covered = set(map(id, fields.values()))
+    extra = [name for name, slot in slots.items()
+             if id(slot) not in covered and name not in ("_last_location", "_observer")]
+    if klass.__dictoffset__ or extra:
+        return klass._from_dict_impl
+
+    new = klass.__new__
+    setters = tuple((key, slot.__set__) for key, slot in fields.items())
+    set_observer = slots["_observer"].__set__
+    set_location = slots["_last_location"].__set__
+
+    def build(data: Dict[str, Any]) -> Vehicle:
+        obj = new(klass)
+        set_observer(obj, None)
+        set_location(obj, "N/A")
+        for key, put in setters:
+            put(obj, data[key])
+        return obj
+
+    return build
+
+
 class Bus(Vehicle):
     """Автобус — транспортное средство с номером маршрута."""
 
+    __slots__ = ("__route_number",)
+    LICENSE_CATEGORY = "D"
+
     def __init__(self, vehicle_id: str, model: str, year: int, capacity: int, route_number: str,
                  status: str = "idle") -> None:
         """Инициализация автобуса."""
@@ -165,11 +271,18 @@ class Bus(Vehicle):
         """Установка номера маршрута автобуса."""
         if not value:
             raise InvalidVehicleError("Пустой номер маршрута.")
+        old = self.route_number
         self.__route_number = value
+        self._changed("route_number", old, value)
 
     def calculate_cost(self, distance_km: float) -> float:
         """Расчёт стоимости эксплуатации автобуса."""
-        return round(1.2 * distance_km + 0.05 * self.capacity, 2)
+        per_km, fixed = self._cost_terms()
+        return round(per_km * distance_km + fixed, 2)
+
+    def _cost_terms(self) -> Tuple[float, float]:
+        """Возвращение коэффициентов стоимости автобуса."""
+        return 1.2, 0.05 * self.capacity
 
     def __str__(self) -> str:
         """Возвращение строкового представления автобуса."""
@@ -195,6 +308,9 @@ class Bus(Vehicle):
 class Truck(Vehicle):
     """Грузовик — транспортное средство с грузоподъёмностью."""
 
+    __slots__ = ("__cargo_capacity",)
+    LICENSE_CATEGORY = "C"
+
     def __init__(self, vehicle_id: str, model: str, year: int, capacity: int, cargo_capacity: float,
                  status: str = "idle") -> None:
         """Инициализация грузовика."""
@@ -213,11 +329,18 @@ class Truck(Vehicle):
         """Установка грузоподъёмности грузовика."""
         if value < 0:
             raise InvalidVehicleError("Отрицательная грузоподъёмность.")
+        old = self.cargo_capacity
         self.__cargo_capacity = value
+        self._changed("cargo_capacity", old, value)
 
     def calculate_cost(self, distance_km: float) -> float:
         """Расчёт стоимости эксплуатации грузовика."""
-        return round(2.0 * distance_km + 10.0 * self.cargo_capacity, 2)
+        per_km, fixed = self._cost_terms()
+        return round(per_km * distance_km + fixed, 2)
+
+    def _cost_terms(self) -> Tuple[float, float]:
+        """Возвращение коэффициентов стоимости грузовика."""
+        return 2.0, 10.0 * self.cargo_capacity
 
     def __str__(self) -> str:
         """Возвращение строкового представления грузовика."""
@@ -243,6 +366,9 @@ class Truck(Vehicle):
 class Taxi(Vehicle):
     """Такси — транспортное средство с номерным знаком."""
 
+    __slots__ = ("__license_plate",)
+    LICENSE_CATEGORY = "B"
+
     def __init__(self, vehicle_id: str, model: str, year: int, capacity: int, license_plate: str,
                  status: str = "idle") -> None:
         """Инициализация такси."""
@@ -259,12 +385,18 @@ class Taxi(Vehicle):
         """Установка номерного знака такси."""
         if not value:
             raise InvalidVehicleError("Пустой номерной знак.")
+        old = self.license_plate
         self.__license_plate = value
+        self._changed("license_plate", old, value)
 
     def calculate_cost(self, distance_km: float) -> float:
         """Расчёт стоимости эксплуатации такси."""
-        base = 3.0
-        return round(base + 0.8 * distance_km, 2)
+        per_km, base = self._cost_terms()
+        return round(per_km * distance_km + base, 2)
+
+    def _cost_terms(self) -> Tuple[float, float]:
+        """Возвращение коэффициентов стоимости такси (посадка 3.0 и 0.8 за км)."""
+        return 0.8, 3.0
 
     def __str__(self) -> str:
         """Возвращение строкового представления такси."""
@@ -290,22 +422,26 @@ class Taxi(Vehicle):
 class TrackableBus(Bus, Trackable):
     """Автобус с возможностью отслеживания местоположения."""
 
+    __slots__ = ()
+
     def track_location(self) -> str:
         """Возвращение информации о текущем местоположении автобуса."""
         return f"Автобус {self.model} на маршруте {self.route_number} — позиция: {self._last_location}"
 
     def update_location(self, location: str) -> None:
         """Обновление местоположения автобуса."""
-        self._last_location = location
+        self._set_location(location)
 
 
 class ReportableTaxi(Taxi, Reportable):
     """Такси с возможностью генерации отчётов по рейсам."""
 
+    __slots__ = ()
+
     def generate_report(self) -> str:
         """Генерация отчёта по рейсу такси."""
         return f"Отчёт по рейсу такси {self.license_plate}: статус={self.status}, последняя позиция={self._last_location}"
 
     def update_location(self, location: str) -> None:
         """Обновление местоположения такси."""
-        self._last_location = location
+        self._set_location(location)
@@ -1,6 +1,12 @@
 """Инфраструктурный слой транспортной компании."""
-from infrastructure.config import logger
-from infrastructure.factories import VehicleFactory
+from utils.lazy import lazy_exports
 
-__all__ = ["logger", "VehicleFactory"]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "logger": "infrastructure.config",
+    "VehicleFactory": "infrastructure.factories",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,428 @@
+import gzip
+import json
+import mmap
+import struct
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.exceptions import InvalidVehicleError
+from core.meta import VehicleMeta
+
+# Заголовок файла: сигнатура, версия формата и флаги.
+MAGIC = b"TCSNAP"
+VERSION = 1
+FLAG_COMPRESSED = 0x01
+
+# Расширения, для которых save по умолчанию выбирает бинарный формат.
+SNAPSHOT_EXTENSIONS = (".snap",)
+
+# Виды записей. Каждая запись: вид (1 байт), длина полезной нагрузки (4 байта), нагрузка.
+REC_NAME = 1
+REC_TYPE = 2
+REC_VEHICLE = 3
+REC_DRIVER = 4
+REC_INDEX = 5
+REC_END = 0
+
+# Индекс смещений пишется после признака конца, а завершает файл смещение индекса и сигнатура.
+INDEX_MAGIC = b"TCIDX1"
+
+_RECORD_HEAD = struct.Struct("<BI")
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+_F64 = struct.Struct("<d")
+
+_NULL_STR = 0xFFFFFFFF
+_STATUSES = ("idle", "on_route", "maintenance", "retired")
+_STATUS_CODES = {s: i for i, s in enumerate(_STATUSES)}
+_STATUS_INLINE = 0xFF
+_BASE_KEYS = ("type", "vehicle_id", "model", "year", "capacity", "status")
+
+# Метки типов дополнительных значений.
+_TAG_NONE, _TAG_STR, _TAG_FLOAT, _TAG_INT, _TAG_BOOL, _TAG_JSON = b"nsdqbj"
+
+# Способ хранения ТС у водителя.
+_NO_VEHICLE, _VEHICLE_REF, _VEHICLE_EMBEDDED = 0, 1, 2
+
+
+def is_snapshot(head: bytes) -> bool:
+    """Проверка, что начало файла — сигнатура бинарного снимка."""
+    return head.startswith(MAGIC)
+
+
+def _pack_str(out: List[bytes], value: Optional[str]) -> None:
+    """Запись строки с префиксом длины (None кодируется особой длиной)."""
+    if value is None:
+        out.append(_U32.pack(_NULL_STR))
+        return
+
+    raw = value.encode("utf-8")
+    out.append(_U32.pack(len(raw)))
+    out.append(raw)
+
+
+def _pack_value(out: List[bytes], value: Any) -> None:
+    """Запись дополнительного значения с меткой типа."""
+    if value is None:
+        out.append(bytes((_TAG_NONE,)))
+    elif isinstance(value, str):
+        out.append(bytes((_TAG_STR,)))
+        _pack_str(out, value)
+    elif isinstance(value, bool):
+        out.append(bytes((_TAG_BOOL, int(value))))
+    elif isinstance(value, float):
+        out.append(bytes((_TAG_FLOAT,)))
+        out.append(_F64.pack(value))
+    elif isinstance(value, int) and -2 ** 63 <= value < 2 ** 63:
+        out.append(bytes((_TAG_INT,)))
+        out.append(_I64.pack(value))
+    else:
+        out.append(bytes((_TAG_JSON,)))
+        _pack_str(out, json.dumps(value, ensure_ascii=False))
+
+
+class _Cursor:
+    """Последовательное чтение полей из полезной нагрузки записи."""
+
+    def __init__(self, payload: bytes) -> None:
+        """Инициализация чтения с начала нагрузки."""
+        self.buf = payload
+        self.pos = 0
+
+    def unpack(self, st: struct.Struct) -> Any:
+        """Чтение поля фиксированной ширины."""
+        value = st.unpack_from(self.buf, self.pos)[0]
+        self.pos += st.size
+        return value
+
+    def string(self) -> Optional[str]:
+        """Чтение строки с префиксом длины."""
+        n = self.unpack(_U32)
+        if n == _NULL_STR:
+            return None
+        value = self.buf[self.pos:self.pos + n].decode("utf-8")
+        self.pos += n
+        return value
+
+    def value(self) -> Any:
+        """Чтение дополнительного значения с меткой типа."""
+        tag = self.unpack(_U8)
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_STR:
+            return self.string()
+        if tag == _TAG_BOOL:
+            return bool(self.unpack(_U8))
+        if tag == _TAG_FLOAT:
+            return self.unpack(_F64)
+        if tag == _TAG_INT:
+            return self.unpack(_I64)
+        return json.loads(self.string())
+
+
+class SnapshotWriter:
+    """Потоковая запись бинарного снимка компании."""
+
+    def __init__(self, fp: BinaryIO, compress: bool = False, index: bool = False) -> None:
+        """Запись заголовка; при compress=True тело сжимается gzip.
+
+        index=True дописывает в конец индекс смещений записей для MappedSnapshot (только без сжатия).
+        """
+        if compress and index:
+            raise ValueError("Индекс смещений несовместим со сжатием снимка.")
+
+        header = MAGIC + bytes((VERSION, FLAG_COMPRESSED if compress else 0))
+        fp.write(header)
+        self._gzip = gzip.GzipFile(fileobj=fp, mode="wb", compresslevel=6, mtime=0) if compress else None
+        self._out: BinaryIO = self._gzip if self._gzip is not None else fp
+        # Интернированные метки типов: (ключ реестра, доп. поля) -> номер.
+        self._types: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+
+        self._index = index
+        self._offset = len(header)
+        self._type_offsets: List[int] = []
+        self._vehicle_offsets: List[Tuple[str, int]] = []
+        self._driver_offsets: List[Tuple[str, int]] = []
+
+    def _record(self, kind: int, parts: List[bytes]) -> int:
+        """Запись одной записи с префиксом длины; возврат её смещения в несжатом файле."""
+        payload = b"".join(parts)
+        offset = self._offset
+        self._out.write(_RECORD_HEAD.pack(kind, len(payload)))
+        self._out.write(payload)
+        self._offset += _RECORD_HEAD.size + len(payload)
+        return offset
+
+    def write_name(self, name: str) -> None:
+        """Запись названия компании."""
+        parts: List[bytes] = []
+        _pack_str(parts, name)
+        self._record(REC_NAME, parts)
+
+    def _type_code(self, data: Dict[str, Any]) -> Tuple[int, Tuple[str, ...]]:
+        """Номер метки типа ТС; при первой встрече записывается определение типа."""
+        tag = data["type"]
+        extras = tuple(k for k in data if k not in _BASE_KEYS)
+        key = (tag, extras)
+        code = self._types.get(key)
+        if code is None:
+            if tag not in VehicleMeta.registry:
+                raise InvalidVehicleError(f"Неизвестный тип ТС: {tag}")
+            code = len(self._types)
+            if code > 0xFF:
+                raise InvalidVehicleError("Слишком много различных типов ТС для снимка.")
+            self._types[key] = code
+
+            parts = [_U8.pack(code)]
+            _pack_str(parts, tag)
+            parts.append(_U8.pack(len(extras)))
+            for k in extras:
+                _pack_str(parts, k)
+            self._type_offsets.append(self._record(REC_TYPE, parts))
+        return code, extras
+
+    def _vehicle_parts(self, data: Dict[str, Any]) -> List[bytes]:
+        """Кодирование ТС в поля фиксированной ширины и строки."""
+        code, extras = self._type_code(data)
+        parts = [_U8.pack(code)]
+        _pack_str(parts, data["vehicle_id"])
+        _pack_str(parts, data["model"])
+        try:
+            parts.append(_I32.pack(data["year"]))
+            parts.append(_I64.pack(data["capacity"]))
+        except struct.error as e:
+            raise InvalidVehicleError(f"Год или вместимость ТС {data['vehicle_id']} не помещаются в снимок: {e}")
+
+        status = data["status"]
+        status_code = _STATUS_CODES.get(status)
+        if status_code is None:
+            parts.append(_U8.pack(_STATUS_INLINE))
+            _pack_str(parts, status)
+        else:
+            parts.append(_U8.pack(status_code))
+
+        for k in extras:
+            _pack_value(parts, data[k])
+        return parts
+
+    def write_vehicle(self, data: Dict[str, Any]) -> None:
+        """Запись ТС (словарь в формате Vehicle.to_dict)."""
+        offset = self._record(REC_VEHICLE, self._vehicle_parts(data))
+        if self._index:
+            self._vehicle_offsets.append((data["vehicle_id"], offset))
+
+    def write_driver(self, data: Dict[str, Any]) -> None:
+        """Запись водителя (словарь в формате Driver.to_dict)."""
+        ref = data.get("assigned_vehicle_id")
+        embedded = data.get("assigned_vehicle")
+        # Определение типа встроенного ТС должно попасть в файл раньше записи водителя.
+        vehicle_parts = self._vehicle_parts(embedded) if ref is None and embedded else None
+
+        parts: List[bytes] = []
+        for key in ("name", "driver_id", "license_type"):
+            _pack_str(parts, data[key])
+        addr = data["address"]
+        for key in ("city", "street", "house"):
+            _pack_str(parts, addr[key])
+
+        if ref is not None:
+            parts.append(_U8.pack(_VEHICLE_REF))
+            _pack_str(parts, ref)
+        elif vehicle_parts is not None:
+            parts.append(_U8.pack(_VEHICLE_EMBEDDED))
+            parts.extend(vehicle_parts)
+        else:
+            parts.append(_U8.pack(_NO_VEHICLE))
+        offset = self._record(REC_DRIVER, parts)
+        if self._index:
+            self._driver_offsets.append((data["driver_id"], offset))
+
+    def close(self) -> None:
+        """Запись признака конца (и индекса смещений), завершение сжатого потока."""
+        self._record(REC_END, [])
+        if self._gzip is not None:
+            self._gzip.close()
+
+        if self._index:
+            parts = [_U32.pack(len(self._type_offsets))]
+            parts.extend(_U64.pack(off) for off in self._type_offsets)
+            for entries in (self._vehicle_offsets, self._driver_offsets):
+                parts.append(_U32.pack(len(entries)))
+                for key, off in entries:
+                    _pack_str(parts, key)
+                    parts.append(_U64.pack(off))
+            index_offset = self._record(REC_INDEX, parts)
+            self._out.write(_U64.pack(index_offset) + INDEX_MAGIC)
+
+
+def dump_snapshot(fp: BinaryIO, name: str, vehicles: Iterable[Dict[str, Any]],
+                  drivers: Iterable[Dict[str, Any]], compress: bool = False, index: bool = False) -> None:
+    """Потоковая запись компании в бинарный снимок."""
+    writer = SnapshotWriter(fp, compress, index)
+    writer.write_name(name)
+    for v in vehicles:
+        writer.write_vehicle(v)
+    for d in drivers:
+        writer.write_driver(d)
+    writer.close()
+
+
+def _read_exact(fp: BinaryIO, n: int) -> bytes:
+    """Чтение ровно n байт или ошибка об обрыве файла."""
+    data = fp.read(n)
+    if len(data) != n:
+        raise InvalidVehicleError("Снимок повреждён: неожиданный конец файла.")
+    return data
+
+
+def _read_vehicle(cur: _Cursor, types: Dict[int, Tuple[str, Tuple[str, ...]]]) -> Dict[str, Any]:
+    """Декодирование ТС в словарь формата Vehicle.to_dict."""
+    tag, extras = types[cur.unpack(_U8)]
+    data: Dict[str, Any] = {
+        "type": tag,
+        "vehicle_id": cur.string(),
+        "model": cur.string(),
+        "year": cur.unpack(_I32),
+        "capacity": cur.unpack(_I64),
+    }
+    status_code = cur.unpack(_U8)
+    data["status"] = cur.string() if status_code == _STATUS_INLINE else _STATUSES[status_code]
+    for k in extras:
+        data[k] = cur.value()
+    return data
+
+
+def _read_driver(cur: _Cursor, types: Dict[int, Tuple[str, Tuple[str, ...]]]) -> Dict[str, Any]:
+    """Декодирование водителя в словарь формата Driver.to_dict."""
+    data: Dict[str, Any] = {
+        "name": cur.string(),
+        "driver_id": cur.string(),
+        "license_type": cur.string(),
+        "address": {"city": cur.string(), "street": cur.string(), "house": cur.string()},
+    }
+    mode = cur.unpack(_U8)
+    if mode == _VEHICLE_REF:
+        data["assigned_vehicle_id"] = cur.string()
+    else:
+        data["assigned_vehicle"] = _read_vehicle(cur, types) if mode == _VEHICLE_EMBEDDED else None
+    return data
+
+
+def _read_type(cur: _Cursor, types: Dict[int, Tuple[str, Tuple[str, ...]]]) -> None:
+    """Регистрация определения типа ТС."""
+    code = cur.unpack(_U8)
+    tag = cur.string()
+    extras = tuple(cur.string() for _ in range(cur.unpack(_U8)))
+    types[code] = (tag, extras)
+
+
+def iter_snapshot(fp: BinaryIO) -> Iterator[Tuple[str, Any]]:
+    """Потоковое чтение бинарного снимка.
+
+    Выдаёт те же пары, что и infrastructure.json_stream.iter_company: ("name", str),
+    ("vehicles", dict) и ("drivers", dict).
+    """
+    head = _read_exact(fp, len(MAGIC) + 2)
+    if not is_snapshot(head):
+        raise InvalidVehicleError("Файл не является бинарным снимком компании.")
+    if head[len(MAGIC)] != VERSION:
+        raise InvalidVehicleError(f"Неподдерживаемая версия снимка: {head[len(MAGIC)]}")
+
+    src: BinaryIO = gzip.GzipFile(fileobj=fp, mode="rb") if head[-1] & FLAG_COMPRESSED else fp
+    types: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+
+    while True:
+        kind, size = _RECORD_HEAD.unpack(_read_exact(src, _RECORD_HEAD.size))
+        if kind == REC_END:
+            return
+
+        cur = _Cursor(_read_exact(src, size))
+        if kind == REC_VEHICLE:
+            yield "vehicles", _read_vehicle(cur, types)
+        elif kind == REC_DRIVER:
+            yield "drivers", _read_driver(cur, types)
+        elif kind == REC_TYPE:
+            _read_type(cur, types)
+        elif kind == REC_NAME:
+            yield "name", cur.string()
+        # Записи неизвестных видов пропускаются: длина известна из префикса.
+
+
+class MappedSnapshot:
+    """Бинарный снимок с индексом смещений, открытый через mmap.
+
+    При открытии читается только индекс; записи ТС и водителей декодируются по запросу.
+    """
+
+    def __init__(self, path: str, offsets: bool = True) -> None:
+        """Открытие файла и чтение индекса смещений.
+
+        offsets=False читает только определения типов: записи доступны по смещениям
+        (vehicle_at, driver_at), полученным из другого экземпляра.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise InvalidVehicleError("Снимок пуст.")
+
+        mm = self._mm
+        header = len(MAGIC) + 2
+        if not is_snapshot(mm[:header]) or mm[len(MAGIC)] != VERSION or mm[header - 1] & FLAG_COMPRESSED:
+            self.close()
+            raise InvalidVehicleError("Файл не является несжатым бинарным снимком компании.")
+        if mm[-len(INDEX_MAGIC):] != INDEX_MAGIC:
+            self.close()
+            raise InvalidVehicleError("В снимке нет индекса смещений.")
+
+        index_offset = _U64.unpack_from(mm, len(mm) - len(INDEX_MAGIC) - _U64.size)[0]
+        cur = self._cursor(index_offset, REC_INDEX)
+
+        self._types: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+        for off in [cur.unpack(_U64) for _ in range(cur.unpack(_U32))]:
+            _read_type(self._cursor(off, REC_TYPE), self._types)
+
+        self.vehicle_offsets: Dict[str, int] = {}
+        self.driver_offsets: Dict[str, int] = {}
+        if offsets:
+            for _ in range(cur.unpack(_U32)):
+                key = cur.string()
+                self.vehicle_offsets[key] = cur.unpack(_U64)
+
+            for _ in range(cur.unpack(_U32)):
+                key = cur.string()
+                self.driver_offsets[key] = cur.unpack(_U64)
+
+        self.name = self._cursor(header, REC_NAME).string()
+
+    def _cursor(self, offset: int, kind: int) -> _Cursor:
+        """Чтение записи по смещению с проверкой её вида."""
+        found, size = _RECORD_HEAD.unpack_from(self._mm, offset)
+        if found != kind:
+            raise InvalidVehicleError(f"Снимок повреждён: по смещению {offset} запись вида {found}.")
+        start = offset + _RECORD_HEAD.size
+        return _Cursor(self._mm[start:start + size])
+
+    def vehicle(self, vehicle_id: str) -> Dict[str, Any]:
+        """Декодирование ТС по идентификатору."""
+        return self.vehicle_at(self.vehicle_offsets[vehicle_id])
+
+    def driver(self, driver_id: str) -> Dict[str, Any]:
+        """Декодирование водителя по идентификатору."""
+        return self.driver_at(self.driver_offsets[driver_id])
+
+    def vehicle_at(self, offset: int) -> Dict[str, Any]:
+        """Декодирование ТС по смещению записи."""
+        return _read_vehicle(self._cursor(offset, REC_VEHICLE), self._types)
+
+    def driver_at(self, offset: int) -> Dict[str, Any]:
+        """Декодирование водителя по смещению записи."""
+        return _read_driver(self._cursor(offset, REC_DRIVER), self._types)
+
+    def close(self) -> None:
+        """Закрытие отображения и файла."""
+        self._mm.close()
+        self._file.close()
@@ -1,24 +1,109 @@
 import logging
 import os
+import queue
 import sys
+from typing import List, Optional
 
 logs_dir = "logs"
-os.makedirs(logs_dir, exist_ok=True)
+
+# Уровень логгера (переменная окружения TRANSPORT_LOG_LEVEL): сообщения ниже него отсекаются
+# проверкой уровня до форматирования и постановки в очередь. Неизвестное имя уровня заменяется на DEBUG.
+_DEFAULT_LOG_LEVEL = "DEBUG"
+_REQUESTED_LOG_LEVEL = os.environ.get("TRANSPORT_LOG_LEVEL", _DEFAULT_LOG_LEVEL).upper()
+LOG_LEVEL = (_REQUESTED_LOG_LEVEL if _REQUESTED_LOG_LEVEL in logging.getLevelNamesMapping()
+             else _DEFAULT_LOG_LEVEL)
+
+
+class BatchingFileHandler(logging.FileHandler):
+    """Файловый обработчик, записывающий строки пачками.
+
+    Пачка записывается при накоплении capacity строк, при сообщении уровня flush_level и выше
+    и при явном flush (его вызывает BatchingQueueListener, когда очередь простаивает).
+    Файл и его директория создаются при первой записи пачки.
+    """
+
+    def __init__(self, filename: str, capacity: int = 512, flush_level: int = logging.WARNING,
+                 encoding: Optional[str] = None) -> None:
+        """Инициализация обработчика."""
+        super().__init__(filename, encoding=encoding, delay=True)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._buffer: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Добавление отформатированной строки в пачку."""
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._buffer) >= self.capacity or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self) -> None:
+        """Запись накопленной пачки одним вызовом write."""
+        self.acquire()
+        try:
+            if self._buffer:
+                if self.stream is None:
+                    os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+                    self.stream = self._open()
+                self.stream.write("".join(self._buffer))
+                self._buffer.clear()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Запись остатка пачки и закрытие файла."""
+        self.flush()
+        super().close()
+
+
+class DeferredQueueHandler(logging.Handler):
+    """Постановка записей в очередь для обработчиков handlers, которые выполняет поток слушателя.
+
+    Обработчик очереди, слушатель и модуль logging.handlers создаются при первой записи,
+    поэтому импорт конфигурации их не загружает.
+    """
+
+    def __init__(self, q: "queue.SimpleQueue[logging.LogRecord]", *handlers: logging.Handler) -> None:
+        """Инициализация обработчика."""
+        super().__init__()
+        self._queue = q
+        self._handlers = handlers
+        self._target: Optional[logging.Handler] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Передача записи обработчику очереди (с его созданием при первой записи)."""
+        if self._target is None:
+            from infrastructure.log_queue import BatchingQueueListener, MergingQueueHandler
+            self._target = MergingQueueHandler(self._queue, BatchingQueueListener(self._queue, *self._handlers))
+        self._target.emit(record)
+
 
 logger = logging.getLogger("transport_company")
-logger.setLevel(logging.DEBUG)
+logger.setLevel(LOG_LEVEL)
 
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(logging.INFO)
 
 log_file_path = os.path.join(logs_dir, "transport_company.log")
-file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+file_handler = BatchingFileHandler(log_file_path, encoding="utf-8")
 file_handler.setLevel(logging.DEBUG)
 
 formatter = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
 console_handler.setFormatter(formatter)
 file_handler.setFormatter(formatter)
 
+# Консоль пишется в вызывающем потоке, чтобы строки лога не перемешивались с выводом print;
+# в очередь ставится только запись в файл, её выполняет поток слушателя.
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
 if not logger.handlers:
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(DeferredQueueHandler(log_queue, file_handler))
+
+if LOG_LEVEL != _REQUESTED_LOG_LEVEL:
+    logger.warning("Неизвестный уровень логирования TRANSPORT_LOG_LEVEL=%r, используется %s",
+                   _REQUESTED_LOG_LEVEL, LOG_LEVEL)
@@ -0,0 +1,119 @@
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Журнал изменений лежит рядом с файлом компании: <файл>.journal.
+JOURNAL_SUFFIX = ".journal"
+
+# Ключи записей по разделам: ("vehicles", запись) — запись ТС целиком, ("-vehicles", id) — удаление.
+_ID_FIELDS = {"vehicles": "vehicle_id", "drivers": "driver_id"}
+
+
+def journal_path(path: str) -> str:
+    """Путь журнала изменений для файла компании."""
+    return path + JOURNAL_SUFFIX
+
+
+def _signature(path: str) -> List[int]:
+    """Подпись файла компании (размер и время изменения), к которому относится журнал."""
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+class JournalDelta:
+    """Свёртка журнала: итоговые записи и удалённые id по разделам, новое имя компании.
+
+    Для каждого раздела puts хранит последнюю запись по id в порядке появления, dropped — id,
+    удалённые хотя бы раз: их записи в основном файле пропускаются, а повторно добавленные
+    записи попадают в конец раздела (как при удалении и добавлении ключа в словарь).
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой свёртки."""
+        self.name: Optional[str] = None
+        self.puts: Dict[str, Dict[str, Dict[str, Any]]] = {"vehicles": {}, "drivers": {}}
+        self.dropped: Dict[str, Set[str]] = {"vehicles": set(), "drivers": set()}
+        self.records = 0
+
+    def apply(self, key: str, item: Any) -> None:
+        """Учёт одной операции журнала."""
+        self.records += 1
+        if key == "name":
+            self.name = item
+        elif key in _ID_FIELDS:
+            self.puts[key][item[_ID_FIELDS[key]]] = item
+        else:
+            section = key[1:]
+            self.puts[section].pop(item, None)
+            self.dropped[section].add(item)
+
+    def merge(self, events: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        """Поток пар формата iter_company основного файла с применёнными изменениями журнала."""
+        puts = {section: dict(records) for section, records in self.puts.items()}
+        for key, item in events:
+            if key in _ID_FIELDS:
+                item_id = item[_ID_FIELDS[key]]
+                if item_id in self.dropped[key]:
+                    continue
+                item = puts[key].pop(item_id, item)
+            elif key == "name" and self.name is not None:
+                item = self.name
+            yield key, item
+
+        for section in ("vehicles", "drivers"):
+            for item in puts[section].values():
+                yield section, item
+
+
+def read_journal(path: str) -> Optional[JournalDelta]:
+    """Чтение журнала файла компании; None, если журнала нет или он относится к другой версии файла.
+
+    Применяются только пакеты, завершённые отметкой commit: пакет, запись которого прервалась,
+    пропускается.
+    """
+    try:
+        f = open(journal_path(path), encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    delta = JournalDelta()
+    batch: List[Tuple[str, Any]] = []
+    with f:
+        header = f.readline()
+        if not header or json.loads(header) != ["base", _signature(path)]:
+            return None
+        for line in f:
+            try:
+                key, item = json.loads(line)
+            except ValueError:
+                break
+            if key == "commit":
+                for op in batch:
+                    delta.apply(*op)
+                batch = []
+            else:
+                batch.append((key, item))
+    return delta
+
+
+def start_journal(path: str) -> None:
+    """Создание пустого журнала для только что записанного файла компании (старый журнал заменяется)."""
+    with open(journal_path(path), "w", encoding="utf-8") as f:
+        f.write(json.dumps(["base", _signature(path)]) + "\n")
+
+
+def append_journal(path: str, ops: Iterable[Tuple[str, Any]]) -> int:
+    """Дозапись пакета операций одним вызовом write; возвращает число операций."""
+    lines = [json.dumps([key, item], ensure_ascii=False, separators=(",", ":")) for key, item in ops]
+    lines.append(json.dumps(["commit", len(lines)]))
+    with open(journal_path(path), "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return len(lines) - 1
+
+
+def drop_journal(path: str) -> None:
+    """Удаление журнала файла компании, если он есть."""
+    try:
+        os.remove(journal_path(path))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,120 @@
+import json
+from typing import Any, Dict, Iterable, Iterator, TextIO, Tuple
+
+_WHITESPACE = " \t\n\r"
+_CHUNK_SIZE = 1 << 16
+
+
+class _StreamReader:
+    """Буферизованное чтение JSON-текста с разбором значений по одному."""
+
+    def __init__(self, fp: TextIO) -> None:
+        """Инициализация чтения из текстового файла."""
+        self._fp = fp
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Дочитывание следующего блока; прочитанная часть буфера отбрасывается."""
+        if self._eof:
+            return False
+
+        chunk = self._fp.read(_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Возврат следующего значимого символа без его чтения ('' в конце файла)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        """Чтение ожидаемого символа структуры."""
+        found = self.peek()
+        if found != ch:
+            raise json.JSONDecodeError(f"Ожидался символ {ch!r}", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Разбор одного JSON-значения, дочитывая файл по мере необходимости."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Число в конце буфера может продолжаться в следующем блоке.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_company(fp: TextIO) -> Iterator[Tuple[str, Any]]:
+    """Потоковый разбор JSON-файла компании.
+
+    Выдаёт пары (ключ, значение) для скалярных полей верхнего уровня и (ключ, элемент)
+    для каждого элемента массивов (vehicles, drivers), не загружая массивы целиком.
+    """
+    reader = _StreamReader(fp)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    yield key, reader.value()
+                    if reader.peek() != ",":
+                        break
+                    reader.expect(",")
+            reader.expect("]")
+        else:
+            yield key, reader.value()
+
+        if reader.peek() != ",":
+            break
+        reader.expect(",")
+    reader.expect("}")
+
+
+def _dump_array(fp: TextIO, key: str, items: Iterable[Dict[str, Any]], indent: int) -> None:
+    """Запись массива объектов поэлементно в формате json.dump(..., indent=indent)."""
+    pad = " " * indent
+    fp.write(f"{pad}{json.dumps(key)}: [")
+    first = True
+    for item in items:
+        text = json.dumps(item, ensure_ascii=False, indent=indent)
+        fp.write(("\n" if first else ",\n") + pad * 2 + text.replace("\n", "\n" + pad * 2))
+        first = False
+    fp.write("]" if first else f"\n{pad}]")
+
+
+def dump_company(fp: TextIO, name: str, vehicles: Iterable[Dict[str, Any]],
+                 drivers: Iterable[Dict[str, Any]], indent: int = 2) -> None:
+    """Потоковая запись компании; результат совпадает с json.dump(..., ensure_ascii=False, indent=indent)."""
+    pad = " " * indent
+    fp.write("{\n")
+    fp.write(f"{pad}\"name\": {json.dumps(name, ensure_ascii=False)},\n")
+    _dump_array(fp, "vehicles", vehicles, indent)
+    fp.write(",\n")
+    _dump_array(fp, "drivers", drivers, indent)
+    fp.write("\n}")
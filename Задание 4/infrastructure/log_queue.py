@@ -0,0 +1,67 @@
+import atexit
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_EXC_FORMATTER = logging.Formatter()
+
+
+class MergingQueueHandler(QueueHandler):
+    """Постановка копии записи в очередь с подставленными аргументами.
+
+    Время (created) и аргументы фиксируются в вызывающем потоке; форматирование строки
+    с датой и запись выполняет поток слушателя. Если задан listener, его поток
+    запускается при первой записи, а не при создании обработчика.
+    """
+
+    def __init__(self, q: "queue.SimpleQueue[logging.LogRecord]",
+                 listener: Optional[QueueListener] = None) -> None:
+        """Инициализация обработчика очереди."""
+        super().__init__(q)
+        self._listener = listener
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Постановка записи в очередь (с запуском слушателя при первой записи)."""
+        if self._listener is not None:
+            self._listener.start()
+            # Выполняется до logging.shutdown (atexit — в обратном порядке): очередь дописывается до закрытия файла.
+            atexit.register(self._listener.stop)
+            self._listener = None
+        super().enqueue(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Копия записи с подставленными аргументами и текстом исключения.
+
+        Исходная запись не изменяется: её получают и остальные обработчики логгера.
+        """
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class BatchingQueueListener(QueueListener):
+    """Слушатель очереди логов, сбрасывающий буферы обработчиков после idle секунд простоя."""
+
+    def __init__(self, q: "queue.SimpleQueue[logging.LogRecord]", *handlers: logging.Handler,
+                 idle: float = 0.5) -> None:
+        """Инициализация слушателя (уровни обработчиков учитываются)."""
+        super().__init__(q, *handlers, respect_handler_level=True)
+        self.idle = idle
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Ожидание записи; при простое очереди — сброс буферов обработчиков."""
+        while True:
+            try:
+                return self.queue.get(block, self.idle)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
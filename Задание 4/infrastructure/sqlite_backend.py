@@ -0,0 +1,177 @@
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+# Первые байты любого файла базы SQLite.
+SQLITE_MAGIC = b"SQLite format 3\x00"
+
+# Расширения, для которых save по умолчанию выбирает SQLite.
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+_BASE_KEYS = ("type", "vehicle_id", "model", "year", "capacity", "status")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vehicles (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    vehicle_id TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    model TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    capacity INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    extra TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS drivers (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    driver_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    license_type TEXT NOT NULL,
+    city TEXT NOT NULL,
+    street TEXT NOT NULL,
+    house TEXT NOT NULL,
+    vehicle_id TEXT,
+    vehicle TEXT
+);
+"""
+
+# Тексты запросов постоянны, поэтому sqlite3 подготавливает каждый один раз и берёт из кеша.
+_PUT_NAME = "INSERT INTO meta (key, value) VALUES ('name', ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+_INSERT_VEHICLE = ("INSERT INTO vehicles (vehicle_id, type, model, year, capacity, status, extra) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?)")
+_UPDATE_VEHICLE = ("UPDATE vehicles SET vehicle_id = ?, type = ?, model = ?, year = ?, capacity = ?, status = ?, "
+                   "extra = ? WHERE vehicle_id = ?")
+_DELETE_VEHICLE = "DELETE FROM vehicles WHERE vehicle_id = ?"
+_RENAME_REFS = "UPDATE drivers SET vehicle_id = ? WHERE vehicle_id = ?"
+# Обновление существующего водителя сохраняет его позицию (seq) в порядке загрузки.
+_PUT_DRIVER = ("INSERT INTO drivers (driver_id, name, license_type, city, street, house, vehicle_id, vehicle) "
+               "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (driver_id) DO UPDATE SET "
+               "name = excluded.name, license_type = excluded.license_type, city = excluded.city, "
+               "street = excluded.street, house = excluded.house, vehicle_id = excluded.vehicle_id, "
+               "vehicle = excluded.vehicle")
+_DELETE_DRIVER = "DELETE FROM drivers WHERE driver_id = ?"
+
+
+def is_sqlite(head: bytes) -> bool:
+    """Проверка, что начало файла — заголовок базы SQLite."""
+    return head.startswith(SQLITE_MAGIC)
+
+
+def _vehicle_row(data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Строка таблицы vehicles из словаря формата Vehicle.to_dict."""
+    extra = {k: v for k, v in data.items() if k not in _BASE_KEYS}
+    return (data["vehicle_id"], data["type"], data["model"], data["year"], data["capacity"], data["status"],
+            json.dumps(extra, ensure_ascii=False))
+
+
+def _driver_row(data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Строка таблицы drivers из словаря формата Driver.to_dict."""
+    addr = data["address"]
+    embedded = data.get("assigned_vehicle")
+    return (data["driver_id"], data["name"], data["license_type"], addr["city"], addr["street"], addr["house"],
+            data.get("assigned_vehicle_id"), json.dumps(embedded, ensure_ascii=False) if embedded else None)
+
+
+class SQLiteBackend:
+    """Хранилище компании в базе SQLite (режим WAL) с записью изменений небольшими транзакциями."""
+
+    def __init__(self, path: str) -> None:
+        """Открытие (с созданием при необходимости) базы и схемы."""
+        # sqlite3 загружается при первом открытии базы, а не при импорте модуля.
+        import sqlite3
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        # В режиме WAL synchronous=NORMAL не рискует целостностью базы и не ждёт fsync на каждой транзакции.
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        self.path = os.path.abspath(path)
+
+    def write_company(self, name: str, vehicles: Iterable[Dict[str, Any]],
+                      drivers: Iterable[Dict[str, Any]]) -> None:
+        """Полная перезапись содержимого базы одной транзакцией (пакетная вставка executemany)."""
+        with self._conn:
+            self._conn.execute("DELETE FROM vehicles")
+            self._conn.execute("DELETE FROM drivers")
+            self._conn.execute(_PUT_NAME, (name,))
+            self._conn.executemany(_INSERT_VEHICLE, map(_vehicle_row, vehicles))
+            self._conn.executemany(_PUT_DRIVER, map(_driver_row, drivers))
+
+    def set_name(self, name: str) -> None:
+        """Запись названия компании."""
+        with self._conn:
+            self._conn.execute(_PUT_NAME, (name,))
+
+    def put_vehicle(self, data: Dict[str, Any]) -> None:
+        """Добавление ТС."""
+        with self._conn:
+            self._conn.execute(_INSERT_VEHICLE, _vehicle_row(data))
+
+    def put_vehicles(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Пакетное добавление ТС одной транзакцией."""
+        with self._conn:
+            self._conn.executemany(_INSERT_VEHICLE, map(_vehicle_row, items))
+
+    def update_vehicle(self, vehicle_id: str, data: Dict[str, Any]) -> None:
+        """Перезапись строки ТС (vehicle_id — идентификатор до изменения)."""
+        with self._conn:
+            self._conn.execute(_UPDATE_VEHICLE, _vehicle_row(data) + (vehicle_id,))
+            if data["vehicle_id"] != vehicle_id:
+                self._conn.execute(_RENAME_REFS, (data["vehicle_id"], vehicle_id))
+
+    def delete_vehicle(self, vehicle_id: str, drivers: Iterable[Dict[str, Any]] = ()) -> None:
+        """Удаление ТС вместе с обновлением закреплённых за ним водителей в одной транзакции."""
+        with self._conn:
+            self._conn.execute(_DELETE_VEHICLE, (vehicle_id,))
+            self._conn.executemany(_PUT_DRIVER, map(_driver_row, drivers))
+
+    def put_driver(self, data: Dict[str, Any]) -> None:
+        """Добавление или обновление водителя."""
+        with self._conn:
+            self._conn.execute(_PUT_DRIVER, _driver_row(data))
+
+    def put_drivers(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Пакетное добавление или обновление водителей одной транзакцией."""
+        with self._conn:
+            self._conn.executemany(_PUT_DRIVER, map(_driver_row, items))
+
+    def delete_driver(self, driver_id: str) -> None:
+        """Удаление водителя."""
+        with self._conn:
+            self._conn.execute(_DELETE_DRIVER, (driver_id,))
+
+    def iter_company(self) -> Iterator[Tuple[str, Any]]:
+        """Чтение компании; выдаёт те же пары, что и infrastructure.json_stream.iter_company."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'name'").fetchone()
+        if row is not None:
+            yield "name", row[0]
+
+        for vehicle_id, tag, model, year, capacity, status, extra in self._conn.execute(
+                "SELECT vehicle_id, type, model, year, capacity, status, extra FROM vehicles ORDER BY seq"):
+            data: Dict[str, Any] = {"type": tag, "vehicle_id": vehicle_id, "model": model, "year": year,
+                                    "capacity": capacity, "status": status}
+            data.update(json.loads(extra))
+            yield "vehicles", data
+
+        for driver_id, name, license_type, city, street, house, ref, vehicle in self._conn.execute(
+                "SELECT driver_id, name, license_type, city, street, house, vehicle_id, vehicle "
+                "FROM drivers ORDER BY seq"):
+            item: Dict[str, Any] = {"name": name, "driver_id": driver_id, "license_type": license_type,
+                                    "address": {"city": city, "street": street, "house": house}}
+            if ref is not None:
+                item["assigned_vehicle_id"] = ref
+            else:
+                item["assigned_vehicle"] = json.loads(vehicle) if vehicle is not None else None
+            yield "drivers", item
+
+    def commit(self) -> None:
+        """Фиксация незавершённой транзакции (изменения фиксируются сразу, вызов для явности)."""
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Закрытие соединения."""
+        self._conn.close()
@@ -67,10 +67,10 @@ def demo_search_and_stats(company: TransportCompany) -> None:
     logger.info("=== Поиск и аналитика по парку ===")
     found = company.search_by_model("volvo")
     logger.info(
-        f"Найдено по модели 'volvo': {len(found)} шт. -> {[str(v) for v in found]}"
+        "Найдено по модели 'volvo': %d шт. -> %s", len(found), [str(v) for v in found]
     )
     logger.info(
-        f"Суммарная вместимость по типам: {company.stats_capacity_by_type()}"
+        "Суммарная вместимость по типам: %s", company.stats_capacity_by_type()
     )
 
 
@@ -80,13 +80,13 @@ def demo_cost_calculation(bus, truck, taxi) -> None:
     truck_calc = TruckCostCalculator()
 
     logger.info("=== Шаблонный метод (CostCalculator) ===")
-    logger.info(f"Bus TM calc (25 км): {bus_calc.calculate_cost(bus, 25)} у.е.")
-    logger.info(f"Truck TM calc (200 км): {truck_calc.calculate_cost(truck, 200)} у.е.")
+    logger.info("Bus TM calc (25 км): %s у.е.", bus_calc.calculate_cost(bus, 25))
+    logger.info("Truck TM calc (200 км): %s у.е.", truck_calc.calculate_cost(truck, 200))
 
     logger.info("=== calculate_cost в самих транспортных средствах ===")
-    logger.info(f"Bus.calculate_cost(25): {bus.calculate_cost(25)} у.е.")
-    logger.info(f"Truck.calculate_cost(200): {truck.calculate_cost(200)} у.е.")
-    logger.info(f"Taxi.calculate_cost(12.5): {taxi.calculate_cost(12.5)} у.е.")
+    logger.info("Bus.calculate_cost(25): %s у.е.", bus.calculate_cost(25))
+    logger.info("Truck.calculate_cost(200): %s у.е.", truck.calculate_cost(200))
+    logger.info("Taxi.calculate_cost(12.5): %s у.е.", taxi.calculate_cost(12.5))
 
 
 def demo_tracking_and_reports(taxi: ReportableTaxi) -> None:
@@ -122,8 +122,8 @@ def demo_maintenance_chain(bus, truck, taxi) -> None:
         "Капитальный ремонт двигателя",
     )
 
-    for r in (req_small, req_mid, req_big):
-        logger.info(chain.handle(r))
+    for msg in chain.handle_many((req_small, req_mid, req_big)):
+        logger.info(msg)
 
 
 def demo_serialization(company: TransportCompany) -> None:
@@ -134,8 +134,8 @@ def demo_serialization(company: TransportCompany) -> None:
 
     loaded = TransportCompany.load()
     logger.info(
-        f"Данные загружены из файла: компания='{loaded.name}', "
-        f"количество ТС={len(loaded.get_all_vehicles())}"
+        "Данные загружены из файла: компания='%s', количество ТС=%d",
+        loaded.name, len(loaded.get_all_vehicles()),
     )
 
 
@@ -147,7 +147,7 @@ def demo_exceptions(company: TransportCompany, admin: User, dispatcher: User) ->
     try:
         company.remove_vehicle(user=dispatcher, vehicle_id="B-1")
     except PermissionDeniedError as e:
-        logger.warning(f"Ожидаемая ошибка прав доступа: {e}")
+        logger.warning("Ожидаемая ошибка прав доступа: %s", e)
 
     # DriverNotFoundError: назначение несуществующего водителя.
     try:
@@ -155,7 +155,7 @@ def demo_exceptions(company: TransportCompany, admin: User, dispatcher: User) ->
             user=admin, driver_id="NO_SUCH", vehicle_id="B-1"
         )
     except DriverNotFoundError as e:
-        logger.warning(f"Ожидаемая ошибка поиска водителя: {e}")
+        logger.warning("Ожидаемая ошибка поиска водителя: %s", e)
 
     # InvalidVehicleError: попытка создать ТС с некорректными данными.
     try:
@@ -168,7 +168,7 @@ def demo_exceptions(company: TransportCompany, admin: User, dispatcher: User) ->
             route_number="0",
         )
     except InvalidVehicleError as e:
-        logger.warning(f"Ожидаемая ошибка валидации ТС: {e}")
+        logger.warning("Ожидаемая ошибка валидации ТС: %s", e)
 
 
 def main() -> None:
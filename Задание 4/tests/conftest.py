@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+# Корень проекта в пути импорта: тесты запускаются командой python -m pytest из каталога «Задание 4».
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.address import Address  # noqa: E402
+from domain.driver import Driver  # noqa: E402
+from domain.user import User  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path: "os.PathLike[str]", monkeypatch: pytest.MonkeyPatch) -> "os.PathLike[str]":
+    """Временный рабочий каталог: data/ и относительные пути файлов компании создаются в нём."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True, scope="session")
+def log_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Файл лога во временном каталоге вместо logs/ проекта."""
+    from infrastructure import config
+
+    path = str(tmp_path_factory.mktemp("logs") / "transport_company.log")
+    config.file_handler.baseFilename = path
+    return path
+
+
+@pytest.fixture
+def admin() -> User:
+    """Пользователь с правами администратора."""
+    return User("admin", ["admin"])
+
+
+def make_driver(i: int, license_type: str = "B") -> Driver:
+    """Водитель D-i без закреплённого ТС."""
+    return Driver(f"Водитель {i}", f"D-{i}", license_type, Address("Казань", "Ленина", str(i)))
@@ -0,0 +1,98 @@
+import random
+import sys
+import threading
+
+import pytest
+
+from application.services import ConcurrentTransportCompany, TransportCompany
+from core.exceptions import StatsMismatchError
+from domain import Bus, Truck
+
+from conftest import make_driver
+
+_STATUSES = ("idle", "on_route", "maintenance")
+
+
+@pytest.fixture
+def company(admin) -> ConcurrentTransportCompany:
+    """Компания из автобусов и грузовиков с водителями."""
+    company = ConcurrentTransportCompany("Co")
+    company.add_vehicles(admin, (Bus(f"B-{i}", "LiAZ", 2010, 40 + i, str(i)) if i % 2 else
+                                 Truck(f"B-{i}", "KAMAZ", 2012, 2, 10.0) for i in range(100)))
+    company.add_drivers(admin, (make_driver(i, "C D") for i in range(20)))
+    company.assign_drivers(admin, {f"D-{i}": f"B-{i}" for i in range(20)})
+    return company
+
+
+def test_readers_wait_for_index_update(company: ConcurrentTransportCompany, admin,
+                                       monkeypatch: pytest.MonkeyPatch) -> None:
+    """Читатель не проходит, пока update_vehicle записал поле, но ещё не обновил индексы."""
+    company.find_vehicles()
+    inside, release = threading.Event(), threading.Event()
+    on_vehicle_changed = company._on_vehicle_changed
+
+    def paused(*args: object) -> None:
+        inside.set()
+        release.wait(5)
+        on_vehicle_changed(*args)
+
+    # Пауза между записью поля сеттером и обновлением индексов наблюдателем.
+    monkeypatch.setattr(company, "_on_vehicle_changed", paused)
+    writer = threading.Thread(target=company.update_vehicle, args=(admin, "B-1"), kwargs={"status": "on_route"})
+    writer.start()
+    assert inside.wait(5)
+
+    found = []
+    reader = threading.Thread(target=lambda: found.extend(company.find_vehicles(status="on_route")))
+    reader.start()
+    reader.join(0.2)
+    blocked = reader.is_alive()
+
+    release.set()
+    writer.join(5)
+    reader.join(5)
+    assert blocked
+    assert [v.vehicle_id for v in found] == ["B-1"]
+
+
+def test_readers_see_consistent_snapshots(company: ConcurrentTransportCompany, admin) -> None:
+    """Под нагрузкой двух писателей агрегаты и выборки по статусу совпадают с полями ТС."""
+    ids = [v.vehicle_id for v in company.get_all_vehicles()]
+    done = threading.Event()
+    mismatches = []
+
+    def write(seed: int) -> None:
+        rnd = random.Random(seed)
+        for _ in range(2_000):
+            company.update_vehicle(admin, rnd.choice(ids), capacity=rnd.randrange(1, 200),
+                                   status=rnd.choice(_STATUSES))
+
+    def read() -> None:
+        i = 0
+        while not done.is_set():
+            status = _STATUSES[i % 3]
+            i += 1
+            try:
+                company.stats_capacity_by_type(verify=True)
+            except StatsMismatchError as e:
+                mismatches.append(e)
+            with company._lock.read():
+                if any(v.status != status for v in TransportCompany.find_vehicles(company, status=status)):
+                    mismatches.append(status)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writers = [threading.Thread(target=write, args=(seed,)) for seed in range(2)]
+        reader = threading.Thread(target=read)
+        for t in writers + [reader]:
+            t.start()
+        for t in writers:
+            t.join()
+        done.set()
+        reader.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert mismatches == []
+    company.stats_by_type(verify=True)
@@ -0,0 +1,85 @@
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from application.services import DispatchOptimizer, TransportCompany
+from domain import Bus, Taxi, Truck
+from domain.driver import Driver
+from domain.vehicle import Vehicle
+
+from conftest import make_driver
+
+_LICENSES = ("B", "C", "D", "B C", "C D", "CE", "B, D", "B C D", "B (стаж 3 года)")
+
+
+def _brute_force(drivers: List[Driver], vehicles: List[Vehicle], costs: Dict[str, float]) -> Tuple[int, float]:
+    """Лучший план перебором: наибольшее число назначений, затем наименьшая стоимость."""
+    best = (0, 0.0)
+
+    def visit(i: int, used: frozenset, count: int, cost: float) -> None:
+        nonlocal best
+        if i == len(drivers):
+            if count > best[0] or (count == best[0] and cost < best[1]):
+                best = (count, cost)
+            return
+        visit(i + 1, used, count, cost)
+        for v in vehicles:
+            if v.vehicle_id not in used and drivers[i].can_drive(v):
+                visit(i + 1, used | {v.vehicle_id}, count + 1, cost + costs[v.vehicle_id])
+
+    visit(0, frozenset(), 0, 0.0)
+    return best
+
+
+def _random_company(admin, seed: int) -> Tuple[TransportCompany, Dict[str, float]]:
+    """Компания из 5 водителей со случайными правами и 6 ТС со случайными стоимостями."""
+    rnd = random.Random(seed)
+    company = TransportCompany("Co")
+    makers = (lambda i: Bus(f"V-{i}", "LiAZ", 2010, 40, "1"), lambda i: Truck(f"V-{i}", "KAMAZ", 2012, 2, 10.0),
+              lambda i: Taxi(f"V-{i}", "Octavia", 2020, 4, f"A{i}"))
+    company.add_vehicles(admin, [rnd.choice(makers)(i) for i in range(6)])
+    company.add_drivers(admin, [make_driver(i, rnd.choice(_LICENSES)) for i in range(5)])
+    costs = {v.vehicle_id: round(rnd.uniform(10, 500), 2) for v in company.get_all_vehicles()}
+    return company, costs
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_plan_is_optimal(admin, seed: int) -> None:
+    """План допустим и совпадает с перебором по числу назначений и стоимости."""
+    company, costs = _random_company(admin, seed)
+    plan = DispatchOptimizer(company).plan(100.0, costs=costs)
+
+    picked = [v for v in plan.assignments.values() if v is not None]
+    assert len(picked) == len(set(picked))
+    for driver_id, vehicle_id in plan.assignments.items():
+        if vehicle_id is not None:
+            assert company.get_driver(driver_id).can_drive(company._vehicles[vehicle_id])
+
+    count, cost = _brute_force(company.get_all_drivers(), company.get_all_vehicles(), costs)
+    assert plan.assigned == count
+    assert plan.total_cost == pytest.approx(round(cost, 2))
+
+
+def test_applied_plan_is_stable(admin) -> None:
+    """После применения плана повторный план ничего не меняет; неизвестные права не дают ТС."""
+    company, costs = _random_company(admin, 7)
+    company.add_driver(admin, make_driver(9, "B (стаж 3 года)"))
+    optimizer = DispatchOptimizer(company)
+    optimizer.apply(admin, optimizer.plan(100.0, costs=costs))
+
+    again = optimizer.plan(100.0, costs=costs)
+    assert again.changes == {}
+    assert again.assignments["D-9"] is None
+    assert company.get_driver("D-9").get_assigned_vehicle() is None
+
+
+def test_plan_uses_fleet_costs(admin) -> None:
+    """Без готовых стоимостей план берёт их из calculate_costs и выбирает более дешёвое ТС."""
+    company = TransportCompany("Co")
+    company.add_vehicles(admin, [Bus("B-1", "LiAZ", 2010, 120, "1"), Bus("B-2", "PAZ", 2015, 20, "2")])
+    company.add_driver(admin, make_driver(1, "D"))
+    plan = DispatchOptimizer(company).plan(50.0)
+    expected: Dict[str, Optional[str]] = {"D-1": "B-2"}
+    assert plan.assignments == expected
+    assert plan.total_cost == company._vehicles["B-2"].calculate_cost(50.0)
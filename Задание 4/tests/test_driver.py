@@ -0,0 +1,33 @@
+import pytest
+
+from domain import Bus, Taxi, Truck
+
+from conftest import make_driver
+
+
+@pytest.mark.parametrize("license_type, expected", [
+    ("B", {"B"}),
+    ("b, c", {"B", "C"}),
+    ("C+E", {"C", "E"}),
+    ("B C D", {"B", "C", "D"}),
+    ("CE", {"CE", "C"}),
+    ("C1E, D1", {"C1E", "C1", "D1"}),
+    ("В, С", {"B", "C"}),
+    ("Д", {"D"}),
+    ("", set()),
+    ("B (стаж 3 года)", set()),
+    ("BCD", set()),
+    ("категория B", set()),
+    ("B; C", set()),
+])
+def test_license_categories(license_type: str, expected: set) -> None:
+    """Категории берутся только из целых обозначений; посторонний текст не даёт ни одной категории."""
+    assert make_driver(1, license_type).license_categories == frozenset(expected)
+
+
+def test_can_drive_uses_whole_categories() -> None:
+    """Водитель с правами B и пояснением не допускается ни к одному ТС."""
+    fleet = (Bus("B-1", "LiAZ", 2010, 90, "12"), Truck("T-1", "KAMAZ", 2012, 3, 10.0),
+             Taxi("X-1", "Octavia", 2020, 4, "A1"))
+    assert [make_driver(1, "CE").can_drive(v) for v in fleet] == [False, True, False]
+    assert [make_driver(2, "B (стаж 3 года)").can_drive(v) for v in fleet] == [False] * 3
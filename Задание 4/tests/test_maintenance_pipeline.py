@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from application.patterns import DepartmentHead, Director, MaintenanceRequest, Mechanic
+from application.services.maintenance_pipeline import FakeApprover, MaintenancePipeline, run_pipeline
+from domain import Bus
+
+
+def _chain() -> Mechanic:
+    """Цепочка Mechanic → DepartmentHead → Director."""
+    chain = Mechanic()
+    chain.set_next(DepartmentHead()).set_next(Director())
+    return chain
+
+
+def _request(cost: float, description: str) -> MaintenanceRequest:
+    """Заявка на обслуживание автобуса."""
+    return MaintenanceRequest(Bus("B-1", "LiAZ-5292", 2015, 90, "12"), cost, description)
+
+
+def test_results_match_chain() -> None:
+    """Решения конвейера совпадают с решениями цепочки и идут в порядке заявок."""
+    requests = [_request(cost, f"Заявка {i}") for i, cost in enumerate((100, 1500, 9000, 300, 2000))]
+    results, metrics = run_pipeline(_chain(), requests, FakeApprover(), queue_size=2)
+    assert results == [_chain().handle(r) for r in requests]
+    assert metrics.completed == len(requests)
+
+
+def test_stalled_level_does_not_delay_others() -> None:
+    """Заполненная очередь уровня Director не задерживает согласование заявок механика."""
+    approver = FakeApprover({"Director": 60.0})
+
+    async def main() -> float:
+        pipeline = MaintenancePipeline(_chain(), approver, queue_size=1, concurrency={"Director": 1})
+        pipeline.start()
+        # Одна заявка директора согласуется, вторая ждёт в очереди, третья ждёт места в очереди.
+        stalled = asyncio.ensure_future(asyncio.gather(*(pipeline.submit(_request(9000, f"Д{i}"))
+                                                         for i in range(3))))
+        await asyncio.sleep(0.01)
+        assert not stalled.done()
+
+        start = time.perf_counter()
+        futures = [await pipeline.submit(_request(100, f"М{i}")) for i in range(20)]
+        await asyncio.wait_for(asyncio.gather(*futures), timeout=5)
+        elapsed = time.perf_counter() - start
+
+        stalled.cancel()
+        await pipeline.close(cancel=True)
+        return elapsed
+
+    assert asyncio.run(main()) < 1.0
+    assert [level for level, _ in approver.calls] == ["Mechanic"] * 20
+
+
+def test_cancelled_request_is_not_approved() -> None:
+    """Отменённая до согласования заявка не доходит до службы согласования."""
+    approver = FakeApprover({"Director": 0.05})
+
+    async def main() -> None:
+        async with MaintenancePipeline(_chain(), approver, concurrency={"Director": 1}) as pipeline:
+            first = await pipeline.submit(_request(9000, "первая"))
+            second = await pipeline.submit(_request(9000, "вторая"))
+            second.cancel()
+            await first
+        assert pipeline.metrics.cancelled == 1
+
+    asyncio.run(main())
+    assert approver.calls == [("Director", "первая")]
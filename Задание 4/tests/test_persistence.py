@@ -0,0 +1,160 @@
+import os
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from application.services import TransportCompany
+from domain import Bus, ReportableTaxi, Taxi, TrackableBus, Truck
+from infrastructure.journal import journal_path, read_journal
+
+from conftest import make_driver
+
+
+def _company(admin) -> TransportCompany:
+    """Компания с ТС всех типов, водителями с ТС парка и без ТС."""
+    company = TransportCompany("Парк «Юг»")
+    company.add_vehicles(admin, [Bus("B-1", "LiAZ", 2010, 90, "12"), TrackableBus("B-2", "PAZ", 2015, 40, "7"),
+                                 Truck("T-1", "KAMAZ", 2012, 3, 10.5), Taxi("X-1", "Octavia", 2020, 4, "A1"),
+                                 ReportableTaxi("X-2", "Solaris", 2018, 4, "A2", status="on_route")])
+    company.add_drivers(admin, [make_driver(i, lic) for i, lic in enumerate(("D", "B C", "CE", "B"))])
+    company.assign_driver_to_vehicle(admin, "D-0", "B-1")
+    company.assign_driver_to_vehicle(admin, "D-1", "X-1")
+    company.assign_driver_to_vehicle(admin, "D-2", "T-1")
+    return company
+
+
+def _state(company: TransportCompany) -> Tuple[str, List[Dict[str, Any]], List[Tuple[Dict[str, Any], bool]]]:
+    """Имя, ТС и водители в порядке добавления; у водителя — признак, что его ТС — объект парка."""
+    return (company.name, [v.to_dict() for v in company.get_all_vehicles()],
+            [(d.to_dict(), d.get_assigned_vehicle() is None or company._owns_assigned_vehicle(d))
+             for d in company.get_all_drivers()])
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["indexed", "gzip"])
+def test_snapshot_round_trip(admin, tmp_path, compress: bool) -> None:
+    """Бинарный снимок восстанавливается load, load_parallel и open_snapshot без изменений."""
+    company = _company(admin)
+    path = str(tmp_path / "company.snap")
+    company.save(path, compress=compress)
+
+    assert _state(TransportCompany.load(path)) == _state(company)
+    assert _state(TransportCompany.load(path, trusted=True)) == _state(company)
+    assert _state(TransportCompany.load_parallel(path, workers=1)) == _state(company)
+    if not compress:
+        assert _state(TransportCompany.open_snapshot(path)) == _state(company)
+
+
+def test_snapshot_matches_json(admin, tmp_path) -> None:
+    """Снимок и JSON-файл одной компании загружаются в одинаковое состояние."""
+    company = _company(admin)
+    company.save(str(tmp_path / "company.snap"))
+    company.save(str(tmp_path / "company.json"))
+    assert (_state(TransportCompany.load(str(tmp_path / "company.snap")))
+            == _state(TransportCompany.load(str(tmp_path / "company.json"))))
+
+
+def test_sqlite_write_through(admin, tmp_path) -> None:
+    """Изменения подключённой компании сразу видны при загрузке базы, без save."""
+    company = _company(admin)
+    path = str(tmp_path / "company.db")
+    company.attach_backend(path)
+    assert _state(TransportCompany.load(path)) == _state(company)
+
+    company.name = "Парк «Север»"
+    company.add_vehicle(admin, Truck("T-2", "MAN", 2019, 2, 20.0))
+    company.update_vehicle(admin, "X-1", status="maintenance", year=2021)
+    company.get_all_vehicles()[0].status = "on_route"
+    company.add_driver(admin, make_driver(9, "C"))
+    company.assign_driver_to_vehicle(admin, "D-9", "T-2")
+    company.remove_vehicle(admin, "B-1")
+    company.remove_driver(admin, "D-3")
+    assert _state(TransportCompany.load(path)) == _state(company)
+
+    # Компания, загруженная из базы, продолжает записывать изменения в неё.
+    reopened = TransportCompany.load(path)
+    reopened.add_vehicles(admin, [Bus("B-9", "MAZ", 2022, 100, "3")])
+    reopened.assign_driver_to_vehicle(admin, "D-1", "B-9")
+    assert _state(TransportCompany.load(path)) == _state(reopened)
+
+
+def _fleet(admin, n: int = 60) -> TransportCompany:
+    """Компания из n автобусов и n водителей, закреплённых за ними (журнал вмещает ~n/2 операций)."""
+    company = TransportCompany("Парк")
+    company.add_vehicles(admin, (Bus(f"B-{i}", "LiAZ", 2000 + i % 20, 40 + i, str(i)) for i in range(n)))
+    company.add_drivers(admin, (make_driver(i, "D") for i in range(n)))
+    company.assign_drivers(admin, {f"D-{i}": f"B-{i}" for i in range(n)})
+    return company
+
+
+def _change(company: TransportCompany, admin, step: int) -> None:
+    """Набор изменений: поля ТС, удаление и повторное добавление, водители и имя компании."""
+    company.update_vehicle(admin, f"B-{step}", status="maintenance", year=2024)
+    company.remove_vehicle(admin, f"B-{step + 10}")
+    company.add_vehicle(admin, Truck(f"B-{step + 10}", "KAMAZ", 2019, 2, 15.0))
+    company.remove_driver(admin, f"D-{step + 20}")
+    company.add_driver(admin, make_driver(100 + step, "CE"))
+    company.assign_driver_to_vehicle(admin, f"D-{100 + step}", f"B-{step + 10}")
+    company.name = f"Парк {step}"
+
+
+@pytest.mark.parametrize("name", ["company.json", "company.snap"])
+def test_journal_replay(admin, tmp_path, name: str) -> None:
+    """Изменения, дописанные в журнал, применяются при загрузке; основной файл не переписывается."""
+    company = _fleet(admin)
+    path = str(tmp_path / name)
+    company.save(path, delta=True)
+    base = os.stat(path)
+
+    for step in range(3):
+        _change(company, admin, step)
+        company.save(path, delta=True)
+        assert os.stat(path).st_mtime_ns == base.st_mtime_ns
+        assert _state(TransportCompany.load(path)) == _state(company)
+    assert read_journal(path).records > 0
+
+    assert _state(TransportCompany.load_parallel(path, workers=1)) == _state(company)
+    if name.endswith(".snap"):
+        assert _state(TransportCompany.open_snapshot(path)) == _state(company)
+
+
+def test_journal_skips_torn_batch(admin, tmp_path) -> None:
+    """Пакет журнала без отметки commit (прерванная запись) при загрузке пропускается."""
+    company = _fleet(admin)
+    path = str(tmp_path / "company.json")
+    company.save(path, delta=True)
+    _change(company, admin, 0)
+    company.save(path, delta=True)
+    saved = _state(company)
+
+    with open(journal_path(path), "a", encoding="utf-8") as f:
+        f.write('["-vehicles","B-1"]\n["name","Обрыв"]\n["drivers",{"driver_id"')
+    assert _state(TransportCompany.load(path)) == saved
+
+
+def test_journal_of_other_file_version_is_ignored(admin, tmp_path) -> None:
+    """Журнал, записанный для другой версии основного файла, не применяется."""
+    company = _fleet(admin)
+    path = str(tmp_path / "company.json")
+    company.save(path, delta=True)
+    base = _state(TransportCompany.load(path))
+    _change(company, admin, 0)
+    company.save(path, delta=True)
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _state(TransportCompany.load(path)) == base
+
+
+def test_journal_compacts_into_full_file(admin, tmp_path) -> None:
+    """Выросший журнал сворачивается: файл переписывается целиком, журнал начинается заново."""
+    company = _fleet(admin)
+    path = str(tmp_path / "company.json")
+    company.save(path, delta=True)
+    for i in range(len(company.get_all_vehicles())):
+        company.update_vehicle(admin, f"B-{i}", capacity=200 + i)
+    company.save(path, delta=True)
+
+    with open(journal_path(path), encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+    assert read_journal(path).records == 0
+    assert _state(TransportCompany.load(path)) == _state(company)
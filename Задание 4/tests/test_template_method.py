@@ -0,0 +1,71 @@
+import pytest
+
+from application.patterns import BusCostCalculator, CostCalculator, TruckCostCalculator
+from domain import Bus, Taxi, Truck
+from domain.vehicle import Vehicle
+
+_DISTANCES = [0.0, 0.5, 12.3, 250.0, 1234.56]
+
+
+class _NightBusCalculator(BusCostCalculator):
+    """Автобус с ночной надбавкой, зависящей от расстояния (ставка унаследована)."""
+
+    def get_extra_cost(self, vehicle: Vehicle, distance_km: float) -> float:
+        """Надбавка за километр поверх обычных доп. расходов."""
+        return super().get_extra_cost(vehicle, distance_km) + 0.3 * distance_km
+
+
+class _MinimumFareCalculator(TruckCostCalculator):
+    """Грузовик с минимальной стоимостью рейса."""
+
+    def get_base_cost(self, vehicle: Vehicle, distance_km: float) -> float:
+        """Базовая стоимость не ниже 100."""
+        return max(100.0, super().get_base_cost(vehicle, distance_km))
+
+
+class _RoundedCalculator(BusCostCalculator):
+    """Автобус со стоимостью, округлённой до целых."""
+
+    def calculate_cost(self, vehicle: Vehicle, distance_km: float) -> float:
+        """Стоимость с округлением до целых."""
+        return float(round(super().calculate_cost(vehicle, distance_km)))
+
+
+class _ExpressCalculator(BusCostCalculator):
+    """Автобус с другой ставкой и без переопределённых методов."""
+
+    rate_per_km = 2.5
+
+
+class _FlatCalculator(CostCalculator):
+    """Калькулятор без ставки: только поштучный расчёт."""
+
+    def get_base_cost(self, vehicle: Vehicle, distance_km: float) -> float:
+        """Фиксированная стоимость плюс квадрат расстояния."""
+        return 10.0 + distance_km ** 2 / 100
+
+
+@pytest.fixture
+def vehicles() -> list:
+    """ТС разных типов."""
+    return [Bus("B-1", "LiAZ-5292", 2015, 90, "12"), Truck("T-1", "KAMAZ", 2018, 3, 12.5),
+            Taxi("X-1", "Octavia", 2020, 4, "A123BC")]
+
+
+@pytest.mark.parametrize("calculator", [BusCostCalculator(), TruckCostCalculator(), _NightBusCalculator(),
+                                        _MinimumFareCalculator(), _RoundedCalculator(), _ExpressCalculator(),
+                                        _FlatCalculator()], ids=lambda c: type(c).__name__)
+def test_calculate_costs_matches_calculate_cost(calculator: CostCalculator, vehicles: list) -> None:
+    """Пакетный расчёт совпадает с поштучным для каждого ТС и расстояния."""
+    expected = [[calculator.calculate_cost(v, d) for d in _DISTANCES] for v in vehicles]
+    assert calculator.calculate_costs(vehicles, _DISTANCES) == expected
+
+
+def test_linear_rate_only_for_declaring_class() -> None:
+    """Ставка используется классом, объявившим её, и наследниками без переопределений."""
+    assert BusCostCalculator()._linear_rate() == 1.0
+    assert _ExpressCalculator()._linear_rate() == 2.5
+    assert _NightBusCalculator()._linear_rate() is None
+    assert _MinimumFareCalculator()._linear_rate() is None
+    assert _RoundedCalculator()._linear_rate() is None
+    assert _FlatCalculator()._linear_rate() is None
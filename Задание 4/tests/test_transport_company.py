@@ -0,0 +1,98 @@
+import sqlite3
+
+import pytest
+
+from application.services import TransportCompany
+from application.services.vehicle_store import ColumnarVehicleStore
+from core.exceptions import DriverNotFoundError, InvalidVehicleError
+from domain import Bus
+
+from conftest import make_driver
+
+
+@pytest.fixture(params=["dict", "columnar"])
+def company(request: pytest.FixtureRequest) -> TransportCompany:
+    """Компания с обычным словарём ТС или колоночным хранилищем."""
+    return TransportCompany("Co", ColumnarVehicleStore() if request.param == "columnar" else None)
+
+
+def test_removed_vehicle_drops_driver_lookup(company: TransportCompany, admin) -> None:
+    """После удаления ТС его водитель не находится ни по старому ТС, ни по новому с тем же id."""
+    company.add_vehicle(admin, Bus("B-1", "LiAZ", 2010, 90, "12"))
+    company.add_driver(admin, make_driver(1, "D"))
+    company.assign_driver_to_vehicle(admin, "D-1", "B-1")
+    assert company.driver_for_vehicle("B-1").driver_id == "D-1"
+
+    company.remove_vehicle(admin, "B-1")
+    assert company.driver_for_vehicle("B-1") is None
+
+    company.add_vehicle(admin, Bus("B-1", "PAZ", 2015, 40, "7"))
+    assert company.driver_for_vehicle("B-1") is None
+    assert "D-1" not in company._vehicle_of_driver
+
+
+def _snapshot(company: TransportCompany) -> tuple:
+    """Состояние компании: ТС, водители, индексы и агрегаты."""
+    return ([v.to_dict() for v in company.get_all_vehicles()], [d.to_dict() for d in company.get_all_drivers()],
+            [v.vehicle_id for v in company.find_vehicles("bus")], company.stats_capacity_by_type(verify=True),
+            company.driver_for_vehicle("B-1"))
+
+
+@pytest.fixture
+def fleet(company: TransportCompany, admin) -> TransportCompany:
+    """Компания с одним автобусом и его водителем; индексы уже построены."""
+    company.add_vehicle(admin, Bus("B-1", "LiAZ", 2010, 90, "12"))
+    company.add_driver(admin, make_driver(1, "D"))
+    company.assign_driver_to_vehicle(admin, "D-1", "B-1")
+    company.find_vehicles("bus")
+    return company
+
+
+@pytest.mark.parametrize("batch", [
+    [Bus("B-2", "PAZ", 2015, 40, "7"), Bus("B-2", "MAZ", 2016, 50, "8")],
+    [Bus("B-2", "PAZ", 2015, 40, "7"), Bus("B-1", "MAZ", 2016, 50, "8")],
+], ids=["duplicate-in-batch", "duplicate-in-fleet"])
+def test_add_vehicles_all_or_nothing(fleet: TransportCompany, admin, batch: list) -> None:
+    """При повторном id в пакете не добавляется ни одно ТС."""
+    before = _snapshot(fleet)
+    with pytest.raises(InvalidVehicleError):
+        fleet.add_vehicles(admin, iter(batch))
+    assert _snapshot(fleet) == before
+
+
+def test_add_vehicles_rejects_unstorable_batch(admin) -> None:
+    """Поле, не помещающееся в колонку, отклоняет весь пакет до вставки."""
+    company = TransportCompany("Co", ColumnarVehicleStore())
+    company.add_vehicle(admin, Bus("B-1", "LiAZ", 2010, 90, "12"))
+    before = _snapshot(company)
+    with pytest.raises(InvalidVehicleError):
+        company.add_vehicles(admin, [Bus("B-2", "PAZ", 2015, 40, "7"), Bus("B-3", "MAZ", 2016, 2 ** 70, "8")])
+    assert _snapshot(company) == before
+    assert len(company._vehicles) == 1
+
+
+def test_add_vehicles_rolls_back_failed_backend_write(fleet: TransportCompany, admin, tmp_path,
+                                                      monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ошибка записи пакета в подключённую базу откатывает вставку в память."""
+    path = str(tmp_path / "company.db")
+    fleet.attach_backend(path)
+    before = _snapshot(fleet)
+
+    def fail(items: object) -> None:
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(fleet._backend, "put_vehicles", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        fleet.add_vehicles(admin, [Bus("B-2", "PAZ", 2015, 40, "7"), Bus("B-3", "MAZ", 2016, 50, "8")])
+    assert _snapshot(fleet) == before
+    assert [v.vehicle_id for v in TransportCompany.load(path).get_all_vehicles()] == ["B-1"]
+
+
+def test_add_drivers_all_or_nothing(fleet: TransportCompany, admin) -> None:
+    """При повторном id водителя не добавляется ни один водитель пакета."""
+    before = _snapshot(fleet)
+    with pytest.raises(InvalidVehicleError):
+        fleet.add_drivers(admin, [make_driver(2), make_driver(3), make_driver(1)])
+    assert _snapshot(fleet) == before
+    with pytest.raises(DriverNotFoundError):
+        fleet.get_driver("D-2")
@@ -0,0 +1,44 @@
+from application.services import TransportCompany
+from application.services.vehicle_index import VehicleIndex
+from application.services.vehicle_store import ColumnarVehicleStore
+from domain import Bus, ReportableTaxi, Taxi, TrackableBus, Truck
+
+
+def _fleet() -> list:
+    """ТС всех типов, включая подклассы Bus и Taxi."""
+    return [Bus("B-1", "LiAZ", 2010, 90, "12"), TrackableBus("B-2", "PAZ", 2015, 40, "7"),
+            Truck("T-1", "KAMAZ", 2012, 3, 10.0), Taxi("X-1", "Octavia", 2020, 4, "A1"),
+            ReportableTaxi("X-2", "Solaris", 2018, 4, "A2")]
+
+
+def test_find_by_base_type_includes_subclasses() -> None:
+    """Поиск по "bus" находит и TrackableBus, по "trackablebus" — только его."""
+    index = VehicleIndex()
+    for v in _fleet():
+        index.add(v)
+    assert index.find("bus") == ["B-1", "B-2"]
+    assert index.find("TrackableBus") == ["B-2"]
+    assert index.find("taxi") == ["X-1", "X-2"]
+    assert index.find("reportabletaxi", year_range=(2018, 2018)) == ["X-2"]
+    assert index.find("vehicle") == []
+
+
+def test_remove_clears_all_type_keys() -> None:
+    """Удалённое ТС пропадает из выборок по всем своим типам."""
+    index = VehicleIndex()
+    for v in _fleet():
+        index.add(v)
+    index.remove("B-2")
+    assert index.find("bus") == ["B-1"]
+    assert index.find("trackablebus") == []
+    assert "trackablebus" not in index._by_type
+
+
+def test_company_find_vehicles_with_columnar_store(admin) -> None:
+    """Представления колоночного хранилища индексируются под типами исходного класса."""
+    company = TransportCompany("Co", ColumnarVehicleStore())
+    company.add_vehicles(admin, _fleet())
+    company.update_vehicle(admin, "B-2", status="on_route")
+    assert [v.vehicle_id for v in company.find_vehicles("bus")] == ["B-1", "B-2"]
+    assert [v.vehicle_id for v in company.find_vehicles("bus", "on_route")] == ["B-2"]
+    assert all(isinstance(v, Bus) for v in company.find_vehicles("bus"))
@@ -0,0 +1,55 @@
+import pytest
+
+from application.services import TransportCompany
+from application.services.vehicle_store import ColumnarVehicleStore
+from core.exceptions import InvalidVehicleError
+from domain import Bus, Taxi, Truck
+
+from conftest import make_driver
+
+
+def test_round_trip_fields() -> None:
+    """Поля ТС всех типов читаются из колонок без изменений."""
+    store = ColumnarVehicleStore()
+    vehicles = [Bus("B-1", "LiAZ", 2010, 90, "12"), Truck("T-1", "KAMAZ", 2012, 3, 10.5),
+                Taxi("X-1", "Octavia", 2020, 4, "A1", status="on_route")]
+    for v in vehicles:
+        store[v.vehicle_id] = v
+    assert [store[v.vehicle_id].to_dict() for v in vehicles] == [v.to_dict() for v in vehicles]
+    assert type(store["B-1"]).__name__ == "Bus" and isinstance(store["B-1"], Bus)
+
+
+def test_stale_view_does_not_read_reused_row() -> None:
+    """Представление удалённого ТС не читает и не пишет строку, занятую новым ТС."""
+    store = ColumnarVehicleStore()
+    store["B-1"] = Bus("B-1", "LiAZ", 2010, 90, "12")
+    stale = store["B-1"]
+    del store["B-1"]
+    store["B-2"] = Bus("B-2", "PAZ", 2015, 40, "7")
+    assert store["B-2"]._row == stale._row
+
+    with pytest.raises(InvalidVehicleError):
+        stale.model
+    with pytest.raises(InvalidVehicleError):
+        stale.capacity = 10
+    assert not store.owns(stale)
+    assert store["B-2"].capacity == 40 and store.owns(store["B-2"])
+
+
+def test_removed_vehicle_is_detached_from_driver(admin, tmp_path) -> None:
+    """Водитель удалённого ТС хранит его копию; сохранение не подменяет её ТС из той же строки."""
+    company = TransportCompany("Co", ColumnarVehicleStore())
+    company.add_vehicle(admin, Bus("B-1", "LiAZ", 2010, 90, "12"))
+    company.add_driver(admin, make_driver(1, "D"))
+    company.assign_driver_to_vehicle(admin, "D-1", "B-1")
+
+    company.remove_vehicle(admin, "B-1")
+    company.add_vehicle(admin, Bus("B-2", "PAZ", 2015, 40, "7"))
+    assigned = company.get_driver("D-1").get_assigned_vehicle()
+    assert (assigned.vehicle_id, assigned.model) == ("B-1", "LiAZ")
+    assert not company._vehicles.owns(assigned)
+
+    path = str(tmp_path / "company.json")
+    company.save(path)
+    loaded = TransportCompany.load(path).get_driver("D-1").get_assigned_vehicle()
+    assert (loaded.vehicle_id, loaded.model) == ("B-1", "LiAZ")
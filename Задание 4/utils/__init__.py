@@ -1,5 +1,11 @@
 """Утилиты для транспортной компании."""
-from utils.decorators import check_permissions
+from utils.lazy import lazy_exports
 
-__all__ = ["check_permissions"]
+# Экспортируемое имя -> модуль (загружается при первом обращении к имени).
+_EXPORTS = {
+    "check_permissions": "utils.decorators",
+}
 
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
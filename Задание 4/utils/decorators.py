@@ -1,33 +1,46 @@
-from typing import List, Any
+import functools
+from typing import Any, Callable, List, Optional
 
 from core.exceptions import PermissionDeniedError
+from core.roles import RoleRegistry
+from domain.user import User
+
+# Класс компании определяется при первой проверке: прямой импорт создал бы циклическую зависимость.
+_company_class: Optional[type] = None
+
+
+def _company_type() -> type:
+    """Возврат класса TransportCompany (импорт выполняется один раз)."""
+    global _company_class
+    if _company_class is None:
+        from application.services.transport_company import TransportCompany
+        _company_class = TransportCompany
+    return _company_class
 
 
 def check_permissions(required_roles: List[str]):
     """Декоратор, проверяющий, что у пользователя есть хотя бы одна требуемая роль."""
-    req = set(required_roles)
+    req = sorted(set(required_roles))
+    # Роли сводятся к битовой маске один раз, при декорировании; проверка — одно побитовое И.
+    required = RoleRegistry.mask(req)
 
-    def decorator(func):
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Импорты внутри функции для избежания циклических зависимостей.
-            from domain.user import User
-            from application.services.transport_company import TransportCompany
-
-            user = kwargs.get("user")
+            user = kwargs.get("user") if kwargs else None
             if user is None:
-                if len(args) > 1 and isinstance(args[0], TransportCompany) and isinstance(args[1], User):
+                if len(args) > 1 and isinstance(args[0], _company_class or _company_type()) \
+                        and isinstance(args[1], User):
                     user = args[1]
 
             if user is None or not isinstance(user, User):
                 raise PermissionDeniedError("Отсутствует пользователь для проверки прав.")
 
-            if not (set(user.roles) & req):
-                raise PermissionDeniedError(f"Недостаточно прав. Требуются роли из: {sorted(req)}")
+            if not user._role_mask & required:
+                raise PermissionDeniedError(f"Недостаточно прав. Требуются роли из: {req}")
 
             return func(*args, **kwargs)
 
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
         return wrapper
 
     return decorator
@@ -0,0 +1,27 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(name: str, exports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Функции __getattr__ и __dir__ пакета name для ленивых экспортов (PEP 562).
+
+    exports — экспортируемое имя -> модуль. Модуль импортируется при первом обращении к имени,
+    поэтому импорт пакета не загружает все подмодули; загруженное значение кешируется в пакете.
+    """
+    namespace = vars(sys.modules[name])
+
+    def __getattr__(attr: str) -> Any:
+        """Ленивая загрузка экспортируемого имени."""
+        module = exports.get(attr)
+        if module is None:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+        value = getattr(import_module(module), attr)
+        namespace[attr] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """Список атрибутов пакета, включая ещё не загруженные."""
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,60 @@
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@lru_cache(maxsize=None)
+def numpy() -> Optional[ModuleType]:
+    """Модуль NumPy или None, если он не установлен; импорт откладывается до первого расчёта."""
+    try:
+        import numpy as np
+    except ImportError:  # NumPy необязателен: без него используется чистый Python.
+        return None
+    return np
+
+# Начиная с этого порога шаг сетки float64 сопоставим с сотыми, и округление numpy ненадёжно.
+_ROUND_EXACT_LIMIT = 2.0 ** 50
+
+
+def _round2(np: ModuleType, raw: Any) -> Any:
+    """Округление матрицы до сотых с точной семантикой встроенного round(x, 2)."""
+    scaled = raw * 100.0
+    rounded = np.rint(scaled) / 100.0
+    # np.rint и round расходятся только вблизи середины между сотыми — такие элементы
+    # (и слишком большие значения) пересчитываются встроенным round.
+    with np.errstate(invalid="ignore"):
+        suspicious = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        suspicious |= ~(np.abs(scaled) < _ROUND_EXACT_LIMIT)
+    for idx in zip(*np.nonzero(suspicious)):
+        rounded[idx] = round(float(raw[idx]), 2)
+    return rounded
+
+
+def linear_costs(terms: Sequence[Tuple[float, float]], distances: Sequence[float]) -> List[List[float]]:
+    """Матрица стоимостей round(per_km * d + fixed, 2) для каждой пары (per_km, fixed) и расстояния d.
+
+    Строки с одинаковой ставкой за километр группируются: произведение ставки на расстояния
+    считается один раз на группу, фиксированная часть добавляется трансляцией (broadcasting).
+    """
+    groups: Dict[float, List[int]] = {}
+    for i, (per_km, _) in enumerate(terms):
+        groups.setdefault(per_km, []).append(i)
+
+    result: List[List[float]] = [[] for _ in terms]
+
+    np = numpy()
+    if np is not None:
+        dist = np.asarray(distances, dtype=np.float64)
+        for per_km, rows in groups.items():
+            fixed = np.fromiter((terms[i][1] for i in rows), dtype=np.float64, count=len(rows))
+            matrix = _round2(np, per_km * dist[np.newaxis, :] + fixed[:, np.newaxis]).tolist()
+            for i, row in zip(rows, matrix):
+                result[i] = row
+        return result
+
+    for per_km, rows in groups.items():
+        base = [per_km * d for d in distances]
+        for i in rows:
+            fixed = terms[i][1]
+            result[i] = [round(b + fixed, 2) for b in base]
+    return result